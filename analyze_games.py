@@ -0,0 +1,49 @@
+import argparse
+import json
+
+from modules.GameAnalysis import get_opening_stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    set_parser(parser)
+    args = parser.parse_args()
+    size = parse_size(args.size) if args.size else None
+    stats = get_opening_stats(args.records, args.plies, size)
+    top = sorted(stats.items(), key=lambda item: (-item[1].games, item[0]))
+    top = top[:args.top]
+    if args.json:
+        print(json.dumps([dict(opening=[list(point) for point in opening],
+                               **opening_stats._asdict())
+                          for opening, opening_stats in top], indent=2))
+        return
+    print('Партий: {}, различных дебютов: {}'.format(
+        sum(opening_stats.games for opening_stats in stats.values()),
+        len(stats)))
+    for opening, opening_stats in top:
+        print('{}: {} партий, черные +{} ={} -{}'.format(
+            ' '.join('{},{}'.format(*point) for point in opening),
+            opening_stats.games, opening_stats.black_wins,
+            opening_stats.draws, opening_stats.white_wins))
+
+
+def set_parser(parser):
+    parser.add_argument('records', nargs='+',
+                        help='files with records of games')
+    parser.add_argument('-p', '--plies', type=int, default=4,
+                        help='length of the openings in plies')
+    parser.add_argument('-s', '--size', type=str,
+                        help='analyze only the games of this size')
+    parser.add_argument('--top', type=int, default=10,
+                        help='number of the most frequent openings to print')
+    parser.add_argument('--json', action='store_true',
+                        help='print the statistics as JSON')
+
+
+def parse_size(size):
+    width, height = size.split('x')
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import sys
+import time
+import random
+sys.path.append('..')
+sys.path.append('.')
+import numpy as np
+from modules.AlphaBetaAI import play_move
+from modules.BatchBoard import BatchBoard
+from modules.GameModel import GameModel
+
+
+def measure_batch(count, width, height):
+    rng = np.random.default_rng(0)
+    batch = BatchBoard(count, width, height)
+    moves_count = 0
+    start = time.perf_counter()
+    while batch.is_running.any():
+        moves = batch.random_moves(rng)
+        batch.play(moves)
+        moves_count += int((moves >= 0).sum())
+    return moves_count / (time.perf_counter() - start)
+
+
+def measure_games(count, width, height):
+    rnd = random.Random(0)
+    moves_count = 0
+    start = time.perf_counter()
+    for _ in range(count):
+        game = GameModel(width, height)
+        while game.is_running:
+            play_move(game, rnd.choice(sorted(game.available_moves)))
+            moves_count += 1
+    return moves_count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    for width, height in [(8, 8), (10, 10)]:
+        print('{}x{}: GameModel {:.0f} moves/s, BatchBoard({}) {:.0f} moves/s'
+              .format(width, height, measure_games(100, width, height), count,
+                      measure_batch(count, width, height)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import sys
+import random
+sys.path.append('..')
+sys.path.append('.')
+from modules.AlphaBetaAI import play_move
+from modules.EndgameSolver import EndgameSolver
+from modules.GameModel import GameModel
+
+
+def get_position(rnd, width, height, empty_count):
+    while True:
+        game = GameModel(width, height)
+        while game.is_running and game.empty_count > empty_count:
+            play_move(game, rnd.choice(sorted(game.available_moves)))
+        if game.is_running:
+            return game
+
+
+def main():
+    sizes = sys.argv[1:] or ['8x8', '10x10', '49x2']
+    rnd = random.Random(0)
+    print('{:>7} {:>7} {:>10} {:>10} {:>12}'.format(
+        'size', 'empties', 'nodes', 'seconds', 'nodes/s'))
+    for size in sizes:
+        width, height = map(int, size.split('x'))
+        for empty_count in range(6, 15, 2):
+            solver = EndgameSolver(time_limit=30)
+            if solver.solve(get_position(rnd, width, height,
+                                         empty_count)) is None:
+                break
+            print('{:>7} {:>7} {:>10} {:>10.3f} {:>12.0f}'.format(
+                size, empty_count, solver.nodes, solver.elapsed,
+                solver.nodes_per_second))
+
+
+if __name__ == '__main__':
+    main()
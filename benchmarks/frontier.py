@@ -0,0 +1,56 @@
+import sys
+import time
+import random
+sys.path.append('..')
+sys.path.append('.')
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+
+
+def rescan(board, chip_type):
+    return {move for move in board.frontier
+            if board.is_legal(move, chip_type)}
+
+
+def measure(width, height, moves_count, seed=0):
+    rnd = random.Random(seed)
+    game = GameModel(width, height)
+    board = game.board
+    cur_type, enemy_type = ChipType.Black, ChipType.White
+    rows = []
+    for _ in range(moves_count):
+        moves = board.legal_moves(cur_type)
+        if not moves:
+            cur_type, enemy_type = enemy_type, cur_type
+            moves = board.legal_moves(cur_type)
+            if not moves:
+                break
+        move = rnd.choice(sorted(moves))
+        start = time.perf_counter()
+        board.play(move, cur_type)
+        incremental = time.perf_counter() - start
+        start = time.perf_counter()
+        rescan(board, enemy_type)
+        full = time.perf_counter() - start
+        rows.append((len(board.frontier), incremental, full))
+        cur_type, enemy_type = enemy_type, cur_type
+    return rows
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    moves_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    rows = measure(size, size, moves_count)
+    step = max(1, len(rows) // 10)
+    print('{:>9} {:>16} {:>16}'.format(
+        'frontier', 'incremental, us', 'full rescan, us'))
+    for i in range(0, len(rows), step):
+        chunk = rows[i:i + step]
+        print('{:>9} {:>16.1f} {:>16.1f}'.format(
+            chunk[-1][0],
+            sum(row[1] for row in chunk) / len(chunk) * 1e6,
+            sum(row[2] for row in chunk) / len(chunk) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import sys
+import time
+import random
+sys.path.append('..')
+sys.path.append('.')
+from modules.BitBoard import BitBoard
+from modules.Board import Board
+from modules.ChipType import ChipType
+
+
+def play_random_games(make_board, games_count, seed=0):
+    rnd = random.Random(seed)
+    moves_count = 0
+    for _ in range(games_count):
+        board = make_board()
+        board.put((3, 3), ChipType.White)
+        board.put((4, 4), ChipType.White)
+        board.put((4, 3), ChipType.Black)
+        board.put((3, 4), ChipType.Black)
+        cur_type, enemy_type = ChipType.Black, ChipType.White
+        passes = 0
+        while passes < 2:
+            moves = board.legal_moves(cur_type)
+            if moves:
+                passes = 0
+                board.play(rnd.choice(sorted(moves)), cur_type)
+                moves_count += 1
+            else:
+                passes += 1
+            cur_type, enemy_type = enemy_type, cur_type
+    return moves_count
+
+
+def measure(name, make_board, games_count):
+    start = time.perf_counter()
+    moves_count = play_random_games(make_board, games_count)
+    elapsed = time.perf_counter() - start
+    print('{}: {} moves, {:.0f} moves/s'.format(
+        name, moves_count, moves_count / elapsed))
+    return moves_count / elapsed
+
+
+def main():
+    games_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    generic = measure('Board 8x8', lambda: Board(8, 8), games_count)
+    bits = measure('BitBoard 8x8', BitBoard, games_count)
+    print('speedup: {:.1f}x'.format(bits / generic))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+import sys
+import argparse
+import json
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import time
+from threading import Thread
+sys.path.append('..')
+sys.path.append('.')
+from modules import ConsoleUI as consUI
+from modules import Protocol
+from modules.AlphaBetaAI import evaluate, play_move
+from modules.FieldRenderer import FieldRenderer
+from modules.GameModel import GameModel
+from modules.MonteCarloAI import MonteCarloAI
+from modules.PatternEvaluator import PatternEvaluator
+from modules.Server import Server
+
+
+SIZES = [(8, 8), (10, 10), (100, 9), (100, 2341)]
+ROCKS_SHARE = 0.05
+PERFT_DEPTHS = {(8, 8): 6, (10, 10): 6, (100, 9): 5, (100, 2341): 5}
+QUICK_DEPTH = 3
+
+
+def get_rocks(width, height, seed=0):
+    rnd = random.Random(seed)
+    center = {(x, y) for x in (width // 2 - 1, width // 2)
+              for y in (height // 2 - 1, height // 2)}
+    count = max(1, int(width * height * ROCKS_SHARE))
+    rocks = set()
+    while len(rocks) < count:
+        point = rnd.randrange(width), rnd.randrange(height)
+        if point not in center:
+            rocks.add(point)
+    return sorted(rocks)
+
+
+def create_game(width, height, with_rocks):
+    return GameModel(width, height,
+                     rocks=get_rocks(width, height) if with_rocks else None)
+
+
+def perft(game, depth):
+    if depth == 0 or not game.is_running:
+        return 1
+    nodes = 0
+    for move in sorted(game.available_moves):
+        record = play_move(game, move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move(record)
+    return nodes
+
+
+def measure_perft(width, height, with_rocks, depth):
+    game = create_game(width, height, with_rocks)
+    start = time.perf_counter()
+    nodes = perft(game, depth)
+    elapsed = time.perf_counter() - start
+    return {'depth': depth, 'nodes': nodes, 'seconds': elapsed,
+            'nodes_per_second': nodes / elapsed}
+
+
+def measure_make_move(width, height, with_rocks, moves_count, seed=0):
+    rnd = random.Random(seed)
+    game = create_game(width, height, with_rocks)
+    elapsed = 0
+    for _ in range(moves_count):
+        if not game.is_running:
+            game = create_game(width, height, with_rocks)
+        move = rnd.choice(sorted(game.available_moves))
+        start = time.perf_counter()
+        play_move(game, move)
+        elapsed += time.perf_counter() - start
+    return {'moves': moves_count, 'seconds': elapsed,
+            'moves_per_second': moves_count / elapsed}
+
+
+def measure_playouts(width, height, with_rocks, playouts_count):
+    ai = MonteCarloAI(time_limit=None, max_playouts=playouts_count, seed=0)
+    ai.get_move(create_game(width, height, with_rocks))
+    return {'playouts': ai.playouts, 'seconds': ai.elapsed,
+            'playouts_per_second': ai.playouts_per_second}
+
+
+def measure_evaluation(width, height, with_rocks, positions_count, seed=0):
+    rnd = random.Random(seed)
+    evaluator = PatternEvaluator(width, height)
+    game = create_game(width, height, with_rocks)
+    index = evaluator.attach(game)
+    simple = patterns = update = 0
+    for _ in range(positions_count):
+        if not game.is_running:
+            game = create_game(width, height, with_rocks)
+            index = evaluator.attach(game)
+        start = time.perf_counter()
+        evaluate(game)
+        simple += time.perf_counter() - start
+        start = time.perf_counter()
+        evaluator.evaluate(game)
+        patterns += time.perf_counter() - start
+        record = play_move(game, rnd.choice(sorted(game.available_moves)))
+        start = time.perf_counter()
+        index.undo(record.point, record.chip_type, record.flips)
+        index.play(record.point, record.chip_type, record.flips)
+        update += (time.perf_counter() - start) / 2
+    return {'positions': positions_count,
+            'simple_per_second': positions_count / simple,
+            'patterns_per_second': positions_count / patterns,
+            'update_seconds': update / positions_count}
+
+
+def measure_render(width, height, repeats, seed=0):
+    rnd = random.Random(seed)
+    game = GameModel(width, height)
+    for _ in range(min(20, repeats)):
+        play_move(game, rnd.choice(sorted(game.available_moves)))
+    full = _get_times(lambda: consUI.get_cur_condition(game), repeats)
+    renderer = FieldRenderer(game)
+    renderer.get_condition()
+    incremental = []
+    for _ in range(repeats):
+        if not game.is_running:
+            break
+        renderer.add_record(play_move(
+            game, rnd.choice(sorted(game.available_moves))))
+        start = time.perf_counter()
+        renderer.get_condition()
+        incremental.append(time.perf_counter() - start)
+    return {'full_seconds': statistics.median(full),
+            'incremental_seconds': statistics.median(incremental)}
+
+
+def _get_times(func, repeats):
+    res = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        res.append(time.perf_counter() - start)
+    return res
+
+
+def measure_server_latency(moves_count):
+    server = Server(0, '127.0.0.1')
+    thread = Thread(target=server.start)
+    thread.start()
+    server.ready.wait()
+    deltas, turns = [], []
+    try:
+        while len(deltas) < moves_count:
+            _play_online_game(server, moves_count - len(deltas), deltas,
+                              turns)
+    finally:
+        server.stop()
+        thread.join()
+    res = {'moves': len(deltas)}
+    res.update(_get_stats('delta', deltas))
+    res.update(_get_stats('turn', turns))
+    return res
+
+
+def _get_stats(name, times):
+    times = sorted(times)
+    return {name + '_mean_seconds': statistics.mean(times),
+            name + '_p50_seconds': times[len(times) // 2],
+            name + '_p99_seconds': times[min(len(times) - 1,
+                                             len(times) * 99 // 100)]}
+
+
+def _play_online_game(server, moves_count, deltas, turns):
+    clients = [socket.create_connection((server.host, server.port), 5)
+               for _ in range(2)]
+    try:
+        games = {}
+        for client in clients:
+            client.sendall(Protocol.encode_join((8, 8, 0)))
+        for client in clients:
+            start = _receive_until(client, Protocol.START)
+            games[start.chip_type] = client
+        game = GameModel.from_snapshot(start.snapshot)
+        _receive_until(games[game.get_cur_chip_type], Protocol.MOVE_REQUEST)
+        for _ in range(moves_count):
+            client = games[game.get_cur_chip_type]
+            start = time.perf_counter()
+            client.sendall(Protocol.encode_move(min(game.available_moves)))
+            Protocol.apply_delta(game, _receive_until(client,
+                                                      Protocol.STATE_DELTA))
+            deltas.append(time.perf_counter() - start)
+            if not game.is_running:
+                break
+            _receive_until(games[game.get_cur_chip_type],
+                           Protocol.MOVE_REQUEST)
+            turns.append(time.perf_counter() - start)
+    finally:
+        for client in clients:
+            client.close()
+
+
+def _receive_until(client, message_type):
+    while True:
+        message = Protocol.receive_message(client)
+        if message is None:
+            raise ConnectionError('Соединение разорвано')
+        if message.type == message_type:
+            return message.value
+
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(quick=False):
+    results = []
+    for width, height in SIZES:
+        size = '{}x{}'.format(width, height)
+        depth = QUICK_DEPTH if quick else PERFT_DEPTHS[width, height]
+        for with_rocks in (False, True):
+            params = {'size': size, 'rocks': with_rocks}
+            results.append(_result('perft', params, measure_perft(
+                width, height, with_rocks, depth)))
+            results.append(_result('make_move_to', params, measure_make_move(
+                width, height, with_rocks, 200 if quick else 2000)))
+            results.append(_result('evaluate', params, measure_evaluation(
+                width, height, with_rocks, 200 if quick else 2000)))
+            results.append(_result('mcts', params, measure_playouts(
+                width, height, with_rocks, 50 if quick else 500)))
+        results.append(_result('render', {'size': size}, measure_render(
+            width, height, 3 if quick else 20)))
+    results.append(_result('server_latency', {'size': '8x8'},
+                           measure_server_latency(50 if quick else 500)))
+    return {'commit': get_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'results': results}
+
+
+def _result(name, params, values):
+    return {'name': name, 'params': params, 'values': values}
+
+
+def compare(baseline, current):
+    rows = []
+    old_results = {_get_key(result): result['values']
+                   for result in baseline['results']}
+    for result in current['results']:
+        old_values = old_results.get(_get_key(result))
+        if old_values is None or _get_work(old_values) != _get_work(
+                result['values']):
+            continue
+        for key, value in result['values'].items():
+            if _is_timing(key) and key in old_values:
+                ratio = value / old_values[key] if old_values[key] else None
+                rows.append((result['name'], result['params'], key, ratio))
+    return rows
+
+
+def _is_timing(key):
+    return key.endswith(('seconds', 'per_second'))
+
+
+def _get_work(values):
+    return {key: value for key, value in values.items()
+            if not _is_timing(key)}
+
+
+def _get_key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-o', '--output', type=str,
+                        help='write the results to a file')
+    parser.add_argument('--compare', type=str,
+                        help='print ratios against results of an earlier run')
+    parser.add_argument('--quick', action='store_true',
+                        help='smaller workloads for a smoke run')
+    args = parser.parse_args()
+    results = run_suite(args.quick)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for name, params, key, ratio in compare(baseline, results):
+            print('{} {} {}: {}'.format(
+                name, ' '.join('{}={}'.format(*item)
+                               for item in sorted(params.items())),
+                key, 'n/a' if ratio is None else '{:.2f}x'.format(ratio)),
+                file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import os
+import random
+
+from modules.AlphaBetaAI import AlphaBetaAI
+from modules.OpeningBook import get_book_path, grow_book
+
+
+BOOKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'books')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    set_parser(parser)
+    args = parser.parse_args()
+    width, height = parse_size(args.size)
+    os.makedirs(args.dir, exist_ok=True)
+    path = get_book_path(args.dir, width, height)
+    ai = AlphaBetaAI(time_limit=args.time, max_nodes=args.nodes)
+    count = grow_book(path, width, height, ai, args.games, args.plies,
+                      random.Random(args.seed), args.variety)
+    print('{}: {} позиций'.format(path, count))
+
+
+def set_parser(parser):
+    parser.add_argument('-s', '--size', type=str, default='8x8',
+                        help='size of the game')
+    parser.add_argument('-d', '--dir', type=str, default=BOOKS_DIR,
+                        help='directory with opening books')
+    parser.add_argument('-g', '--games', type=int, default=10,
+                        help='self-play games to add')
+    parser.add_argument('-p', '--plies', type=int, default=10,
+                        help='moves from the beginning stored in the book')
+    parser.add_argument('-t', '--time', type=float, default=1.0,
+                        help='time budget of the search per position')
+    parser.add_argument('--nodes', type=int,
+                        help='node budget of the search per position')
+    parser.add_argument('--variety', type=float, default=0.3,
+                        help='probability of a random move in self-play')
+    parser.add_argument('--seed', type=int, help='seed of self-play')
+
+
+def parse_size(size):
+    width, height = size.split('x')
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    main()
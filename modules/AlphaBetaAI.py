@@ -0,0 +1,229 @@
+import time
+from .EndGame import EndGame
+from .TranspositionTable import TranspositionTable, EXACT, LOWER, UPPER
+
+
+WIN_SCORE = 1000000
+CORNER_WEIGHT = 25
+MOBILITY_WEIGHT = 5
+TIME_CHECK_PERIOD = 256
+
+
+class AlphaBetaAI:
+    def __init__(self, time_limit=1.0, max_nodes=None, max_depth=64,
+                 table=None, endgame=None, book=None, evaluator=None):
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.book = book
+        self.table = TranspositionTable() if table is None else table
+        self.endgame = endgame
+        self.evaluator = evaluator
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self._deadline = None
+        self._evaluate = evaluate
+
+    def get_move(self, game):
+        deadline = (None if self.time_limit is None
+                    else time.perf_counter() + self.time_limit)
+        moves = order_moves(game, game.available_moves)
+        self.depth = 0
+        self.score = 0
+        spent_nodes = 0
+        if len(moves) == 1:
+            return moves[0]
+        if self.book is not None:
+            book_move = self.book.get_move(game)
+            if book_move is not None:
+                return book_move
+        if self.endgame is not None and self.endgame.should_solve(game):
+            self.endgame.time_limit = (
+                None if deadline is None
+                else max(0.0, deadline - time.perf_counter()))
+            self.endgame.max_nodes = self.max_nodes
+            solution = self.endgame.solve(game)
+            if solution is not None:
+                self.depth = game.empty_count
+                self.score = solution[1]
+                return solution[0]
+            spent_nodes = self.endgame.nodes
+        self._start_search(game, deadline, spent_nodes)
+        try:
+            for depth in range(1, min(self.max_depth,
+                                      game.empty_count) + 1):
+                try:
+                    scores = self._search_root(game, moves, depth)
+                except _BudgetExceeded:
+                    break
+                moves = [move for _, move in sorted(
+                    zip(scores, moves), key=lambda pair: -pair[0])]
+                self.depth = depth
+                self.score = max(scores)
+        finally:
+            self._finish_search(game)
+        return moves[0]
+
+    def search_move(self, game, move, depth):
+        self._start_search(game, None if self.time_limit is None
+                           else time.perf_counter() + self.time_limit)
+        try:
+            return self._search_child(game, move, depth,
+                                      -WIN_SCORE * 2, WIN_SCORE * 2)
+        except _BudgetExceeded:
+            return None
+        finally:
+            self._finish_search(game)
+
+    def _start_search(self, game, deadline, spent_nodes=0):
+        self._evaluate = evaluate
+        if self.evaluator is not None and self.evaluator.fits(game):
+            self.evaluator.attach(game)
+            self._evaluate = self.evaluator.evaluate
+        self.nodes = spent_nodes
+        self.table.new_search()
+        self._deadline = deadline
+
+    def _finish_search(self, game):
+        if self._evaluate is not evaluate:
+            self.evaluator.detach(game)
+            self._evaluate = evaluate
+
+    def _search_root(self, game, moves, depth):
+        scores = []
+        alpha = -WIN_SCORE * 2
+        for move in moves:
+            score = self._search_child(game, move, depth, alpha, WIN_SCORE * 2)
+            scores.append(score)
+            alpha = max(alpha, score)
+        return scores
+
+    def _search_child(self, game, move, depth, alpha, beta):
+        is_black = game.cur_player_is_black
+        record = play_move(game, move)
+        try:
+            if game.cur_player_is_black == is_black:
+                return self._negamax(game, depth - 1, alpha, beta)
+            return -self._negamax(game, depth - 1, -beta, -alpha)
+        finally:
+            game.unmake_move(record)
+
+    def _negamax(self, game, depth, alpha, beta):
+        self._count_node()
+        if not game.is_running:
+            return get_final_score(game)
+        if depth == 0:
+            return self._evaluate(game)
+        key = game.hash
+        entry = self.table.probe(key)
+        hash_move = None
+        if entry is not None:
+            entry_depth, flag, score, move_index = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                elif flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+            if move_index >= 0:
+                hash_move = (move_index % game.width, move_index // game.width)
+        moves = order_moves(game, game.available_moves)
+        if hash_move in game.available_moves:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        alpha_orig = alpha
+        best = -WIN_SCORE * 2
+        best_move = moves[0]
+        for move in moves:
+            score = self._search_child(game, move, depth, alpha, beta)
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(key, depth, flag, best,
+                         best_move[1] * game.width + best_move[0])
+        return best
+
+    def _count_node(self):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise _BudgetExceeded()
+        if (self._deadline is not None and
+                self.nodes % TIME_CHECK_PERIOD == 0 and
+                time.perf_counter() >= self._deadline):
+            raise _BudgetExceeded()
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def play_move(game, move):
+    try:
+        return game.make_move_to(move)
+    except EndGame as e:
+        return e.record
+
+
+def get_final_score(game):
+    diff = (game.score[game.get_cur_chip_type] -
+            game.score[game.get_enemy_chip_type])
+    if diff > 0:
+        return WIN_SCORE + diff
+    elif diff < 0:
+        return -WIN_SCORE + diff
+    return 0
+
+
+def evaluate(game):
+    cur_type = game.get_cur_chip_type
+    enemy_type = game.get_enemy_chip_type
+    board = game.board
+    mobility = (len(game.available_moves) -
+                len(board.legal_moves(enemy_type)))
+    corners = 0
+    for corner in get_corners(game.width, game.height):
+        owner = board.get(corner)
+        if owner == cur_type:
+            corners += 1
+        elif owner == enemy_type:
+            corners -= 1
+    discs = game.score[cur_type] - game.score[enemy_type]
+    return CORNER_WEIGHT * corners + MOBILITY_WEIGHT * mobility + discs
+
+
+def get_corners(width, height):
+    return ((0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1))
+
+
+def order_moves(game, moves):
+    width = game.width
+    height = game.height
+    return sorted(moves, key=lambda move: (
+        get_move_priority(move, width, height), move))
+
+
+def get_move_priority(point, width, height):
+    x, y = point
+    on_x_edge = x == 0 or x == width - 1
+    on_y_edge = y == 0 or y == height - 1
+    if on_x_edge and on_y_edge:
+        return 0
+    if (x <= 1 or x >= width - 2) and (y <= 1 or y >= height - 2):
+        return 3
+    if on_x_edge or on_y_edge:
+        return 1
+    return 2
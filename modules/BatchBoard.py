@@ -0,0 +1,134 @@
+import numpy as np
+from .Board import BLACK, WHITE, ROCK
+from .MoveError import MoveError
+
+
+DIRECTIONS = tuple((dx, dy) for dx in range(-1, 2) for dy in range(-1, 2)
+                   if dx != 0 or dy != 0)
+
+
+class BatchBoard:
+    def __init__(self, count, width=8, height=8):
+        if width < 2 or height < 2 or width + height == 4:
+            raise Exception('Слишком маленькие размеры игрового поля')
+        self.count = count
+        self.width = width
+        self.height = height
+        shape = (count, height, width)
+        self.black = np.zeros(shape, dtype=bool)
+        self.white = np.zeros(shape, dtype=bool)
+        self.rocks = np.zeros(shape, dtype=bool)
+        self.black_to_move = np.ones(count, dtype=bool)
+        self.is_running = np.ones(count, dtype=bool)
+        self._init_beginning()
+        self.legal = self._get_legal()
+
+    def _init_beginning(self):
+        x = self.width // 2 - 1
+        y = self.height // 2 - 1
+        if self.width <= 8 or self.height <= 8:
+            self.white[:, y, x] = self.white[:, y + 1, x + 1] = True
+            self.black[:, y, x + 1] = self.black[:, y + 1, x] = True
+        else:
+            self.white[:, y, x] = self.white[:, y, x + 1] = True
+            self.black[:, y + 1, x] = self.black[:, y + 1, x + 1] = True
+
+    @classmethod
+    def from_games(cls, games):
+        width = games[0].width
+        height = games[0].height
+        res = cls(len(games), width, height)
+        codes = np.array([np.frombuffer(game.board.get_codes(), np.uint8)
+                          for game in games]).reshape(res.black.shape)
+        res.black = codes == BLACK
+        res.white = codes == WHITE
+        res.rocks = codes == ROCK
+        res.black_to_move = np.array([game.cur_player_is_black
+                                      for game in games])
+        res.is_running = np.array([game.is_running for game in games])
+        res.legal = res._get_legal()
+        return res
+
+    @property
+    def scores(self):
+        return (self.black.sum(axis=(1, 2)), self.white.sum(axis=(1, 2)))
+
+    def _get_sides(self, black_to_move):
+        turn = black_to_move[:, None, None]
+        own = np.where(turn, self.black, self.white)
+        enemy = np.where(turn, self.white, self.black)
+        return own, enemy
+
+    def _get_legal(self, black_to_move=None):
+        if black_to_move is None:
+            black_to_move = self.black_to_move
+        own, enemy = self._get_sides(black_to_move)
+        empty = ~(own | enemy | self.rocks)
+        res = np.zeros_like(own)
+        for dx, dy in DIRECTIONS:
+            cur = shift(own, dx, dy) & enemy
+            while cur.any():
+                cur = shift(cur, dx, dy)
+                res |= cur & empty
+                cur &= enemy
+        res &= self.is_running[:, None, None]
+        return res
+
+    def random_moves(self, rng):
+        flat_legal = self.legal.reshape(self.count, -1)
+        weights = rng.random(flat_legal.shape) * flat_legal
+        moves = weights.argmax(axis=1)
+        moves[~flat_legal.any(axis=1)] = -1
+        return moves
+
+    def play(self, moves):
+        moves = np.asarray(moves)
+        active = moves >= 0
+        flat_legal = self.legal.reshape(self.count, -1)
+        if not flat_legal[active, moves[active]].all():
+            raise MoveError('Неверная позиция для хода')
+        if (active != flat_legal.any(axis=1)).any():
+            raise MoveError('Неверная позиция для хода')
+        placed = np.zeros(flat_legal.shape, dtype=bool)
+        placed[active, moves[active]] = True
+        placed = placed.reshape(self.black.shape)
+        own, enemy = self._get_sides(self.black_to_move)
+        flips = np.zeros_like(own)
+        for dx, dy in DIRECTIONS:
+            cur = shift(placed, dx, dy) & enemy
+            line = cur.copy()
+            captured = np.zeros(self.count, dtype=bool)
+            while cur.any():
+                cur = shift(cur, dx, dy)
+                captured |= (cur & own).any(axis=(1, 2))
+                cur &= enemy
+                line |= cur
+            flips |= line & captured[:, None, None]
+        own = own | flips | placed
+        enemy = enemy & ~flips
+        turn = self.black_to_move[:, None, None]
+        self.black = np.where(turn, own, enemy)
+        self.white = np.where(turn, enemy, own)
+        return self._upd_condition(active)
+
+    def _upd_condition(self, active):
+        next_turn = np.where(active, ~self.black_to_move, self.black_to_move)
+        legal = self._get_legal(next_turn)
+        passed = active & ~legal.any(axis=(1, 2))
+        if passed.any():
+            next_turn = np.where(passed, self.black_to_move, next_turn)
+            legal[passed] = self._get_legal(next_turn)[passed]
+        finished = active & ~legal.any(axis=(1, 2))
+        self.black_to_move = next_turn
+        self.is_running &= ~finished
+        self.legal = legal
+        return passed & ~finished, finished
+
+
+def shift(cells, dx, dy):
+    res = np.zeros_like(cells)
+    height, width = cells.shape[1:]
+    res[:, max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = \
+        cells[:, max(-dy, 0):height + min(-dy, 0),
+              max(-dx, 0):width + min(-dx, 0)]
+    return res
@@ -0,0 +1,168 @@
+from .BoardMap import BoardMap
+from .ChipType import ChipType
+from .Board import BLACK, WHITE, ROCK
+
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_LEFT = 0xFEFEFEFEFEFEFEFE
+NOT_RIGHT = 0x7F7F7F7F7F7F7F7F
+LEFT_SHIFTS = ((1, NOT_LEFT), (8, FULL), (9, NOT_LEFT), (7, NOT_RIGHT))
+RIGHT_SHIFTS = ((1, NOT_RIGHT), (8, FULL), (9, NOT_RIGHT), (7, NOT_LEFT))
+
+
+class BitBoard:
+    def __init__(self):
+        self.width = 8
+        self.height = 8
+        self.black = 0
+        self.white = 0
+        self.rocks = 0
+        self.map = BoardMap(self)
+
+    def copy(self):
+        res = BitBoard()
+        res.black = self.black
+        res.white = self.white
+        res.rocks = self.rocks
+        return res
+
+    def contains(self, point):
+        try:
+            x, y = point
+            return 0 <= x < 8 and 0 <= y < 8
+        except (TypeError, ValueError):
+            return False
+
+    def get_codes(self):
+        codes = bytearray(64)
+        for bits, code in ((self.black, BLACK), (self.white, WHITE),
+                           (self.rocks, ROCK)):
+            while bits:
+                low = bits & -bits
+                codes[low.bit_length() - 1] = code
+                bits ^= low
+        return bytes(codes)
+
+    def get(self, point):
+        bit = _point_to_bit(point)
+        if self.black & bit:
+            return ChipType.Black
+        if self.white & bit:
+            return ChipType.White
+        if self.rocks & bit:
+            return ChipType.Rock
+        return None
+
+    def put(self, point, chip_type):
+        bit = _point_to_bit(point)
+        if chip_type == ChipType.Black:
+            self.black |= bit
+        elif chip_type == ChipType.White:
+            self.white |= bit
+        else:
+            self.rocks |= bit
+
+    @property
+    def empty(self):
+        return ~(self.black | self.white | self.rocks) & FULL
+
+    @property
+    def frontier(self):
+        return _bits_to_points(
+            get_neighbours(self.black | self.white) & self.empty)
+
+    @property
+    def frontier_size(self):
+        return (get_neighbours(self.black | self.white) &
+                self.empty).bit_count()
+
+    def legal_moves(self, chip_type):
+        own, enemy = self._get_sides(chip_type)
+        return _bits_to_points(get_moves(own, enemy, self.empty))
+
+    def is_legal(self, point, chip_type):
+        own, enemy = self._get_sides(chip_type)
+        return bool(get_moves(own, enemy, self.empty) & _point_to_bit(point))
+
+    def play(self, point, chip_type):
+        bit = _point_to_bit(point)
+        undo = self.black, self.white
+        own, enemy = self._get_sides(chip_type)
+        flips = get_flips(bit, own, enemy)
+        own |= flips | bit
+        enemy ^= flips
+        if chip_type == ChipType.Black:
+            self.black, self.white = own, enemy
+        else:
+            self.white, self.black = own, enemy
+        return _bits_to_points(flips, list), undo
+
+    def undo(self, point, chip_type, flips, undo):
+        self.black, self.white = undo
+
+    def _get_sides(self, chip_type):
+        if chip_type == ChipType.Black:
+            return self.black, self.white
+        return self.white, self.black
+
+
+def get_moves(own, enemy, empty):
+    moves = 0
+    for shift, mask in LEFT_SHIFTS:
+        candidates = enemy & mask
+        line = (own << shift) & candidates
+        for _ in range(5):
+            line |= (line << shift) & candidates
+        moves |= (line << shift) & mask & empty
+    for shift, mask in RIGHT_SHIFTS:
+        candidates = enemy & mask
+        line = (own >> shift) & candidates
+        for _ in range(5):
+            line |= (line >> shift) & candidates
+        moves |= (line >> shift) & mask & empty
+    return moves
+
+
+def get_flips(move, own, enemy):
+    flips = 0
+    for shift, mask in LEFT_SHIFTS:
+        line = 0
+        cur = (move << shift) & mask
+        while cur & enemy:
+            line |= cur
+            cur = (cur << shift) & mask
+        if cur & own:
+            flips |= line
+    for shift, mask in RIGHT_SHIFTS:
+        line = 0
+        cur = (move >> shift) & mask
+        while cur & enemy:
+            line |= cur
+            cur = (cur >> shift) & mask
+        if cur & own:
+            flips |= line
+    return flips
+
+
+def get_neighbours(bits):
+    res = 0
+    for shift, mask in LEFT_SHIFTS:
+        res |= (bits << shift) & mask
+    for shift, mask in RIGHT_SHIFTS:
+        res |= (bits >> shift) & mask
+    return res
+
+
+def _point_to_bit(point):
+    x, y = point
+    return 1 << (y * 8 + x)
+
+
+def _bits_to_points(bits, container=set):
+    points = []
+    while bits:
+        low = bits & -bits
+        index = low.bit_length() - 1
+        points.append((index & 7, index >> 3))
+        bits ^= low
+    return container(points)
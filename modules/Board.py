@@ -0,0 +1,220 @@
+from array import array
+from functools import lru_cache
+from .BoardMap import BoardMap
+from .ChipType import ChipType
+
+
+EMPTY, BLACK, WHITE, ROCK = 0, 1, 2, 3
+CODES = {ChipType.Black: BLACK, ChipType.White: WHITE, ChipType.Rock: ROCK}
+TYPES = (None, ChipType.Black, ChipType.White, ChipType.Rock)
+DIRECTIONS = tuple((dx, dy) for dx in range(-1, 2) for dy in range(-1, 2)
+                   if dx != 0 or dy != 0)
+RAYS_CACHE_SIZE = 16
+RAYS_AREA_LIMIT = 1 << 18
+
+
+@lru_cache(maxsize=RAYS_CACHE_SIZE)
+def get_rays(width, height):
+    steps = tuple(dy * width + dx for dx, dy in DIRECTIONS)
+    if width * height > RAYS_AREA_LIMIT:
+        return steps, _ComputedLengths(width, height)
+    lengths = array('I')
+    for y in range(height):
+        for x in range(width):
+            lengths.extend(get_lengths(x, y, width, height))
+    return steps, lengths
+
+
+def get_lengths(x, y, width, height):
+    right = width - 1 - x
+    down = height - 1 - y
+    return (min(x, y), x, min(x, down), y, down, min(right, y), right,
+            min(right, down))
+
+
+class _ComputedLengths:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def __getitem__(self, key):
+        index = key.start // 8
+        return get_lengths(index % self.width, index // self.width,
+                           self.width, self.height)
+
+
+class Board:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        self.steps, self.lengths = get_rays(width, height)
+        self.frontier = set()
+        self.legal = {BLACK: set(), WHITE: set()}
+        self.map = BoardMap(self)
+
+    def copy(self):
+        res = Board.__new__(Board)
+        res.width = self.width
+        res.height = self.height
+        res.cells = self.cells[:]
+        res.steps = self.steps
+        res.lengths = self.lengths
+        res.frontier = set(self.frontier)
+        res.legal = {BLACK: set(self.legal[BLACK]),
+                     WHITE: set(self.legal[WHITE])}
+        res.map = BoardMap(res)
+        return res
+
+    @property
+    def frontier_size(self):
+        return len(self.frontier)
+
+    def contains(self, point):
+        try:
+            x, y = point
+            return 0 <= x < self.width and 0 <= y < self.height
+        except (TypeError, ValueError):
+            return False
+
+    def get_codes(self):
+        return bytes(self.cells)
+
+    def get(self, point):
+        x, y = point
+        return TYPES[self.cells[y * self.width + x]]
+
+    def put(self, point, chip_type):
+        self._place(point, CODES[chip_type])
+        if chip_type != ChipType.Rock:
+            self._upd_legal_around([point])
+
+    def _place(self, point, code):
+        x, y = point
+        self.cells[y * self.width + x] = code
+        self.frontier.discard(point)
+        toggled = []
+        for own in (BLACK, WHITE):
+            if point in self.legal[own]:
+                self.legal[own].remove(point)
+                toggled.append((own, point))
+        added = self._upd_frontier_with(point) if code != ROCK else []
+        return added, toggled
+
+    def _upd_frontier_with(self, point):
+        x, y = point
+        width = self.width
+        index = y * width + x
+        base = index * 8
+        lengths = self.lengths
+        cells = self.cells
+        frontier = self.frontier
+        added = []
+        for step, length in zip(self.steps, lengths[base:base + 8]):
+            cur = index + step
+            if length and cells[cur] == EMPTY:
+                neighbour = (cur % width, cur // width)
+                if neighbour not in frontier:
+                    frontier.add(neighbour)
+                    added.append(neighbour)
+        return added
+
+    def legal_moves(self, chip_type):
+        return self.legal[CODES[chip_type]]
+
+    def _upd_legal_around(self, changed, toggled=None):
+        cells = self.cells
+        width = self.width
+        steps = self.steps
+        lengths = self.lengths
+        candidates = set()
+        for x, y in changed:
+            index = y * width + x
+            base = index * 8
+            for step, length in zip(steps, lengths[base:base + 8]):
+                cur = index
+                for _ in range(length):
+                    cur += step
+                    code = cells[cur]
+                    if code != BLACK and code != WHITE:
+                        if code == EMPTY:
+                            candidates.add((cur % width, cur // width))
+                        break
+        is_legal = self._is_legal
+        for point in candidates:
+            index = point[1] * width + point[0]
+            for own in (BLACK, WHITE):
+                legal = self.legal[own]
+                if is_legal(index, own) != (point in legal):
+                    if point in legal:
+                        legal.remove(point)
+                    else:
+                        legal.add(point)
+                    if toggled is not None:
+                        toggled.append((own, point))
+
+    def is_legal(self, point, chip_type):
+        x, y = point
+        return self._is_legal(y * self.width + x, CODES[chip_type])
+
+    def _is_legal(self, index, own):
+        enemy = BLACK + WHITE - own
+        cells = self.cells
+        base = index * 8
+        for step, length in zip(self.steps, self.lengths[base:base + 8]):
+            cur = index + step
+            if length < 2 or cells[cur] != enemy:
+                continue
+            for _ in range(length - 1):
+                cur += step
+                code = cells[cur]
+                if code != enemy:
+                    if code == own:
+                        return True
+                    break
+        return False
+
+    def play(self, point, chip_type):
+        x, y = point
+        width = self.width
+        own = CODES[chip_type]
+        enemy = BLACK + WHITE - own
+        cells = self.cells
+        lengths = self.lengths
+        index = y * width + x
+        base = index * 8
+        flips = []
+        for step, length in zip(self.steps, lengths[base:base + 8]):
+            cur = index + step
+            if length < 2 or cells[cur] != enemy:
+                continue
+            for _ in range(length - 1):
+                cur += step
+                code = cells[cur]
+                if code != enemy:
+                    if code == own:
+                        line = index + step
+                        while line != cur:
+                            cells[line] = own
+                            flips.append((line % width, line // width))
+                            line += step
+                    break
+        added, toggled = self._place(point, own)
+        self._upd_legal_around([point] + flips, toggled)
+        return flips, (added, toggled)
+
+    def undo(self, point, chip_type, flips, undo):
+        added, toggled = undo
+        enemy = BLACK + WHITE - CODES[chip_type]
+        for x, y in flips:
+            self.cells[y * self.width + x] = enemy
+        x, y = point
+        self.cells[y * self.width + x] = EMPTY
+        self.frontier.difference_update(added)
+        self.frontier.add(point)
+        for code, move in reversed(toggled):
+            legal = self.legal[code]
+            if move in legal:
+                legal.remove(move)
+            else:
+                legal.add(move)
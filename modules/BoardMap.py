@@ -0,0 +1,24 @@
+from collections.abc import Mapping
+from .Chip import Chip
+
+
+class BoardMap(Mapping):
+    def __init__(self, board):
+        self.board = board
+
+    def __getitem__(self, point):
+        if not self.board.contains(point):
+            raise KeyError(point)
+        chip_type = self.board.get(point)
+        return None if chip_type is None else Chip(chip_type)
+
+    def __contains__(self, point):
+        return self.board.contains(point)
+
+    def __iter__(self):
+        for x in range(self.board.width):
+            for y in range(self.board.height):
+                yield x, y
+
+    def __len__(self):
+        return self.board.width * self.board.height
@@ -0,0 +1,86 @@
+import asyncio
+import socket
+from . import Protocol
+from .ProtocolError import ProtocolError
+
+
+class Connection:
+    def __init__(self, reader, writer, max_queue=None, metrics=None):
+        self.reader = reader
+        self.writer = writer
+        self.address = writer.get_extra_info('peername')
+        self.inbox = asyncio.Queue()
+        self.outbox = asyncio.Queue()
+        self.max_queue = max_queue
+        self.metrics = metrics
+        self.closed = asyncio.Event()
+        self._tasks = []
+
+    @property
+    def is_closed(self):
+        return self.closed.is_set()
+
+    def start(self):
+        sock = self.writer.get_extra_info('socket')
+        if sock is not None and sock.family in (socket.AF_INET,
+                                                socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._tasks = [asyncio.create_task(self._read_loop()),
+                       asyncio.create_task(self._write_loop())]
+
+    async def _read_loop(self):
+        try:
+            while True:
+                await self.inbox.put(
+                    await Protocol.read_message(self.reader))
+        except (asyncio.IncompleteReadError, ProtocolError, ConnectionError):
+            pass
+        finally:
+            self.closed.set()
+            await self.inbox.put(None)
+            self.outbox.put_nowait(None)
+
+    async def _write_loop(self):
+        try:
+            while True:
+                data = await self.outbox.get()
+                if data is None:
+                    break
+                self.writer.write(data)
+                if self.metrics is not None:
+                    self.metrics.inc('server_bytes_sent_total', len(data))
+                    self.metrics.inc('server_client_bytes_sent_total',
+                                     len(data),
+                                     (('client', self.get_address()),))
+                await self.writer.drain()
+        except ConnectionError:
+            self.closed.set()
+        finally:
+            self.writer.close()
+
+    def get_address(self):
+        if isinstance(self.address, tuple):
+            return '{}:{}'.format(*self.address[:2])
+        return str(self.address)
+
+    def send(self, data):
+        if self.is_closed:
+            return True
+        if (self.max_queue is not None and
+                self.outbox.qsize() >= self.max_queue):
+            return False
+        self.outbox.put_nowait(data)
+        return True
+
+    def clear(self):
+        while not self.outbox.empty():
+            self.outbox.get_nowait()
+
+    async def receive(self):
+        message = await self.inbox.get()
+        if message is None:
+            raise ConnectionError('Соединение разорвано')
+        return message
+
+    def close(self):
+        self.outbox.put_nowait(None)
@@ -1,27 +1,100 @@
+from .Board import CODES, EMPTY
 from .ChipType import ChipType
-from .Chip import Chip
+from .GameModel import SPARSE_AREA_LIMIT
 import math
 
 
-def _get_field(game):
-    res = []
-    chip_dict = {ChipType.White: '\u25cb',
-                 ChipType.Black: '\u25cf',
-                 ChipType.Rock: '#'}
-    tab_len = math.ceil(math.log10(game.height - 1)) + 1
-    nums_tip = ' ' * tab_len + ''.join([str(i)[-1] for i in range(game.width)])
-    res.append(nums_tip)
+CELL_CHARS = str.maketrans('\x00\x01\x02\x03', '-\u25cf\u25cb#')
+MOVE_CHAR = '.'
+DEFAULT_VIEWPORT = (60, 30)
+
+
+def _get_field(game, renderer=None):
+    if renderer is not None:
+        return renderer.get_field()
+    viewport = get_default_viewport(game)
+    if viewport is not None:
+        return get_window_field(game, viewport)
+    tab_len = get_tab_len(game)
+    nums_tip = get_nums_tip(game, tab_len)
+    codes = game.board.get_codes()
+    moves = get_moves_by_row(game.available_moves)
+    res = [nums_tip]
     for y in range(game.height):
-        line = str(y) + ' ' * (tab_len - len(str(y)))
-        for x in range(game.width):
-            if isinstance(game.map[x, y], Chip):
-                cur_c = chip_dict[game.map[x, y].type]
-            elif (x, y) in game.available_moves:
-                cur_c = '.'
-            else:
-                cur_c = '-'
-            line += cur_c
-        res.append(line)
+        res.append(get_row(game, codes, y, moves.get(y), tab_len))
+    res.append(nums_tip)
+    res.append('')
+    return '\n'.join(res)
+
+
+def get_tab_len(game):
+    return math.ceil(math.log10(game.height - 1)) + 1
+
+
+def get_nums_tip(game, tab_len):
+    return ' ' * tab_len + ''.join([str(i)[-1] for i in range(game.width)])
+
+
+def get_moves_by_row(moves, rows=None):
+    res = {}
+    for x, y in moves:
+        if rows is None or y in rows:
+            res.setdefault(y, []).append(x)
+    return res
+
+
+def get_row(game, codes, y, moves_xs, tab_len):
+    start = y * game.width
+    return _format_row(y, codes[start:start + game.width], moves_xs, tab_len)
+
+
+def _format_row(y, codes, moves_xs, tab_len, left=0):
+    line = codes.decode('latin-1').translate(CELL_CHARS)
+    if moves_xs:
+        chars = list(line)
+        for x in moves_xs:
+            chars[x - left] = MOVE_CHAR
+        line = ''.join(chars)
+    return str(y) + ' ' * (tab_len - len(str(y))) + line
+
+
+def get_default_viewport(game):
+    if game.width * game.height > SPARSE_AREA_LIMIT:
+        return DEFAULT_VIEWPORT
+    return None
+
+
+def get_viewport(game, width, height):
+    points = game.border_moves
+    if points:
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        center_x = (min(xs) + max(xs)) // 2
+        center_y = (min(ys) + max(ys)) // 2
+    else:
+        center_x, center_y = game.width // 2, game.height // 2
+    left = max(0, min(center_x - width // 2, game.width - width))
+    top = max(0, min(center_y - height // 2, game.height - height))
+    return (left, top, min(game.width, left + width),
+            min(game.height, top + height))
+
+
+def get_window_field(game, viewport):
+    left, top, right, bottom = get_viewport(game, *viewport)
+    tab_len = len(str(bottom - 1)) + 1
+    nums_tip = ' ' * tab_len + ''.join(
+        [str(x)[-1] for x in range(left, right)])
+    moves = get_moves_by_row(
+        [(x, y) for x, y in game.available_moves if left <= x < right],
+        range(top, bottom))
+    get = game.board.get
+    res = ['Клетки {}-{} по горизонтали, {}-{} по вертикали'.format(
+        left, right - 1, top, bottom - 1), nums_tip]
+    for y in range(top, bottom):
+        codes = bytes([EMPTY if chip_type is None else CODES[chip_type]
+                       for chip_type in (get((x, y))
+                                         for x in range(left, right))])
+        res.append(_format_row(y, codes, moves.get(y), tab_len, left))
     res.append(nums_tip)
     res.append('')
     return '\n'.join(res)
@@ -43,9 +116,9 @@ def _get_separator():
            '----------------------------------\n'
 
 
-def get_cur_condition(game):
+def get_cur_condition(game, renderer=None):
     res = [_get_separator(), _get_score(game), _get_cur_player(game),
-           _get_field(game)]
+           _get_field(game, renderer)]
     if not game.is_running:
         res.append(_get_message_about_ending(game))
     return ''.join(res)
@@ -60,3 +133,11 @@ def _get_message_about_ending(game):
     winner = 'белые' if score_w > score_b else 'черные'
     return beginning_of_result + ('Победили {} со счетом {}:{}.\n'
                                   .format(winner, str(score_b), str(score_w)))
+
+
+def get_header(game):
+    return _get_score(game) + _get_cur_player(game)
+
+
+def get_ending(game):
+    return '' if game.is_running else _get_message_about_ending(game)
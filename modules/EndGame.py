@@ -1,2 +1,4 @@
 class EndGame(Exception):
-    pass
+    def __init__(self, msg, record=None):
+        super().__init__(msg)
+        self.record = record
@@ -0,0 +1,115 @@
+import time
+from .AlphaBetaAI import play_move, get_move_priority
+
+
+DEFAULT_THRESHOLD = 10
+TIME_CHECK_PERIOD = 1024
+
+
+class EndgameSolver:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, time_limit=None,
+                 max_nodes=None):
+        self.threshold = threshold
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.elapsed = 0.0
+        self._deadline = None
+        self._empties = None
+        self._half_width = 0
+        self._half_height = 0
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    def should_solve(self, game):
+        return game.empty_count < self.threshold
+
+    def solve(self, game):
+        self.nodes = 0
+        start = time.perf_counter()
+        self._deadline = (None if self.time_limit is None
+                          else start + self.time_limit)
+        self._empties = get_empty_cells(game)
+        self._half_width = game.width // 2
+        self._half_height = game.height // 2
+        limit = game.width * game.height + 1
+        best_move = None
+        best = -limit
+        try:
+            for move in self._order_moves(game):
+                score = self._search_child(game, move, best, limit)
+                if score > best or best_move is None:
+                    best = score
+                    best_move = move
+        except _BudgetExceeded:
+            return None
+        finally:
+            self.elapsed = time.perf_counter() - start
+        return best_move, best
+
+    def _search_child(self, game, move, alpha, beta):
+        is_black = game.cur_player_is_black
+        record = play_move(game, move)
+        self._empties.remove(move)
+        try:
+            if game.cur_player_is_black == is_black:
+                return self._negamax(game, alpha, beta)
+            return -self._negamax(game, -beta, -alpha)
+        finally:
+            self._empties.add(move)
+            game.unmake_move(record)
+
+    def _negamax(self, game, alpha, beta):
+        self._count_node()
+        if not game.is_running:
+            return (game.score[game.get_cur_chip_type] -
+                    game.score[game.get_enemy_chip_type])
+        best = -game.width * game.height - 1
+        for move in self._order_moves(game):
+            score = self._search_child(game, move, alpha, beta)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
+
+    def _order_moves(self, game):
+        regions = [0, 0, 0, 0]
+        for point in self._empties:
+            regions[self._get_region(point)] += 1
+        width = game.width
+        height = game.height
+        return sorted(game.available_moves, key=lambda move: (
+            regions[self._get_region(move)] % 2 == 0,
+            get_move_priority(move, width, height), move))
+
+    def _get_region(self, point):
+        return ((point[0] >= self._half_width) +
+                (point[1] >= self._half_height) * 2)
+
+    def _count_node(self):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise _BudgetExceeded()
+        if (self._deadline is not None and
+                self.nodes % TIME_CHECK_PERIOD == 0 and
+                time.perf_counter() >= self._deadline):
+            raise _BudgetExceeded()
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def get_empty_cells(game):
+    codes = game.board.get_codes()
+    res = set()
+    index = codes.find(0)
+    while index != -1:
+        res.add((index % game.width, index // game.width))
+        index = codes.find(0, index + 1)
+    return res
@@ -0,0 +1,147 @@
+from .AlphaBetaAI import play_move
+from .Board import EMPTY, BLACK, WHITE, ROCK
+from .ChipType import ChipType
+from .EndGame import EndGame
+from .GameModel import GameModel
+from .MoveError import MoveError
+from .Players import create_player
+
+
+CELL_CODES = {'-': EMPTY, 'x': BLACK, 'o': WHITE, '#': ROCK}
+SIDES = {'b': True, 'w': False}
+BUDGETS = {'time': ('time_limit', float),
+           'nodes': ('max_nodes', int),
+           'depth': ('max_depth', int),
+           'playouts': ('max_playouts', int)}
+DEFAULT_ENGINE = 'alphabeta'
+
+
+class Engine:
+    def __init__(self, spec=DEFAULT_ENGINE, **defaults):
+        self.defaults = defaults
+        self.ai = create_player(spec, **defaults)
+        self.game = GameModel()
+        self.is_running = True
+        self.commands = {'new': self._new,
+                         'position': self._position,
+                         'play': self._play,
+                         'go': self._go,
+                         'moves': self._moves,
+                         'status': self._status,
+                         'engine': self._engine,
+                         'quit': self._quit}
+
+    def run(self, input_file, output_file):
+        for line in input_file:
+            response = self.handle(line)
+            if response is not None:
+                output_file.write(response + '\n')
+                output_file.flush()
+            if not self.is_running:
+                break
+
+    def handle(self, line):
+        words = line.split()
+        if not words or words[0].startswith('#'):
+            return None
+        command = self.commands.get(words[0])
+        if command is None:
+            return '? Неизвестная команда: ' + words[0]
+        try:
+            res = command(words[1:])
+        except Exception as e:
+            return '? ' + str(e)
+        return '=' if res is None else '= ' + res
+
+    def _new(self, args):
+        width, height = parse_size(args[0]) if args else (8, 8)
+        if len(args) in (2, 3) and ',' not in args[1]:
+            self.game = GameModel(width, height, int(args[1]),
+                                  rocks_seed=(int(args[2]) if len(args) == 3
+                                              else None))
+        else:
+            self.game = GameModel(width, height,
+                                  rocks=[parse_point(arg)
+                                         for arg in args[1:]])
+
+    def _position(self, args):
+        if len(args) != 3 or args[1] not in SIDES:
+            raise ValueError('Ожидается: position ШИРИНАxВЫСОТА b|w КЛЕТКИ')
+        width, height = parse_size(args[0])
+        cells = args[2]
+        if (len(cells) != width * height or
+                not set(cells).issubset(CELL_CODES)):
+            raise ValueError('Неверное описание клеток')
+        game = GameModel.from_codes(
+            width, height, bytes(CELL_CODES[cell] for cell in cells),
+            SIDES[args[1]])
+        if not game.available_moves:
+            try:
+                game.upd_condition()
+            except EndGame:
+                pass
+        self.game = game
+
+    def _play(self, args):
+        if len(args) != 1:
+            raise ValueError('Ожидается: play X,Y')
+        if not self.game.is_running:
+            raise MoveError('Игра закончена')
+        play_move(self.game, parse_point(args[0]))
+
+    def _go(self, args):
+        if not self.game.is_running:
+            raise MoveError('Игра закончена')
+        saved = {}
+        try:
+            for arg in args:
+                key, _, value = arg.partition('=')
+                if key not in BUDGETS or not hasattr(self.ai,
+                                                     BUDGETS[key][0]):
+                    raise ValueError('Неизвестный параметр ИИ: ' + key)
+                attr, attr_type = BUDGETS[key]
+                saved.setdefault(attr, getattr(self.ai, attr))
+                setattr(self.ai, attr, attr_type(value))
+            return format_point(self.ai.get_move(self.game))
+        finally:
+            for attr, value in saved.items():
+                setattr(self.ai, attr, value)
+
+    def _moves(self, args):
+        return ' '.join(format_point(move)
+                        for move in sorted(self.game.available_moves))
+
+    def _status(self, args):
+        game = self.game
+        state = ('over' if not game.is_running else
+                 'b' if game.cur_player_is_black else 'w')
+        return '{} {} {}'.format(state, game.score[ChipType.Black],
+                                 game.score[ChipType.White])
+
+    def _engine(self, args):
+        if len(args) != 1:
+            raise ValueError('Ожидается: engine ИИ[:ПАРАМЕТРЫ]')
+        self.ai = create_player(args[0], **self.defaults)
+
+    def _quit(self, args):
+        self.is_running = False
+
+
+def parse_size(size):
+    width, _, height = size.partition('x')
+    try:
+        return int(width), int(height)
+    except ValueError:
+        raise ValueError('Неверный размер поля: ' + size) from None
+
+
+def parse_point(point):
+    x, _, y = point.partition(',')
+    try:
+        return int(x), int(y)
+    except ValueError:
+        raise ValueError('Неверная клетка: ' + point) from None
+
+
+def format_point(point):
+    return '{},{}'.format(*point)
@@ -0,0 +1,82 @@
+from . import ConsoleUI as consUI
+from .ChipType import ChipType
+
+
+CHIP_CHARS = {None: '-',
+              ChipType.Black: '\u25cf',
+              ChipType.White: '\u25cb',
+              ChipType.Rock: '#'}
+HEADER_LINE = 2
+FIELD_LINE = 6
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+CLEAR_LINE = '\x1b[K'
+CLEAR_BELOW = '\x1b[J'
+
+
+class FieldRenderer:
+    viewport = None
+
+    def __init__(self, game, ansi=False):
+        self.game = game
+        self.ansi = ansi
+        self._viewport = (self.viewport if self.viewport is not None
+                          else consUI.get_default_viewport(game))
+        self.tab_len = consUI.get_tab_len(game)
+        self.nums_tip = consUI.get_nums_tip(game, self.tab_len)
+        self._rows = None
+        self._moves = set()
+        self._changed = set()
+
+    def invalidate(self):
+        self._rows = None
+
+    def add_record(self, record):
+        self._changed.add(record.point)
+        self._changed.update(record.flips)
+
+    def get_field(self):
+        if self._viewport is not None:
+            self._changed.clear()
+            return consUI.get_window_field(self.game, self._viewport)
+        moves = self.game.available_moves
+        codes = self.game.board.get_codes()
+        if self._rows is None:
+            rows = range(self.game.height)
+            self._rows = [None] * self.game.height
+        else:
+            rows = {y for _, y in self._changed}
+            rows.update(y for _, y in self._moves.symmetric_difference(moves))
+        moves_by_row = consUI.get_moves_by_row(moves, rows)
+        for y in rows:
+            self._rows[y] = consUI.get_row(self.game, codes, y,
+                                           moves_by_row.get(y), self.tab_len)
+        self._moves = set(moves)
+        self._changed.clear()
+        return '\n'.join([self.nums_tip] + self._rows + [self.nums_tip, ''])
+
+    def get_condition(self):
+        if not self.ansi:
+            return consUI.get_cur_condition(self.game, self)
+        if self._rows is None or self._viewport is not None:
+            return CLEAR_SCREEN + consUI.get_cur_condition(self.game, self)
+        return self._get_ansi_update()
+
+    def _get_ansi_update(self):
+        moves = self.game.available_moves
+        res = []
+        for i, line in enumerate(consUI.get_header(self.game).splitlines()):
+            res.append(self._move_to(HEADER_LINE + i, 1) + line + CLEAR_LINE)
+        changed = self._changed.union(self._moves.symmetric_difference(moves))
+        for x, y in sorted(changed, key=lambda point: (point[1], point[0])):
+            char = (consUI.MOVE_CHAR if (x, y) in moves
+                    else CHIP_CHARS[self.game.board.get((x, y))])
+            res.append(self._move_to(FIELD_LINE + y, self.tab_len + x + 1) +
+                       char)
+        res.append(self._move_to(FIELD_LINE + self.game.height + 1, 1) +
+                   CLEAR_BELOW + consUI.get_ending(self.game))
+        self.get_field()
+        return ''.join(res)
+
+    @staticmethod
+    def _move_to(line, column):
+        return '\x1b[{};{}H'.format(line, column)
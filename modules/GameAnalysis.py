@@ -0,0 +1,41 @@
+from collections import namedtuple
+from itertools import islice
+from .GameRecord import read_records, replay
+
+
+OpeningStats = namedtuple('OpeningStats', ['games', 'black_wins', 'draws',
+                                           'white_wins'])
+
+
+def iter_records(paths):
+    for path in paths:
+        yield from read_records(path)
+
+
+def filter_by_size(records, width, height):
+    return (record for record in records
+            if record.width == width and record.height == height)
+
+
+def get_openings(records, plies):
+    for record in records:
+        opening = tuple(point for _, point in islice(replay(record), plies))
+        yield opening, record.black_score - record.white_score
+
+
+def count_openings(openings):
+    res = {}
+    for opening, diff in openings:
+        games, black_wins, draws, white_wins = res.get(
+            opening, (0, 0, 0, 0))
+        res[opening] = OpeningStats(games + 1, black_wins + (diff > 0),
+                                    draws + (diff == 0),
+                                    white_wins + (diff < 0))
+    return res
+
+
+def get_opening_stats(paths, plies, size=None):
+    records = iter_records(paths)
+    if size is not None:
+        records = filter_by_size(records, *size)
+    return count_openings(get_openings(records, plies))
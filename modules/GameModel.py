@@ -1,21 +1,38 @@
 from .ChipType import ChipType
-from .Chip import Chip
 from .MoveError import MoveError
 from .EndGame import EndGame
 from .RocksError import RocksError
+from .Board import Board, CODES, TYPES, BLACK, WHITE, ROCK
+from .BitBoard import BitBoard
+from .SparseBoard import SparseBoard
+from .MoveRecord import MoveRecord
+from . import Zobrist
 import random
+import struct
+import time
+
+
+SNAPSHOT_HEADER = '<IIIB'
+SPARSE_AREA_LIMIT = 1 << 20
+SEED_BITS = 32
 
 
 class GameModel:
-    def __init__(self, width=8, height=8, rocks_count=0):
+    metrics = None
+    patterns = None
+
+    def __init__(self, width=8, height=8, rocks_count=0, rocks=None,
+                 rocks_seed=None):
         self.width = width
         self.height = height
-        self.rocks_count = rocks_count
+        self.rocks_count = rocks_count if rocks is None else len(rocks)
+        self.rocks = [] if rocks is None else list(rocks)
+        self.rocks_seed = rocks_seed
         self.cur_player_is_black = True
         self.is_running = True
-        self.map = {}
+        self.board = None
+        self.cells_hash = 0
         self.score = {}
-        self.border_moves = set()
         self.available_moves = set()
         self._init_map()
         self._init_score()
@@ -25,9 +42,39 @@ class GameModel:
     def _init_map(self):
         if self.width < 2 or self.height < 2 or self.width + self.height == 4:
             raise Exception('Слишком маленькие размеры игрового поля')
-        for x in range(self.width):
-            for y in range(self.height):
-                self.map[x, y] = None
+        if self.width == self.height == 8:
+            self.board = BitBoard()
+        elif self.width * self.height > SPARSE_AREA_LIMIT:
+            self.board = SparseBoard(self.width, self.height)
+        else:
+            self.board = Board(self.width, self.height)
+        self._keys = Zobrist.get_cell_keys(self.width * self.height)
+        self.cells_hash = Zobrist.get_geometry_key(self.width, self.height)
+
+    @property
+    def map(self):
+        return self.board.map
+
+    @property
+    def border_moves(self):
+        return self.board.frontier
+
+    @property
+    def empty_count(self):
+        return (self.width * self.height - self.rocks_count -
+                self.score[ChipType.Black] - self.score[ChipType.White])
+
+    @property
+    def hash(self):
+        if self.cur_player_is_black:
+            return self.cells_hash
+        return self.cells_hash ^ Zobrist.SIDE_KEY
+
+    def _put(self, point, chip_type):
+        self.board.put(point, chip_type)
+        x, y = point
+        self.cells_hash ^= self._keys[
+            (y * self.width + x) * 4 + CODES[chip_type]]
 
     def _init_score(self):
         self.score[ChipType.Black] = 2
@@ -37,98 +84,121 @@ class GameModel:
         x = self.width // 2 - 1
         y = self.height // 2 - 1
         if self.width <= 8 or self.height <= 8:
-            self.map[x, y] = Chip(ChipType.White)
-            self.map[x + 1, y + 1] = Chip(ChipType.White)
-            self.map[x + 1, y] = Chip(ChipType.Black)
-            self.map[x, y + 1] = Chip(ChipType.Black)
+            self._put((x, y), ChipType.White)
+            self._put((x + 1, y + 1), ChipType.White)
+            self._put((x + 1, y), ChipType.Black)
+            self._put((x, y + 1), ChipType.Black)
         else:
-            self.map[x, y] = Chip(ChipType.White)
-            self.map[x + 1, y] = Chip(ChipType.White)
-            self.map[x, y + 1] = Chip(ChipType.Black)
-            self.map[x + 1, y + 1] = Chip(ChipType.Black)
-        self._init_border_moves()
+            self._put((x, y), ChipType.White)
+            self._put((x + 1, y), ChipType.White)
+            self._put((x, y + 1), ChipType.Black)
+            self._put((x + 1, y + 1), ChipType.Black)
         self._upd_available_moves()
 
     def _init_rocks(self):
+        if self.rocks:
+            self._init_rocks_from_layout()
+            return
         if self.rocks_count == 0:
             return
-        all_poss = {
-            (x, y) for x in range(self.width) for y in range(self.height)}
-        available_poss = all_poss.difference(self.available_moves)
-        for x in range(self.width // 2 - 1, self.width // 2 + 1):
-            for y in range(self.height // 2 - 1, self.height // 2 + 1):
-                available_poss.remove((x, y))
-        if len(available_poss) < self.rocks_count:
+        free_count = (self.width * self.height - 4 -
+                      len(self.available_moves))
+        if free_count < self.rocks_count:
             raise RocksError("Кол-во камней больше, чем места для них")
-        rock_poss = random.sample(available_poss, self.rocks_count)
-        for rock_pos in rock_poss:
-            self.map[rock_pos] = Chip(ChipType.Rock)
-            if rock_pos in self.border_moves:
-                self.border_moves.remove(rock_pos)
-
-    def _init_border_moves(self):
-        x = self.width // 2 - 2
-        y = self.height // 2 - 2
-        for dx in range(4):
-            for dy in range(4):
-                if (self.map_contains((x + dx, y + dy))
-                        and self.map[x + dx, y + dy] is None):
-                    self.border_moves.add((x + dx, y + dy))
-
-    def _upd_border_moves_with(self, move):
-        x, y = move
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if (self.map_contains((x + dx, y + dy)) and
-                        self.map[x + dx, y + dy] is None):
-                    self.border_moves.add((x + dx, y + dy))
-        self.border_moves.remove((x, y))
+        if self.rocks_seed is None:
+            self.rocks_seed = random.getrandbits(SEED_BITS)
+        rnd = random.Random(self.rocks_seed)
+        if self.rocks_count * 2 > free_count:
+            rock_poss = rnd.sample(sorted(
+                point for point in self.map
+                if self._can_put_rock_to(point)), self.rocks_count)
+        else:
+            rock_poss = set()
+            while len(rock_poss) < self.rocks_count:
+                index = rnd.randrange(self.width * self.height)
+                point = (index % self.width, index // self.width)
+                if self._can_put_rock_to(point):
+                    rock_poss.add(point)
+        self.rocks = sorted(rock_poss, key=lambda point: point[::-1])
+        self._init_rocks_from_layout()
+
+    def _can_put_rock_to(self, point):
+        return (self.board.get(point) is None and
+                point not in self.available_moves)
+
+    def _init_rocks_from_layout(self):
+        for rock_pos in self.rocks:
+            if (not self.map_contains(rock_pos) or
+                    self.board.get(rock_pos) is not None):
+                raise RocksError('Неверное расположение камней')
+            self._put(rock_pos, ChipType.Rock)
+        self._upd_available_moves()
 
     def map_contains(self, point):
-        return point in self.map
+        return self.board.contains(point)
 
     def _upd_available_moves(self):
-        self.available_moves.clear()
-        for cur_move in self.border_moves:
-            if self.move_is_correct_at(cur_move):
-                self.available_moves.add(cur_move)
+        metrics = self.metrics
+        if metrics is None:
+            self.available_moves = self.board.legal_moves(
+                self.get_cur_chip_type)
+            return
+        start = time.perf_counter()
+        self.available_moves = self.board.legal_moves(self.get_cur_chip_type)
+        metrics.observe('game_upd_available_moves_seconds',
+                        time.perf_counter() - start)
+        metrics.inc('game_moves_generated_total', len(self.available_moves))
+        metrics.observe('game_frontier_size', self.board.frontier_size)
 
     def move_is_correct_at(self, point):
         if not self.map_contains(point):
             raise MoveError('Ход выходит за пределы игрового поля')
-        x, y = point
-        cur_type = self.get_cur_chip_type
-        enemy_type = self.get_enemy_chip_type
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if dx != 0 or dy != 0:
-                    cur_x = x + dx
-                    cur_y = y + dy
-                    enemy_exists = False
-                    while (self.map_contains((cur_x, cur_y)) and
-                           self.map[cur_x, cur_y] is not None and
-                           self.map[cur_x, cur_y].type == enemy_type):
-                        cur_x += dx
-                        cur_y += dy
-                        enemy_exists = True
-                    if (not self.map_contains((cur_x, cur_y)) or
-                            self.map[cur_x, cur_y] is None):
-                        continue
-                    if self.map[cur_x, cur_y].type == cur_type and enemy_exists:
-                        return True
-        return False
+        return point in self.available_moves
 
     def make_move_to(self, point):
         if point not in self.available_moves:
             raise MoveError('Неверная позиция для хода')
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if dx != 0 or dy != 0:
-                    self.check_direction(point, dx, dy)
-        self.score[self.get_cur_chip_type] += 1
-        self.map[point] = Chip(self.get_cur_chip_type)
-        self._upd_border_moves_with(point)
-        self.upd_condition()
+        cur_type = self.get_cur_chip_type
+        available_moves = frozenset(self.available_moves)
+        flips, board_undo = self.board.play(point, cur_type)
+        if self.patterns is not None:
+            self.patterns.play(point, cur_type, flips)
+        record = MoveRecord(point, cur_type, flips, available_moves,
+                            board_undo, self.cells_hash)
+        self._upd_hash_with(point, flips)
+        if self.metrics is not None:
+            self.metrics.inc('game_cells_flipped_total', len(flips))
+        self.score[cur_type] += len(flips) + 1
+        self.score[self.get_enemy_chip_type] -= len(flips)
+        try:
+            self.upd_condition()
+        except EndGame as e:
+            e.record = record
+            raise
+        return record
+
+    def _upd_hash_with(self, point, flips):
+        keys = self._keys
+        width = self.width
+        own = BLACK if self.cur_player_is_black else WHITE
+        x, y = point
+        res = self.cells_hash ^ keys[(y * width + x) * 4 + own]
+        for x, y in flips:
+            index = (y * width + x) * 4
+            res ^= keys[index + BLACK] ^ keys[index + WHITE]
+        self.cells_hash = res
+
+    def unmake_move(self, record):
+        self.board.undo(record.point, record.chip_type, record.flips,
+                        record.board_undo)
+        if self.patterns is not None:
+            self.patterns.undo(record.point, record.chip_type, record.flips)
+        self.cur_player_is_black = record.chip_type == ChipType.Black
+        self.is_running = True
+        self.available_moves = record.available_moves
+        self.cells_hash = record.cells_hash
+        self.score[self.get_cur_chip_type] -= len(record.flips) + 1
+        self.score[self.get_enemy_chip_type] += len(record.flips)
 
     def upd_condition(self):
         self.cur_player_is_black = not self.cur_player_is_black
@@ -140,23 +210,48 @@ class GameModel:
                 self.is_running = False
                 raise EndGame('Доступных ходов нет. Игра закончена')
 
-    def check_direction(self, point, dx, dy):
-        x, y = point
-        self._direction_is_right((x + dx, y + dy), dx, dy)
-
-    def _direction_is_right(self, point, dx, dy):
-        if not self.map_contains(point) or self.map[point] is None:
-            return False
-        elif self.map[point].type == self.get_cur_chip_type:
-            return True
-        elif self.map[point].type == self.get_enemy_chip_type:
-            success = self._direction_is_right((point[0] + dx, point[1] + dy),
-                                               dx, dy)
-            if success:
-                self.map[point].reverse()
-                self.score[self.get_cur_chip_type] += 1
-                self.score[self.get_enemy_chip_type] -= 1
-            return success
+    def snapshot(self):
+        codes = self.board.get_codes()
+        packed = bytearray((len(codes) + 3) // 4)
+        for i, code in enumerate(codes):
+            if code:
+                packed[i >> 2] |= code << ((i & 3) * 2)
+        flags = self.cur_player_is_black | self.is_running << 1
+        return (struct.pack(SNAPSHOT_HEADER, self.width, self.height,
+                            self.rocks_count, flags) + bytes(packed))
+
+    @classmethod
+    def from_snapshot(cls, data):
+        width, height, rocks_count, flags = struct.unpack_from(
+            SNAPSHOT_HEADER, data)
+        packed = data[struct.calcsize(SNAPSHOT_HEADER):]
+        codes = bytes((packed[i >> 2] >> ((i & 3) * 2)) & 3
+                      for i in range(width * height))
+        game = cls.from_codes(width, height, codes, bool(flags & 1))
+        game.is_running = bool(flags & 2)
+        return game
+
+    @classmethod
+    def from_codes(cls, width, height, codes, cur_player_is_black=True):
+        game = cls.__new__(cls)
+        game.width = width
+        game.height = height
+        game.cur_player_is_black = cur_player_is_black
+        game.is_running = True
+        game.score = {ChipType.Black: 0, ChipType.White: 0}
+        game.rocks = []
+        game.rocks_seed = None
+        game._init_map()
+        for i, code in enumerate(codes):
+            if code:
+                game._put((i % width, i // width), TYPES[code])
+                if code != ROCK:
+                    game.score[TYPES[code]] += 1
+                else:
+                    game.rocks.append((i % width, i // width))
+        game.rocks_count = len(game.rocks)
+        game._upd_available_moves()
+        return game
 
     @property
     def get_cur_chip_type(self):
@@ -0,0 +1,160 @@
+import os
+from collections import namedtuple
+from .ChipType import ChipType
+from .EndGame import EndGame
+from .GameModel import GameModel
+from .RecordError import RecordError
+
+
+MAGIC = b'RVGR'
+READ_BUFFER = 2 ** 16
+
+GameRecord = namedtuple('GameRecord', ['width', 'height', 'rocks', 'moves',
+                                       'black_score', 'white_score'])
+
+
+class GameRecorder:
+    def __init__(self, game):
+        self.width = game.width
+        self.height = game.height
+        self.rocks = sorted(game.rocks, key=lambda point: point[::-1])
+        self.moves = []
+
+    def add(self, move_record):
+        x, y = move_record.point
+        self.moves.append(y * self.width + x)
+
+    def get_record(self, game):
+        return GameRecord(self.width, self.height, self.rocks, self.moves,
+                          game.score[ChipType.Black],
+                          game.score[ChipType.White])
+
+
+def encode_record(record):
+    body = bytearray()
+    for value in (record.width, record.height, len(record.rocks)):
+        _write_varint(body, value)
+    last_index = 0
+    for x, y in sorted(record.rocks, key=lambda point: point[::-1]):
+        index = y * record.width + x
+        _write_varint(body, index - last_index)
+        last_index = index
+    for value in (record.black_score, record.white_score, len(record.moves)):
+        _write_varint(body, value)
+    for index in record.moves:
+        _write_varint(body, index)
+    res = bytearray()
+    _write_varint(res, len(body))
+    return bytes(res + body)
+
+
+def decode_record(body):
+    try:
+        values = _read_varints(body)
+        width = next(values)
+        height = next(values)
+        if width == 0 or height == 0:
+            raise RecordError('Запись партии повреждена')
+        rocks = []
+        index = 0
+        for _ in range(next(values)):
+            index += next(values)
+            rocks.append((index % width, index // width))
+        black_score = next(values)
+        white_score = next(values)
+        moves = [next(values) for _ in range(next(values))]
+    except StopIteration:
+        raise RecordError('Запись партии повреждена')
+    if next(values, None) is not None:
+        raise RecordError('Запись партии повреждена')
+    return GameRecord(width, height, rocks, moves, black_score, white_score)
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(data):
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+    if shift:
+        raise RecordError('Запись партии повреждена')
+
+
+class GameRecordWriter:
+    def __init__(self, path):
+        self.path = path
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'ab')
+        if is_new:
+            self._file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, record):
+        self._file.write(encode_record(record))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def write_record(path, record):
+    with GameRecordWriter(path) as writer:
+        writer.write(record)
+
+
+def read_records(path):
+    with open(path, 'rb', buffering=READ_BUFFER) as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise RecordError('Файл не является файлом записей партий')
+        while True:
+            length = _read_length(file)
+            if length is None:
+                return
+            body = file.read(length)
+            if len(body) != length:
+                raise RecordError('Запись партии повреждена')
+            yield decode_record(body)
+
+
+def _read_length(file):
+    value = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            if shift:
+                raise RecordError('Запись партии повреждена')
+            return None
+        value |= (byte[0] & 0x7f) << shift
+        if not byte[0] & 0x80:
+            return value
+        shift += 7
+
+
+def replay(record):
+    game = GameModel(record.width, record.height, rocks=record.rocks)
+    for index in record.moves:
+        point = (index % record.width, index // record.width)
+        if point not in game.available_moves:
+            raise RecordError('Запись партии повреждена')
+        yield game, point
+        try:
+            game.make_move_to(point)
+        except EndGame:
+            pass
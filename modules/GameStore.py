@@ -0,0 +1,145 @@
+import asyncio
+import os
+import struct
+from collections import namedtuple
+from .EndGame import EndGame
+from .GameModel import GameModel
+from .MoveError import MoveError
+
+
+LOG_NAME = 'games.log'
+ENTRY = struct.Struct('<BII')
+TOKENS = struct.Struct('<QQ')
+CELL = struct.Struct('<I')
+DEFAULT_WINDOW = 0.05
+SNAPSHOT_INTERVAL = 32
+
+GAME = 1
+MOVE = 2
+SNAPSHOT = 3
+END = 4
+
+StoredGame = namedtuple('StoredGame', ['id', 'game', 'tokens'])
+
+
+class GameStore:
+    def __init__(self, directory, window=DEFAULT_WINDOW,
+                 snapshot_interval=SNAPSHOT_INTERVAL):
+        self.directory = directory
+        self.path = os.path.join(directory, LOG_NAME)
+        self.window = window
+        self.snapshot_interval = snapshot_interval
+        self._buffer = []
+        self._moves_count = {}
+        self._file = None
+        self._closed = asyncio.Event()
+
+    def load(self):
+        os.makedirs(self.directory, exist_ok=True)
+        games = self._read_games()
+        self._compact(games)
+        self._file = open(self.path, 'ab')
+        return games
+
+    def _read_games(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        states = {}
+        pos = 0
+        while pos + ENTRY.size <= len(data):
+            kind, game_id, length = ENTRY.unpack_from(data, pos)
+            start = pos + ENTRY.size
+            if start + length > len(data):
+                break
+            payload = data[start:start + length]
+            pos = start + length
+            if kind == GAME:
+                states[game_id] = [TOKENS.unpack_from(payload),
+                                   payload[TOKENS.size:], []]
+            elif kind == SNAPSHOT and game_id in states:
+                states[game_id][1:] = [payload, []]
+            elif kind == MOVE and game_id in states:
+                states[game_id][2].append(CELL.unpack(payload)[0])
+            elif kind == END:
+                states.pop(game_id, None)
+        res = {}
+        for game_id, (tokens, snapshot, moves) in states.items():
+            game = _restore_game(snapshot, moves)
+            if game is not None:
+                res[game_id] = StoredGame(game_id, game, tokens)
+        return res
+
+    def _compact(self, games):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            for stored in games.values():
+                f.write(_encode_game(stored.id, stored.game, stored.tokens))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def add_game(self, game_id, game, tokens):
+        self._moves_count[game_id] = 0
+        self._buffer.append(_encode_game(game_id, game, tokens))
+
+    def add_move(self, game_id, game, point):
+        x, y = point
+        self._buffer.append(_encode_entry(MOVE, game_id,
+                                          CELL.pack(y * game.width + x)))
+        self._moves_count[game_id] = self._moves_count.get(game_id, 0) + 1
+        if self._moves_count[game_id] >= self.snapshot_interval:
+            self._moves_count[game_id] = 0
+            self._buffer.append(_encode_entry(SNAPSHOT, game_id,
+                                              game.snapshot()))
+
+    def end_game(self, game_id):
+        self._moves_count.pop(game_id, None)
+        self._buffer.append(_encode_entry(END, game_id))
+
+    async def run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._closed.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+            if self._closed.is_set():
+                break
+        self._file.close()
+
+    def close(self):
+        self._closed.set()
+
+    async def flush(self):
+        if not self._buffer:
+            return
+        data = b''.join(self._buffer)
+        self._buffer = []
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, data)
+
+    def _write(self, data):
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def _encode_entry(kind, game_id, payload=b''):
+    return ENTRY.pack(kind, game_id, len(payload)) + payload
+
+
+def _encode_game(game_id, game, tokens):
+    return _encode_entry(GAME, game_id, TOKENS.pack(*tokens) +
+                         game.snapshot())
+
+
+def _restore_game(snapshot, moves):
+    game = GameModel.from_snapshot(snapshot)
+    try:
+        for index in moves:
+            game.make_move_to((index % game.width, index // game.width))
+    except (EndGame, MoveError):
+        return None
+    return game if game.is_running else None
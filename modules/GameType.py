@@ -5,3 +5,7 @@ class GameType(Enum):
     Offline = 0
     Online_server = 1
     Online_connect = 2
+    Dedicated_server = 3
+    Online_watch = 4
+    Online_resume = 5
+    Engine = 6
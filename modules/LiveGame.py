@@ -0,0 +1,61 @@
+from . import Protocol
+
+
+MAX_FAST_FORWARDS = 3
+
+
+class LiveGame:
+    def __init__(self, game_id, game, players, tokens):
+        self.id = game_id
+        self.game = game
+        self.players = players
+        self.tokens = tokens
+        self.spectators = {}
+        self.recorder = None
+        self._snapshot = None
+
+    def start(self):
+        for chip_type, conn in self.players.items():
+            conn.send(Protocol.encode_start(chip_type, self.id, self.game,
+                                            self.tokens[chip_type]))
+
+    def get_chip_type_by(self, token):
+        for chip_type, cur_token in self.tokens.items():
+            if cur_token == token:
+                return chip_type
+        return None
+
+    def add_spectator(self, conn):
+        self.spectators[conn] = 0
+        conn.send(self._get_snapshot())
+
+    def broadcast(self, data, is_state=True):
+        self._snapshot = None
+        for conn in self.players.values():
+            conn.send(data)
+        for conn in list(self.spectators):
+            if conn.is_closed:
+                del self.spectators[conn]
+            elif not conn.send(data):
+                self._fast_forward(conn, data, is_state)
+
+    def _fast_forward(self, conn, data, is_state):
+        conn.clear()
+        self.spectators[conn] += 1
+        if self.spectators[conn] > MAX_FAST_FORWARDS:
+            del self.spectators[conn]
+            conn.close()
+            return
+        conn.send(self._get_snapshot())
+        if not is_state:
+            conn.send(data)
+
+    def _get_snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = Protocol.encode_start(None, self.id, self.game)
+        return self._snapshot
+
+    def close(self):
+        for conn in list(self.players.values()) + list(self.spectators):
+            conn.close()
+        self.spectators.clear()
@@ -0,0 +1,75 @@
+from collections import deque
+from .LobbyError import LobbyError
+
+
+DEFAULT_PARAMS = (8, 8, 0)
+MAX_SIDE = 1024
+MAX_AREA = 1 << 16
+
+
+class Lobby:
+    def __init__(self, default_params=DEFAULT_PARAMS, max_side=MAX_SIDE,
+                 max_area=MAX_AREA):
+        self.default_params = default_params
+        self.max_side = max_side
+        self.max_area = max_area
+        self.waiting = {}
+        self.waiting_any = deque()
+
+    def join(self, conn, params=None):
+        if params is None:
+            for cur_params in list(self.waiting):
+                opponent = self._pop_waiting(cur_params)
+                if opponent is not None:
+                    return opponent, conn, cur_params
+            opponent = self._pop_open(self.waiting_any)
+            if opponent is not None:
+                return opponent, conn, self.default_params
+            self.waiting_any.append(conn)
+            return None
+        self.check_params(params)
+        opponent = self._pop_waiting(params)
+        if opponent is None:
+            opponent = self._pop_open(self.waiting_any)
+        if opponent is not None:
+            return opponent, conn, params
+        if params not in self.waiting:
+            self._remove_stale()
+            self.waiting[params] = deque()
+        self.waiting[params].append(conn)
+        return None
+
+    def check_params(self, params):
+        width, height, rocks_count = params
+        if (width > self.max_side or height > self.max_side or
+                width * height > self.max_area):
+            raise LobbyError(
+                'Слишком большие размеры игрового поля: не больше {} клеток '
+                'и {} по стороне'.format(self.max_area, self.max_side))
+        if rocks_count > width * height // 2:
+            raise LobbyError('Камни могут занимать не больше половины поля')
+
+    def _pop_waiting(self, params):
+        queue = self.waiting.get(params)
+        if queue is None:
+            return None
+        opponent = self._pop_open(queue)
+        if not queue:
+            del self.waiting[params]
+        return opponent
+
+    def _remove_stale(self):
+        for params, queue in list(self.waiting.items()):
+            open_conns = [conn for conn in queue if not conn.is_closed]
+            if open_conns:
+                self.waiting[params] = deque(open_conns)
+            else:
+                del self.waiting[params]
+
+    @staticmethod
+    def _pop_open(queue):
+        while queue:
+            conn = queue.popleft()
+            if not conn.is_closed:
+                return conn
+        return None
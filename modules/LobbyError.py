@@ -0,0 +1,3 @@
+class LobbyError(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+import time
+
+
+PREFIX = 'reversi_'
+MAX_SERIES = 1000
+
+
+class Stat:
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+
+class Metrics:
+    def __init__(self, max_series=MAX_SERIES):
+        self.max_series = max_series
+        self.counters = OrderedDict()
+        self.stats = OrderedDict()
+        self.started = time.time()
+
+    def inc(self, name, value=1, labels=()):
+        key = name, labels
+        if key in self.counters:
+            self.counters[key] += value
+        else:
+            self.counters[key] = value
+            self._limit(self.counters)
+
+    def observe(self, name, value, labels=()):
+        key = name, labels
+        stat = self.stats.get(key)
+        if stat is None:
+            stat = self.stats[key] = Stat()
+            self._limit(self.stats)
+        stat.add(value)
+
+    def _limit(self, series):
+        if len(series) <= self.max_series:
+            return
+        for key in series:
+            if key[1]:
+                del series[key]
+                return
+
+    def get_counter(self, name, labels=()):
+        return self.counters.get((name, labels), 0)
+
+    def get_stat(self, name, labels=()):
+        return self.stats.get((name, labels))
+
+    def get_slowest(self, name, count=10):
+        series = [(labels, stat) for (cur_name, labels), stat
+                  in list(self.stats.items()) if cur_name == name]
+        series.sort(key=lambda item: item[1].max, reverse=True)
+        return series[:count]
+
+    def render_text(self):
+        res = ['Метрики за {:.1f} с'.format(time.time() - self.started)]
+        for (name, labels), value in sorted(list(self.counters.items())):
+            res.append('{}{} {}'.format(name, _format_labels(labels), value))
+        for (name, labels), stat in sorted(
+                list(self.stats.items()),
+                key=lambda item: (item[0][0], -item[1].total)):
+            res.append('{}{} count={} sum={:.6g} mean={:.6g} max={:.6g}'
+                       .format(name, _format_labels(labels), stat.count,
+                               stat.total, stat.mean, stat.max))
+        res.append('')
+        return '\n'.join(res)
+
+    def render_prometheus(self):
+        res = []
+        last_name = None
+        for (name, labels), value in sorted(list(self.counters.items())):
+            if name != last_name:
+                res.append('# TYPE {}{} counter'.format(PREFIX, name))
+                last_name = name
+            res.append('{}{}{} {}'.format(PREFIX, name,
+                                          _format_labels(labels), value))
+        for (name, labels), stat in sorted(list(self.stats.items()),
+                                           key=lambda item: item[0]):
+            if name != last_name:
+                res.append('# TYPE {}{} summary'.format(PREFIX, name))
+                last_name = name
+            str_labels = _format_labels(labels)
+            res.append('{}{}_count{} {}'.format(PREFIX, name, str_labels,
+                                                stat.count))
+            res.append('{}{}_sum{} {:.9g}'.format(PREFIX, name, str_labels,
+                                                  stat.total))
+            res.append('{}{}_max{} {:.9g}'.format(PREFIX, name, str_labels,
+                                                  stat.max))
+        res.append('')
+        return '\n'.join(res)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(key, str(value).replace(
+        '\\', '\\\\').replace('"', '\\"')) for key, value in labels) + '}'
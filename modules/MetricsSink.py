@@ -0,0 +1,83 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class TextSink:
+    def __init__(self, metrics, path=None, interval=None):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+        if interval is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.write()
+
+    def write(self):
+        text = self.metrics.render_text()
+        if self.path is None:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+        else:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    def close(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.write()
+
+
+class HttpSink:
+    def __init__(self, metrics, port, host='127.0.0.1'):
+        self.metrics = metrics
+        self.server = ThreadingHTTPServer((host, port), _create_handler(
+            metrics))
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+
+def _create_handler(metrics):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            data = metrics.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return MetricsHandler
+
+
+def create_sink(metrics, spec, interval=None):
+    kind, _, arg = spec.partition(':')
+    if kind == 'text':
+        return TextSink(metrics, arg or None, interval)
+    if kind == 'http':
+        host, _, str_port = arg.rpartition(':')
+        return HttpSink(metrics, int(str_port), host or '127.0.0.1')
+    raise ValueError('Неизвестный приемник метрик: ' + spec)
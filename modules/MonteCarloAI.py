@@ -0,0 +1,305 @@
+import math
+import random
+import time
+from .Board import EMPTY, BLACK, WHITE, ROCK
+
+
+EXPLORATION = 1.4
+PLAYOUT_LIMIT = 100
+
+
+class MonteCarloAI:
+    def __init__(self, time_limit=1.0, max_nodes=None, max_playouts=None,
+                 seed=None, exploration=EXPLORATION,
+                 playout_limit=PLAYOUT_LIMIT):
+        self.time_limit = time_limit
+        self.max_playouts = max_nodes if max_playouts is None else max_playouts
+        self.exploration = exploration
+        self.playout_limit = playout_limit
+        self.rnd = random.Random(seed)
+        self.playouts = 0
+        self.elapsed = 0.0
+        self.reused = 0
+        self._root = None
+        self._game = None
+        self._state = None
+        self._discs_count = 0
+
+    @property
+    def playouts_per_second(self):
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    def get_move(self, game):
+        start = time.perf_counter()
+        deadline = (None if self.time_limit is None
+                    else start + self.time_limit)
+        state = _State(game)
+        root = self._get_reused_root(game, state)
+        if root is None:
+            root = _Node(None, None, state.is_black)
+            root.untried = state.get_moves()
+        self.reused = root.visits
+        self.playouts = 0
+        while (len(root.untried) + len(root.children) > 1 and
+               (self.max_playouts is None or
+                self.playouts < self.max_playouts) and
+               (deadline is None or time.perf_counter() < deadline or
+                self.playouts == 0)):
+            self._run_iteration(root, state.copy())
+            self.playouts += 1
+        self.elapsed = time.perf_counter() - start
+        if root.untried:
+            self._expand(root, state.copy())
+        best = max(root.children, key=lambda child: child.visits)
+        self._root = best
+        self._game = game
+        self._state = state.copy()
+        self._state.play(best.move, root.is_black)
+        self._discs_count = _get_discs_count(game) + 1
+        return state.get_point(best.move)
+
+    def _get_reused_root(self, game, state):
+        node = self._root
+        if (node is None or game is not self._game or
+                _get_discs_count(game) < self._discs_count):
+            return None
+        discs_count = _get_discs_count(game)
+        expected = self._state
+        if discs_count == self._discs_count + 1:
+            for child in node.children:
+                if state.cells[child.move] != EMPTY:
+                    expected = expected.copy()
+                    expected.play(child.move, node.is_black)
+                    node = child
+                    break
+            else:
+                return None
+        elif discs_count != self._discs_count:
+            return None
+        if expected.cells != state.cells:
+            return None
+        if node.is_black != state.is_black or node.untried is None:
+            return None
+        node.parent = None
+        return node
+
+    def _run_iteration(self, root, state):
+        node = root
+        while not node.untried and node.children:
+            node = self._select(node)
+            state.play(node.move, node.parent.is_black)
+            state.is_black = node.is_black
+        if node.untried:
+            node = self._expand(node, state)
+        result = state.playout(self.rnd, self.playout_limit)
+        while node is not None:
+            node.visits += 1
+            if node.parent is not None:
+                node.wins += (result if node.parent.is_black
+                              else 1 - result)
+            node = node.parent
+
+    def _select(self, node):
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        best = None
+        best_value = -1
+        for child in node.children:
+            value = (child.wins / child.visits +
+                     exploration * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best = child
+                best_value = value
+        return best
+
+    def _expand(self, node, state):
+        untried = node.untried
+        index = self.rnd.randrange(len(untried))
+        move = untried[index]
+        untried[index] = untried[-1]
+        untried.pop()
+        state.play(move, node.is_black)
+        state.pass_if_needed(not node.is_black)
+        child = _Node(move, node, state.is_black)
+        child.untried = state.get_moves()
+        node.children.append(child)
+        return child
+
+
+class _Node:
+    __slots__ = ('move', 'parent', 'is_black', 'children', 'untried',
+                 'wins', 'visits')
+
+    def __init__(self, move, parent, is_black):
+        self.move = move
+        self.parent = parent
+        self.is_black = is_black
+        self.children = []
+        self.untried = None
+        self.wins = 0.0
+        self.visits = 0
+
+
+class _State:
+    def __init__(self, game=None):
+        if game is None:
+            return
+        width = game.width
+        self.stride = stride = width + 2
+        self.offsets = (-stride - 1, -stride, -stride + 1, -1, 1,
+                        stride - 1, stride, stride + 1)
+        self.cells = bytearray([ROCK]) * (stride * (game.height + 2))
+        codes = game.board.get_codes()
+        for y in range(game.height):
+            start = (y + 1) * stride + 1
+            self.cells[start:start + width] = codes[y * width:
+                                                    (y + 1) * width]
+        self.candidates = [self.get_index(point)
+                           for point in game.border_moves]
+        self.is_black = game.cur_player_is_black
+        self.black_count = self.cells.count(BLACK)
+        self.white_count = self.cells.count(WHITE)
+
+    def copy(self):
+        res = _State()
+        res.stride = self.stride
+        res.offsets = self.offsets
+        res.cells = self.cells[:]
+        res.candidates = self.candidates[:]
+        res.is_black = self.is_black
+        res.black_count = self.black_count
+        res.white_count = self.white_count
+        return res
+
+    def get_index(self, point):
+        return (point[1] + 1) * self.stride + point[0] + 1
+
+    def get_point(self, index):
+        return index % self.stride - 1, index // self.stride - 1
+
+    def get_moves(self, is_black=None):
+        if is_black is None:
+            is_black = self.is_black
+        own, enemy = (BLACK, WHITE) if is_black else (WHITE, BLACK)
+        cells = self.cells
+        return [index for index in self.candidates
+                if cells[index] == EMPTY and
+                _is_legal(cells, index, own, enemy, self.offsets)]
+
+    def pass_if_needed(self, is_black):
+        self.is_black = is_black
+        if not self.get_moves(is_black) and self.get_moves(not is_black):
+            self.is_black = not is_black
+
+    def play(self, index, is_black):
+        own, enemy = (BLACK, WHITE) if is_black else (WHITE, BLACK)
+        cells = self.cells
+        flips = _get_flips(cells, index, own, enemy, self.offsets)
+        for flip in flips:
+            cells[flip] = own
+        cells[index] = own
+        if is_black:
+            self.black_count += len(flips) + 1
+            self.white_count -= len(flips)
+        else:
+            self.white_count += len(flips) + 1
+            self.black_count -= len(flips)
+        candidates = self.candidates
+        candidates.remove(index)
+        for offset in self.offsets:
+            neighbour = index + offset
+            if cells[neighbour] == EMPTY and neighbour not in candidates:
+                candidates.append(neighbour)
+
+    def playout(self, rnd, limit):
+        cells = self.cells
+        offsets = self.offsets
+        candidates = self.candidates
+        in_candidates = set(candidates)
+        black_count = self.black_count
+        white_count = self.white_count
+        is_black = self.is_black
+        get_random = rnd.random
+        passes = 0
+        moves_count = 0
+        while passes < 2 and moves_count < limit:
+            own, enemy = (BLACK, WHITE) if is_black else (WHITE, BLACK)
+            flips = None
+            tried = 0
+            count = len(candidates)
+            while tried < count:
+                i = tried + int(get_random() * (count - tried))
+                index = candidates[i]
+                candidates[i] = candidates[tried]
+                candidates[tried] = index
+                if cells[index] != EMPTY:
+                    last = candidates.pop()
+                    count -= 1
+                    if tried < count:
+                        candidates[tried] = last
+                    in_candidates.discard(index)
+                    continue
+                flips = _get_flips(cells, index, own, enemy, offsets)
+                if flips:
+                    break
+                tried += 1
+            if not flips:
+                passes += 1
+                is_black = not is_black
+                continue
+            passes = 0
+            moves_count += 1
+            for flip in flips:
+                cells[flip] = own
+            cells[index] = own
+            if is_black:
+                black_count += len(flips) + 1
+                white_count -= len(flips)
+            else:
+                white_count += len(flips) + 1
+                black_count -= len(flips)
+            for offset in offsets:
+                neighbour = index + offset
+                if (cells[neighbour] == EMPTY and
+                        neighbour not in in_candidates):
+                    in_candidates.add(neighbour)
+                    candidates.append(neighbour)
+            is_black = not is_black
+        if black_count > white_count:
+            return 1.0
+        if black_count < white_count:
+            return 0.0
+        return 0.5
+
+
+def _is_legal(cells, index, own, enemy, offsets):
+    for offset in offsets:
+        cur = index + offset
+        if cells[cur] != enemy:
+            continue
+        cur += offset
+        while cells[cur] == enemy:
+            cur += offset
+        if cells[cur] == own:
+            return True
+    return False
+
+
+def _get_flips(cells, index, own, enemy, offsets):
+    flips = []
+    for offset in offsets:
+        cur = index + offset
+        if cells[cur] != enemy:
+            continue
+        line = []
+        while cells[cur] == enemy:
+            line.append(cur)
+            cur += offset
+        if cells[cur] == own:
+            flips.extend(line)
+    return flips
+
+
+def _get_discs_count(game):
+    return game.score[game.get_cur_chip_type] + game.score[
+        game.get_enemy_chip_type]
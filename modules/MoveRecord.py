@@ -0,0 +1,11 @@
+from collections import namedtuple
+
+
+class MoveRecord(namedtuple('MoveRecord', ['point', 'chip_type', 'flips',
+                                           'available_moves', 'board_undo',
+                                           'cells_hash'])):
+    __slots__ = ()
+
+    @property
+    def score_delta(self):
+        return len(self.flips) + 1, -len(self.flips)
@@ -0,0 +1,129 @@
+import mmap
+import os
+import struct
+from .AlphaBetaAI import play_move
+from .BookError import BookError
+from .GameModel import GameModel
+
+
+MAGIC = b'RVBK'
+HEADER = struct.Struct('<4sIII')
+RECORD = struct.Struct('<QIh')
+SCORE_LIMIT = 2 ** 15 - 1
+
+
+class OpeningBook:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BookError('Файл книги дебютов пуст')
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise BookError('Файл книги дебютов поврежден')
+        magic, self.width, self.height, self.count = HEADER.unpack_from(
+            self._data)
+        if (magic != MAGIC or
+                len(self._data) != HEADER.size + self.count * RECORD.size):
+            self.close()
+            raise BookError('Файл книги дебютов поврежден')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def lookup(self, key):
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            cur_key, move_index, score = RECORD.unpack_from(
+                self._data, HEADER.size + middle * RECORD.size)
+            if cur_key < key:
+                low = middle + 1
+            elif cur_key > key:
+                high = middle
+            else:
+                return move_index, score
+        return None
+
+    def get_move(self, game):
+        if (game.width, game.height) != (self.width, self.height):
+            return None
+        entry = self.lookup(game.hash)
+        if entry is None:
+            return None
+        move = (entry[0] % game.width, entry[0] // game.width)
+        return move if move in game.available_moves else None
+
+    def items(self):
+        for i in range(self.count):
+            key, move_index, score = RECORD.unpack_from(
+                self._data, HEADER.size + i * RECORD.size)
+            yield key, (move_index, score)
+
+
+def get_book_path(directory, width, height):
+    return os.path.join(directory, 'book_{}x{}.bin'.format(width, height))
+
+
+def open_book(directory, width, height):
+    path = get_book_path(directory, width, height)
+    if not os.path.exists(path):
+        return None
+    return OpeningBook(path)
+
+
+def write_book(path, width, height, entries):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, width, height, len(entries)))
+        for key in sorted(entries):
+            move_index, score = entries[key]
+            score = max(-SCORE_LIMIT, min(SCORE_LIMIT, score))
+            f.write(RECORD.pack(key, move_index, score))
+    os.replace(tmp_path, path)
+
+
+def read_entries(path):
+    if not os.path.exists(path):
+        return {}
+    with OpeningBook(path) as book:
+        return dict(book.items())
+
+
+def grow_book(path, width, height, ai, games_count, plies, rnd,
+              variety=0.3):
+    entries = read_entries(path)
+    for _ in range(games_count):
+        game = GameModel(width, height)
+        for _ in range(plies):
+            if not game.is_running:
+                break
+            key = game.hash
+            if key in entries:
+                move_index = entries[key][0]
+                move = (move_index % width, move_index // width)
+            else:
+                move = ai.get_move(game)
+                entries[key] = (move[1] * width + move[0], ai.score)
+            if rnd.random() < variety:
+                move = rnd.choice(sorted(game.available_moves))
+            play_move(game, move)
+    write_book(path, width, height, entries)
+    return len(entries)
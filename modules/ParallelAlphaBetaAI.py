@@ -0,0 +1,103 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from .AlphaBetaAI import AlphaBetaAI, order_moves
+from .GameModel import GameModel
+from .TranspositionTable import TranspositionTable
+
+
+WORKER_TABLE_BYTES = 4 * 2 ** 20
+
+_worker_ai = None
+
+
+class ParallelAlphaBetaAI:
+    def __init__(self, time_limit=1.0, max_nodes=None, max_depth=64,
+                 workers=None, book=None):
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.book = book
+        self.workers = workers or os.cpu_count() or 1
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def get_move(self, game):
+        moves = order_moves(game, game.available_moves)
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        if len(moves) == 1:
+            return moves[0]
+        if self.book is not None:
+            book_move = self.book.get_move(game)
+            if book_move is not None:
+                return book_move
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.workers, initializer=_init_worker)
+        deadline = (None if self.time_limit is None
+                    else time.time() + self.time_limit)
+        snapshot = game.snapshot()
+        for depth in range(1, min(self.max_depth, game.empty_count) + 1):
+            scores = self._search_depth(snapshot, moves, depth, deadline)
+            if scores is None:
+                break
+            moves = [move for _, move in sorted(
+                zip(scores, moves), key=lambda pair: -pair[0])]
+            self.depth = depth
+            self.score = max(scores)
+        return moves[0]
+
+    def _search_depth(self, snapshot, moves, depth, deadline):
+        max_nodes = (None if self.max_nodes is None
+                     else self.max_nodes - self.nodes)
+        if max_nodes is not None and max_nodes <= 0:
+            return None
+        futures = [self._pool.submit(_search_move, snapshot, move, depth,
+                                     deadline, max_nodes)
+                   for move in moves]
+        timeout = None if deadline is None else max(0, deadline - time.time())
+        done, not_done = wait(futures, timeout)
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            return None
+        scores = []
+        for future in futures:
+            score, nodes = future.result()
+            self.nodes += nodes
+            if score is None:
+                return None
+            scores.append(score)
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            return None
+        return scores
+
+
+def _init_worker():
+    global _worker_ai
+    _worker_ai = AlphaBetaAI(table=TranspositionTable(WORKER_TABLE_BYTES))
+
+
+def _search_move(snapshot, move, depth, deadline, max_nodes):
+    game = GameModel.from_snapshot(snapshot)
+    _worker_ai.table.clear()
+    _worker_ai.time_limit = (None if deadline is None
+                             else deadline - time.time())
+    _worker_ai.max_nodes = max_nodes
+    score = _worker_ai.search_move(game, move, depth)
+    return score, _worker_ai.nodes
@@ -0,0 +1,3 @@
+class PatternError(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
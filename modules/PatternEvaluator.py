@@ -0,0 +1,177 @@
+import os
+import struct
+from array import array
+from .Board import BLACK, WHITE
+from .ChipType import ChipType
+from .GameRecord import replay
+from .PatternError import PatternError
+
+
+MAGIC = b'RVPT'
+HEADER = struct.Struct('<4sIII')
+TABLE_HEADER = struct.Struct('<I')
+SCALE = 64
+WEIGHT_LIMIT = 2 ** 15 - 1
+CORNER_SIZE = 3
+LINE_LENGTH = 8
+KINDS = ('corner', 'edge_x', 'edge_y', 'diagonal')
+
+
+def get_patterns(width, height):
+    corner = min(CORNER_SIZE, width, height)
+    corners = ((0, 0, 1, 1), (width - 1, 0, -1, 1),
+               (0, height - 1, 1, -1), (width - 1, height - 1, -1, -1))
+    patterns = []
+    for x, y, dx, dy in corners:
+        patterns.append((0, [(x + dx * i, y + dy * j) for j in range(corner)
+                             for i in range(corner)]))
+        patterns.append((1, [(x + dx * i, y)
+                             for i in range(min(LINE_LENGTH, width))]))
+        patterns.append((2, [(x, y + dy * i)
+                             for i in range(min(LINE_LENGTH, height))]))
+        patterns.append((3, [(x + dx * i, y + dy * i)
+                             for i in range(min(LINE_LENGTH, width, height))]))
+    return patterns
+
+
+class PatternIndex:
+    def __init__(self, game, patterns):
+        self.width = game.width
+        self.indices = [0] * len(patterns)
+        self.terms = [()] * (game.width * game.height)
+        terms = {}
+        for instance, (_, cells) in enumerate(patterns):
+            for pos, (x, y) in enumerate(cells):
+                terms.setdefault(y * game.width + x, []).append(
+                    (instance, 3 ** pos))
+        codes = game.board.get_codes()
+        for cell, cell_terms in terms.items():
+            self.terms[cell] = tuple(cell_terms)
+            code = codes[cell]
+            if code == BLACK or code == WHITE:
+                for instance, power in cell_terms:
+                    self.indices[instance] += code * power
+
+    def play(self, point, chip_type, flips):
+        self._update(point, chip_type, flips, 1)
+
+    def undo(self, point, chip_type, flips):
+        self._update(point, chip_type, flips, -1)
+
+    def _update(self, point, chip_type, flips, sign):
+        indices = self.indices
+        terms = self.terms
+        width = self.width
+        is_black = chip_type == ChipType.Black
+        place = (BLACK if is_black else WHITE) * sign
+        flip = -sign if is_black else sign
+        x, y = point
+        for instance, power in terms[y * width + x]:
+            indices[instance] += place * power
+        for x, y in flips:
+            for instance, power in terms[y * width + x]:
+                indices[instance] += flip * power
+
+
+class PatternEvaluator:
+    def __init__(self, width, height, tables=None):
+        self.width = width
+        self.height = height
+        self.patterns = get_patterns(width, height)
+        if tables is None:
+            tables = [array('h', bytes(2 * 3 ** len(cells)))
+                      for _, cells in self.patterns[:len(KINDS)]]
+        self.tables = tables
+        self._instance_tables = [tables[kind] for kind, _ in self.patterns]
+
+    def fits(self, game):
+        return (game.width, game.height) == (self.width, self.height)
+
+    def attach(self, game):
+        game.patterns = PatternIndex(game, self.patterns)
+        return game.patterns
+
+    @staticmethod
+    def detach(game):
+        del game.patterns
+
+    def evaluate(self, game):
+        score = 0
+        for table, index in zip(self._instance_tables,
+                                game.patterns.indices):
+            score += table[index]
+        return score if game.cur_player_is_black else -score
+
+    def get_features(self, game):
+        return [(kind, index) for (kind, _), index in zip(
+            self.patterns, PatternIndex(game, self.patterns).indices)]
+
+    def set_weights(self, weights):
+        for table, kind_weights in zip(self.tables, weights):
+            for i, weight in enumerate(kind_weights):
+                table[i] = max(-WEIGHT_LIMIT, min(WEIGHT_LIMIT,
+                                                  round(weight * SCALE)))
+
+    def save(self, path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.width, self.height,
+                                len(self.tables)))
+            for table in self.tables:
+                f.write(TABLE_HEADER.pack(len(table)))
+                f.write(table.tobytes())
+        os.replace(tmp_path, path)
+
+
+def load_evaluator(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise PatternError('Файл весов поврежден')
+    magic, width, height, count = HEADER.unpack_from(data)
+    evaluator = PatternEvaluator(width, height)
+    if magic != MAGIC or count != len(evaluator.tables):
+        raise PatternError('Файл весов поврежден')
+    pos = HEADER.size
+    tables = []
+    for table in evaluator.tables:
+        if pos + TABLE_HEADER.size > len(data):
+            raise PatternError('Файл весов поврежден')
+        length, = TABLE_HEADER.unpack_from(data, pos)
+        pos += TABLE_HEADER.size
+        if length != len(table) or pos + 2 * length > len(data):
+            raise PatternError('Файл весов поврежден')
+        tables.append(array('h', data[pos:pos + 2 * length]))
+        pos += 2 * length
+    if pos != len(data):
+        raise PatternError('Файл весов поврежден')
+    return PatternEvaluator(width, height, tables)
+
+
+def get_samples(records, evaluator, skip=0):
+    for record in records:
+        if (record.width, record.height) != (evaluator.width,
+                                             evaluator.height):
+            continue
+        target = record.black_score - record.white_score
+        for ply, (game, _) in enumerate(replay(record)):
+            if ply >= skip:
+                yield evaluator.get_features(game), target
+
+
+def train(evaluator, samples, epochs=10, rate=0.01):
+    weights = [[table[i] / SCALE for i in range(len(table))]
+               for table in evaluator.tables]
+    error = 0.0
+    for _ in range(epochs):
+        error = 0.0
+        for features, target in samples:
+            diff = target - sum(weights[kind][index]
+                                for kind, index in features)
+            error += diff * diff
+            step = rate * diff
+            for kind, index in features:
+                weights[kind][index] += step
+        error = (error / len(samples)) ** 0.5 if samples else 0.0
+    evaluator.set_weights(weights)
+    return error
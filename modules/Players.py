@@ -0,0 +1,37 @@
+from .AlphaBetaAI import AlphaBetaAI
+from .MonteCarloAI import MonteCarloAI
+from .ParallelAlphaBetaAI import ParallelAlphaBetaAI
+from .PatternEvaluator import load_evaluator
+from .RandomAI import RandomAI
+
+
+ENGINES = {'alphabeta': AlphaBetaAI,
+           'mcts': MonteCarloAI,
+           'parallel': ParallelAlphaBetaAI,
+           'random': RandomAI}
+OPTIONS = {'time': ('time_limit', float),
+           'nodes': ('max_nodes', int),
+           'depth': ('max_depth', int),
+           'playouts': ('max_playouts', int),
+           'workers': ('workers', int),
+           'seed': ('seed', int),
+           'weights': ('evaluator', load_evaluator)}
+
+
+def parse_player(spec):
+    name, _, str_options = spec.partition(':')
+    if name not in ENGINES:
+        raise ValueError('Неизвестный ИИ: ' + name)
+    options = {}
+    for str_option in filter(None, str_options.split(',')):
+        key, _, value = str_option.partition('=')
+        if key not in OPTIONS:
+            raise ValueError('Неизвестный параметр ИИ: ' + key)
+        arg_name, arg_type = OPTIONS[key]
+        options[arg_name] = arg_type(value)
+    return name, options
+
+
+def create_player(spec, **defaults):
+    name, options = parse_player(spec)
+    return ENGINES[name](**dict(defaults, **options))
@@ -0,0 +1,180 @@
+import struct
+from collections import namedtuple
+from .Board import CODES, TYPES, EMPTY
+from .ChipType import ChipType
+from .EndGame import EndGame
+from .ProtocolError import ProtocolError
+
+
+LENGTH = struct.Struct('<I')
+TYPE = struct.Struct('<B')
+PARAMS = struct.Struct('<III')
+POINT = struct.Struct('<II')
+GAME_ID = struct.Struct('<I')
+TOKEN = struct.Struct('<Q')
+DELTA_HEADER = struct.Struct('<IIBIII')
+RESULT = struct.Struct('<IIB')
+MAX_MESSAGE_LEN = 2 ** 26
+
+JOIN = 1
+TEXT = 2
+START = 3
+MOVE_REQUEST = 4
+MOVE = 5
+ERROR = 6
+STATE_DELTA = 7
+GAME_OVER = 8
+WATCH = 9
+RESUME = 10
+
+FINISHED = 0
+DISCONNECTED = 1
+
+Message = namedtuple('Message', ['type', 'value'])
+Start = namedtuple('Start', ['chip_type', 'game_id', 'token', 'snapshot'])
+Delta = namedtuple('Delta', ['point', 'chip_type', 'flips', 'black_score',
+                             'white_score'])
+Result = namedtuple('Result', ['black_score', 'white_score', 'reason'])
+
+
+def _frame(message_type, payload=b''):
+    return (LENGTH.pack(len(payload) + TYPE.size) + TYPE.pack(message_type) +
+            payload)
+
+
+def encode_join(params=None):
+    return _frame(JOIN, b'' if params is None else PARAMS.pack(*params))
+
+
+def encode_text(text):
+    return _frame(TEXT, text.encode())
+
+
+def encode_start(chip_type, game_id, game, token=0):
+    code = EMPTY if chip_type is None else CODES[chip_type]
+    return _frame(START, TYPE.pack(code) + GAME_ID.pack(game_id) +
+                  TOKEN.pack(token) + game.snapshot())
+
+
+def encode_resume(game_id, token):
+    return _frame(RESUME, GAME_ID.pack(game_id) + TOKEN.pack(token))
+
+
+def encode_watch(game_id=None):
+    return _frame(WATCH, b'' if game_id is None else GAME_ID.pack(game_id))
+
+
+def encode_move_request():
+    return _frame(MOVE_REQUEST)
+
+
+def encode_move(point):
+    return _frame(MOVE, POINT.pack(*point))
+
+
+def encode_error(text):
+    return _frame(ERROR, text.encode())
+
+
+def encode_delta(record, game):
+    x, y = record.point
+    payload = [DELTA_HEADER.pack(x, y, CODES[record.chip_type],
+                          game.score[ChipType.Black],
+                          game.score[ChipType.White], len(record.flips))]
+    payload.extend(POINT.pack(*point) for point in record.flips)
+    return _frame(STATE_DELTA, b''.join(payload))
+
+
+def encode_game_over(game, reason=FINISHED):
+    return _frame(GAME_OVER, RESULT.pack(game.score[ChipType.Black],
+                                      game.score[ChipType.White], reason))
+
+
+def decode(payload):
+    try:
+        message_type, = TYPE.unpack_from(payload)
+        data = payload[TYPE.size:]
+        if message_type == JOIN:
+            return Message(JOIN, PARAMS.unpack(data) if data else None)
+        if message_type in (TEXT, ERROR):
+            return Message(message_type, data.decode())
+        if message_type == START:
+            game_id, = GAME_ID.unpack_from(data, TYPE.size)
+            token, = TOKEN.unpack_from(data, TYPE.size + GAME_ID.size)
+            return Message(START, Start(
+                TYPES[data[0]], game_id, token,
+                data[TYPE.size + GAME_ID.size + TOKEN.size:]))
+        if message_type == WATCH:
+            return Message(WATCH, GAME_ID.unpack(data)[0] if data else None)
+        if message_type == RESUME:
+            game_id, = GAME_ID.unpack_from(data)
+            token, = TOKEN.unpack(data[GAME_ID.size:])
+            return Message(RESUME, (game_id, token))
+        if message_type == MOVE_REQUEST:
+            return Message(MOVE_REQUEST, None)
+        if message_type == MOVE:
+            return Message(MOVE, POINT.unpack(data))
+        if message_type == STATE_DELTA:
+            return Message(STATE_DELTA, _decode_delta(data))
+        if message_type == GAME_OVER:
+            return Message(GAME_OVER, Result(*RESULT.unpack(data)))
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise ProtocolError('Получено поврежденное сообщение')
+    raise ProtocolError('Получено сообщение неизвестного типа')
+
+
+def _decode_delta(data):
+    x, y, code, black_score, white_score, count = \
+        DELTA_HEADER.unpack_from(data)
+    if len(data) != DELTA_HEADER.size + count * POINT.size:
+        raise struct.error()
+    flips = [POINT.unpack_from(data, DELTA_HEADER.size + i * POINT.size)
+             for i in range(count)]
+    return Delta((x, y), TYPES[code], flips, black_score, white_score)
+
+
+def apply_delta(game, delta):
+    if (delta.chip_type != game.get_cur_chip_type or
+            delta.point not in game.available_moves):
+        raise ProtocolError('Состояние игры рассинхронизировано с сервером')
+    try:
+        record = game.make_move_to(delta.point)
+    except EndGame as e:
+        record = e.record
+    if (sorted(record.flips) != sorted(delta.flips) or
+            game.score[ChipType.Black] != delta.black_score or
+            game.score[ChipType.White] != delta.white_score):
+        raise ProtocolError('Состояние игры рассинхронизировано с сервером')
+    return record
+
+
+def _check_length(header):
+    length, = LENGTH.unpack(header)
+    if not TYPE.size <= length <= MAX_MESSAGE_LEN:
+        raise ProtocolError('Получено сообщение недопустимой длины')
+    return length
+
+
+async def read_message(reader):
+    length = _check_length(await reader.readexactly(LENGTH.size))
+    return decode(await reader.readexactly(length))
+
+
+def receive_message(sock):
+    header = _receive_exactly(sock, LENGTH.size)
+    if header is None:
+        return None
+    payload = _receive_exactly(sock, _check_length(header))
+    if payload is None:
+        return None
+    return decode(payload)
+
+
+def _receive_exactly(sock, size):
+    res = bytearray()
+    while len(res) < size:
+        data = sock.recv(size - len(res))
+        if not data:
+            return None
+        res += data
+    return bytes(res)
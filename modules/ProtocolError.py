@@ -0,0 +1,3 @@
+class ProtocolError(Exception):
+    def __init__(self, msg):
+        super().__init__(msg)
@@ -0,0 +1,9 @@
+import random
+
+
+class RandomAI:
+    def __init__(self, time_limit=None, max_nodes=None, seed=None):
+        self.rnd = random.Random(seed)
+
+    def get_move(self, game):
+        return self.rnd.choice(sorted(game.available_moves))
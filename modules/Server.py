@@ -1,85 +1,269 @@
+import asyncio
+import secrets
 import socket
+import threading
 import time
-from . import ConsoleUI as consUI
+from . import Protocol
 from .ChipType import ChipType
+from .Connection import Connection
 from .EndGame import EndGame
+from .GameModel import GameModel
+from .GameRecord import GameRecorder, write_record
+from .GameStore import GameStore, DEFAULT_WINDOW
+from .LiveGame import LiveGame
+from .Lobby import Lobby
+from .LobbyError import LobbyError
 from .MoveError import MoveError
 
 
-MAX_DATA_LEN = 1024
+LISTEN_BACKLOG = 128
+SPECTATOR_QUEUE = 64
+RESUME_TIMEOUT = 300
 
 
 class Server:
-    def __init__(self, port, game):
-        self.game = game
-        self.port = port
-        self.host = socket.gethostbyname(socket.gethostname())
-        self.clients = {}
-        self._init_socket()
-
-    def _init_socket(self):
+    def __init__(self, port, host=None, store_dir=None,
+                 store_window=DEFAULT_WINDOW, resume_timeout=RESUME_TIMEOUT,
+                 metrics=None, records_path=None):
+        self.host = host or socket.gethostbyname(socket.gethostname())
+        self.lobby = Lobby()
+        self.games = set()
+        self.live_games = {}
+        self.pending_games = {}
+        self.resume_timeout = resume_timeout
+        self.metrics = metrics
+        self.records_path = records_path
+        self.store = (None if store_dir is None
+                      else GameStore(store_dir, store_window))
+        self._last_game_id = 0
+        self.ready = threading.Event()
+        self._loop = None
+        self._stopped = None
+        self._init_socket(port)
+
+    def _init_socket(self, port):
         self.socket = socket.socket()
-        self.socket.bind((self.host, self.port))
-        self.socket.listen(2)
+        self.socket.bind((self.host, port))
+        self.socket.listen(LISTEN_BACKLOG)
+        self.port = self.socket.getsockname()[1]
 
     def start(self):
-        conn_b, addr_b = self.socket.accept()
-        self.clients[ChipType.Black] = conn_b
-        conn_b.send(('Вы успешно подключились к серверу '
-                     + str(self.host) + ':' + str(self.port) +
-                    '. Пожалуйста, дождитесь подключения соперника.').encode())
-        conn_w, addr_w = self.socket.accept()
-        self.clients[ChipType.White] = conn_w
-        conn_w.send(('Вы успешно подключились к серверу '
-                     + str(self.host) + ':' + str(self.port) +
-                    '. Ваш противник к серверу уже подключился').encode())
-        conn_b.send('Игра началась. Вы будете играть за черных. Удачи!'
-                    .encode())
-        conn_w.send('Игра началась. Вы будете играть за белых. Удачи!'
-                    .encode())
-        time.sleep(0.1)
-
-        self.start_game()
-
-        conn_b.close()
-        conn_w.close()
-        self.socket.close()
-
-    def start_game(self):
-        while True:
-            try:
-                self.send_cur_game_condition()
-                self.make_move_by(self.clients[self.game.get_cur_chip_type])
-            except EndGame:
-                self.tell_clients_about_ending()
-                break
+        asyncio.run(self.serve())
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    async def serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        store_task = None
+        if self.store is not None:
+            self._restore_games(self.store.load())
+            store_task = asyncio.create_task(self.store.run())
+        server = await asyncio.start_server(self._handle_client,
+                                            sock=self.socket)
+        self.ready.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            server.close()
+            for task in list(self.games):
+                task.cancel()
+            await asyncio.gather(*self.games, return_exceptions=True)
+            if store_task is not None:
+                self.store.close()
+                await store_task
+
+    def _restore_games(self, stored_games):
+        for stored in stored_games.values():
+            tokens = dict(zip((ChipType.Black, ChipType.White),
+                              stored.tokens))
+            live = LiveGame(stored.id, stored.game, {}, tokens)
+            self.pending_games[live.id] = live
+            self._last_game_id = max(self._last_game_id, live.id)
+            self._add_task(self._expire_pending(live))
+
+    def _add_task(self, coro):
+        task = asyncio.create_task(coro)
+        self.games.add(task)
+        task.add_done_callback(self.games.discard)
+
+    async def _handle_client(self, reader, writer):
+        conn = Connection(reader, writer, metrics=self.metrics)
+        conn.start()
+        try:
+            message = await conn.receive()
+        except ConnectionError:
+            conn.close()
+            return
+        if message.type == Protocol.WATCH:
+            self._watch(conn, message.value)
+            return
+        if message.type == Protocol.RESUME:
+            self._resume(conn, *message.value)
+            return
+        if message.type != Protocol.JOIN:
+            conn.send(Protocol.encode_error(
+                'Неверный запрос на подключение к игре'))
+            conn.close()
+            return
+        greeting = 'Вы успешно подключились к серверу {}:{}. '.format(
+            self.host, self.port)
+        try:
+            pair = self.lobby.join(conn, message.value)
+        except LobbyError as e:
+            conn.send(Protocol.encode_error(str(e)))
+            conn.close()
+            return
+        if pair is None:
+            conn.send(Protocol.encode_text(
+                greeting + 'Пожалуйста, дождитесь подключения соперника.'))
+            return
+        conn.send(Protocol.encode_text(
+            greeting + 'Ваш противник к серверу уже подключился'))
+        black, white, params = pair
+        self._add_task(self._play_game(params, black, white))
+
+    def _watch(self, conn, game_id):
+        if game_id is None and self.live_games:
+            game_id = min(self.live_games)
+        if game_id not in self.live_games:
+            conn.send(Protocol.encode_error('Игра не найдена'))
+            conn.close()
+            return
+        conn.max_queue = SPECTATOR_QUEUE
+        self.live_games[game_id].add_spectator(conn)
+
+    def _resume(self, conn, game_id, token):
+        live = self.pending_games.get(game_id)
+        chip_type = None if live is None else live.get_chip_type_by(token)
+        if chip_type is None:
+            conn.send(Protocol.encode_error('Игра не найдена'))
+            conn.close()
+            return
+        if chip_type in live.players:
+            live.players[chip_type].close()
+        live.players[chip_type] = conn
+        if len(live.players) < 2 or any(
+                player.is_closed for player in live.players.values()):
+            conn.send(Protocol.encode_text(
+                'Пожалуйста, дождитесь подключения соперника.'))
+            return
+        del self.pending_games[game_id]
+        self._add_task(self._run_game(live))
 
-    def make_move_by(self, conn):
+    async def _expire_pending(self, live):
+        await asyncio.sleep(self.resume_timeout)
+        if self.pending_games.get(live.id) is not live:
+            return
+        del self.pending_games[live.id]
+        self.store.end_game(live.id)
+        for conn in live.players.values():
+            conn.send(Protocol.encode_game_over(live.game,
+                                                Protocol.DISCONNECTED))
+        live.close()
+
+    async def _play_game(self, params, black, white):
+        clients = {ChipType.Black: black, ChipType.White: white}
+        try:
+            game = GameModel(*params)
+        except Exception as e:
+            self._send_to_all(clients, Protocol.encode_error(str(e)))
+            self._close_all(clients)
+            return
+        self._last_game_id += 1
+        tokens = {chip_type: secrets.randbits(64) for chip_type in clients}
+        live = LiveGame(self._last_game_id, game, clients, tokens)
+        if self.records_path is not None:
+            live.recorder = GameRecorder(game)
+        if self.store is not None:
+            self.store.add_game(live.id, game, (tokens[ChipType.Black],
+                                                tokens[ChipType.White]))
+        await self._run_game(live)
+
+    async def _run_game(self, live):
+        game = live.game
+        clients = live.players
+        metrics = self.metrics
+        self.live_games[live.id] = live
+        live.start()
+        if metrics is not None:
+            metrics.inc('server_games_total')
+        try:
+            while game.is_running:
+                turn_start = time.perf_counter()
+                record = await self._make_move_by(
+                    live, clients[game.get_cur_chip_type],
+                    clients[game.get_enemy_chip_type])
+                if self.store is not None:
+                    self.store.add_move(live.id, game, record.point)
+                if live.recorder is not None:
+                    live.recorder.add(record)
+                live.broadcast(Protocol.encode_delta(record, game))
+                if metrics is not None:
+                    metrics.observe('server_turn_seconds',
+                                    time.perf_counter() - turn_start,
+                                    (('game', live.id),))
+            if live.recorder is not None:
+                write_record(self.records_path, live.recorder.get_record(game))
+            live.broadcast(Protocol.encode_game_over(game), False)
+        except ConnectionError:
+            live.broadcast(Protocol.encode_game_over(
+                game, Protocol.DISCONNECTED), False)
+        finally:
+            del self.live_games[live.id]
+            live.close()
+        if self.store is not None:
+            self.store.end_game(live.id)
+
+    async def _make_move_by(self, live, conn, enemy):
         while True:
+            conn.send(Protocol.encode_move_request())
+            wait_start = time.perf_counter()
+            message = await Server._receive_from(conn, enemy)
+            if self.metrics is not None:
+                self.metrics.observe(
+                    'server_client_wait_seconds',
+                    time.perf_counter() - wait_start,
+                    (('client', conn.get_address()), ('game', live.id)))
             try:
-                conn.send('GET'.encode())
-                str_move = conn.recv(MAX_DATA_LEN).decode()
-                move = self.parse_str_move(str_move)
-                self.game.make_move_to(move)
-                break
+                if message.type != Protocol.MOVE:
+                    raise MoveError('Ожидался ход')
+                record = live.game.make_move_to(message.value)
+            except EndGame as e:
+                record = e.record
             except MoveError as e:
-                conn.send(str(e).encode())
-
-    def send_cur_game_condition(self):
-        encoded_cur_condition = consUI.get_cur_condition(self.game).encode()
-        self.clients[ChipType.Black].send(encoded_cur_condition)
-        self.clients[ChipType.White].send(encoded_cur_condition)
-
-    def tell_clients_about_ending(self):
-        res_msg_list = []
-        res_msg_list.append(consUI.get_cur_condition(self.game))
-        res_msg_list.append('Спасибо за игру!')
-        res_encoded_msg = ''.join(res_msg_list).encode()
-        self.clients[ChipType.Black].send(res_encoded_msg)
-        self.clients[ChipType.White].send(res_encoded_msg)
-        time.sleep(3)
-        self.clients[ChipType.Black].send('END'.encode())
-        self.clients[ChipType.White].send('END'.encode())
+                conn.send(Protocol.encode_error(str(e)))
+                continue
+            return record
+
+    @staticmethod
+    async def _receive_from(conn, enemy):
+        receiving = asyncio.ensure_future(conn.receive())
+        enemy_closed = asyncio.ensure_future(enemy.closed.wait())
+        try:
+            await asyncio.wait({receiving, enemy_closed},
+                               return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            receiving.cancel()
+            enemy_closed.cancel()
+            raise
+        enemy_closed.cancel()
+        if not receiving.done():
+            receiving.cancel()
+            raise ConnectionError('Соединение разорвано')
+        return receiving.result()
+
+    @staticmethod
+    def _send_to_all(clients, data):
+        for conn in clients.values():
+            conn.send(data)
+
+    @staticmethod
+    def _close_all(clients):
+        for conn in clients.values():
+            conn.close()
 
     @staticmethod
     def parse_str_move(str_move):
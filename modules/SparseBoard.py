@@ -0,0 +1,43 @@
+from .Board import Board, EMPTY, BLACK, WHITE, get_rays
+from .BoardMap import BoardMap
+
+
+class SparseBoard(Board):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = _SparseCells()
+        self.steps, self.lengths = get_rays(width, height)
+        self.frontier = set()
+        self.legal = {BLACK: set(), WHITE: set()}
+        self.map = BoardMap(self)
+
+    def copy(self):
+        res = SparseBoard.__new__(SparseBoard)
+        res.width = self.width
+        res.height = self.height
+        res.cells = _SparseCells(self.cells)
+        res.steps = self.steps
+        res.lengths = self.lengths
+        res.frontier = set(self.frontier)
+        res.legal = {BLACK: set(self.legal[BLACK]),
+                     WHITE: set(self.legal[WHITE])}
+        res.map = BoardMap(res)
+        return res
+
+    def get_codes(self):
+        codes = bytearray(self.width * self.height)
+        for index, code in self.cells.items():
+            codes[index] = code
+        return bytes(codes)
+
+
+class _SparseCells(dict):
+    def __missing__(self, index):
+        return EMPTY
+
+    def __setitem__(self, index, code):
+        if code == EMPTY:
+            self.pop(index, None)
+        else:
+            super().__setitem__(index, code)
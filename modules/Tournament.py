@@ -0,0 +1,130 @@
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .AlphaBetaAI import play_move
+from .ChipType import ChipType
+from .GameModel import GameModel
+from .GameRecord import GameRecorder
+from .Players import ENGINES, parse_player
+
+
+GameTask = namedtuple('GameTask', ['index', 'black', 'white', 'width',
+                                   'height', 'rocks_count', 'seed'])
+GameResult = namedtuple('GameResult', ['task', 'black_score', 'white_score',
+                                       'moves_count', 'duration', 'record'],
+                        defaults=(None,))
+
+
+def create_tasks(players, sizes, rocks_counts, games_count, seed=0):
+    rnd = random.Random(seed)
+    tasks = []
+    pairs = [(first, second) for i, first in enumerate(players)
+             for second in players[i + 1:]] or [(players[0], players[0])]
+    for width, height in sizes:
+        for rocks_count in rocks_counts:
+            for first, second in pairs:
+                for i in range(games_count):
+                    black, white = (first, second) if i % 2 == 0 else (
+                        second, first)
+                    tasks.append(GameTask(len(tasks), black, white, width,
+                                          height, rocks_count,
+                                          rnd.getrandbits(32)))
+    return tasks
+
+
+def play_game(task):
+    start = time.perf_counter()
+    game = GameModel(task.width, task.height, task.rocks_count,
+                     rocks_seed=task.seed)
+    players = {ChipType.Black: _create_player(task.black, task.seed),
+               ChipType.White: _create_player(task.white, task.seed + 1)}
+    recorder = GameRecorder(game)
+    while game.is_running:
+        recorder.add(play_move(
+            game, players[game.get_cur_chip_type].get_move(game)))
+    return GameResult(task, game.score[ChipType.Black],
+                      game.score[ChipType.White], len(recorder.moves),
+                      time.perf_counter() - start, recorder.get_record(game))
+
+
+def _create_player(spec, seed):
+    name, options = parse_player(spec)
+    if name in ('random', 'mcts'):
+        options.setdefault('seed', seed)
+    return ENGINES[name](**options)
+
+
+def run_tournament(tasks, workers=None, on_result=None):
+    summary = TournamentSummary()
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(play_game, task) for task in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            summary.add(result)
+            if on_result is not None:
+                on_result(result, summary)
+    return summary
+
+
+class TournamentSummary:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.games_count = 0
+        self.moves_count = 0
+        self.players = {}
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    @property
+    def games_per_second(self):
+        return self.games_count / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def average_length(self):
+        return self.moves_count / self.games_count if self.games_count else 0
+
+    def add(self, result):
+        self.games_count += 1
+        self.moves_count += result.moves_count
+        black_diff = result.black_score - result.white_score
+        self._add_player_result(result.task.black, black_diff)
+        self._add_player_result(result.task.white, -black_diff)
+
+    def _add_player_result(self, player, diff):
+        stats = self.players.setdefault(
+            player, {'games': 0, 'wins': 0, 'draws': 0, 'losses': 0})
+        stats['games'] += 1
+        if diff > 0:
+            stats['wins'] += 1
+        elif diff < 0:
+            stats['losses'] += 1
+        else:
+            stats['draws'] += 1
+
+    def get_win_rate(self, player):
+        stats = self.players[player]
+        return (stats['wins'] + stats['draws'] / 2) / stats['games']
+
+    def to_dict(self):
+        return {'games': self.games_count,
+                'average_length': self.average_length,
+                'games_per_second': self.games_per_second,
+                'elapsed': self.elapsed,
+                'players': {player: dict(stats, win_rate=self.get_win_rate(
+                    player)) for player, stats in self.players.items()}}
+
+    def report(self):
+        res = ['Партий: {}, средняя длина: {:.1f} ходов, {:.2f} партий/с'
+               .format(self.games_count, self.average_length,
+                       self.games_per_second)]
+        for player in sorted(self.players, key=self.get_win_rate,
+                             reverse=True):
+            stats = self.players[player]
+            res.append('{}: {:.1%} (+{} ={} -{})'.format(
+                player, self.get_win_rate(player), stats['wins'],
+                stats['draws'], stats['losses']))
+        return '\n'.join(res)
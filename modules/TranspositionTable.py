@@ -0,0 +1,70 @@
+from array import array
+
+
+EXACT, LOWER, UPPER = 0, 1, 2
+ENTRY_SIZE = 24
+MAX_DEPTH = 0xFF
+OCCUPIED = 1 << 18
+DEFAULT_MAX_BYTES = 16 * 2 ** 20
+
+
+class TranspositionTable:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.buckets_count = max(1, max_bytes // (ENTRY_SIZE * 2))
+        self.size = self.buckets_count * 2
+        self._zeros = bytes(8 * self.size)
+        self.keys = array('Q', self._zeros)
+        self.scores = array('q', self._zeros)
+        self.infos = array('Q', self._zeros)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+
+    @property
+    def memory(self):
+        return self.size * ENTRY_SIZE
+
+    @property
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def new_search(self):
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        for arr in (self.keys, self.scores, self.infos):
+            memoryview(arr).cast('B')[:] = self._zeros
+        self.generation = 0
+        self.hits = self.misses = self.stores = self.replacements = 0
+
+    def probe(self, key):
+        slot = (key % self.buckets_count) * 2
+        for i in (slot, slot + 1):
+            if self.keys[i] == key and self.infos[i] & OCCUPIED:
+                self.hits += 1
+                info = self.infos[i]
+                return (info & 0xFF, (info >> 8) & 0x3,
+                        self.scores[i], (info >> 19) - 1)
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, flag, score, move_index=-1):
+        depth = min(depth, MAX_DEPTH)
+        slot = (key % self.buckets_count) * 2
+        if self.keys[slot + 1] == key and self.infos[slot + 1] & OCCUPIED:
+            slot += 1
+        elif self.keys[slot] != key or not self.infos[slot] & OCCUPIED:
+            info = self.infos[slot]
+            stale = (info >> 10) & 0xFF != self.generation
+            if info & OCCUPIED and not stale and depth < info & 0xFF:
+                slot += 1
+            if self.infos[slot] & OCCUPIED:
+                self.replacements += 1
+        self.stores += 1
+        self.keys[slot] = key
+        self.scores[slot] = score
+        self.infos[slot] = (depth | flag << 8 | self.generation << 10 |
+                            OCCUPIED | (move_index + 1) << 19)
@@ -0,0 +1,46 @@
+from functools import lru_cache
+from .Board import CODES
+
+
+MASK = 0xFFFFFFFFFFFFFFFF
+TABLE_AREA_LIMIT = 1 << 16
+SIDE_KEY_SEED = 1 << 62
+GEOMETRY_KEY_SEED = 1 << 61
+
+
+def mix(value):
+    value = (value + 0x9E3779B97F4A7C15) & MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK
+    return value ^ (value >> 31)
+
+
+class _MixedKeys:
+    def __getitem__(self, index):
+        return mix(index)
+
+
+@lru_cache(maxsize=8)
+def get_cell_keys(area):
+    if area > TABLE_AREA_LIMIT:
+        return _MixedKeys()
+    return tuple(mix(i) for i in range(area * 4))
+
+
+SIDE_KEY = mix(SIDE_KEY_SEED)
+
+
+def get_geometry_key(width, height):
+    return mix(GEOMETRY_KEY_SEED ^ (width << 32) ^ height)
+
+
+def compute_hash(game):
+    keys = get_cell_keys(game.width * game.height)
+    res = get_geometry_key(game.width, game.height)
+    for x, y in game.map:
+        chip_type = game.board.get((x, y))
+        if chip_type is not None:
+            res ^= keys[(y * game.width + x) * 4 + CODES[chip_type]]
+    if not game.cur_player_is_black:
+        res ^= SIDE_KEY
+    return res
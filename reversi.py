@@ -1,19 +1,35 @@
 import argparse
-import time
+import os
 import socket
+import sys
+import time
 
 from threading import Thread
 
-from modules import ConsoleUI as consUI
+from modules import Protocol
+from modules.Engine import Engine
+from modules.EndgameSolver import EndgameSolver
+from modules.OpeningBook import open_book
+from modules.Players import ENGINES as AI_ENGINES
 from modules.ChipType import ChipType
 from modules.EndGame import EndGame
+from modules.FieldRenderer import FieldRenderer
 from modules.GameModel import GameModel
+from modules.GameStore import DEFAULT_WINDOW
+from modules.GameRecord import GameRecorder, write_record
 from modules.GameType import GameType
+from modules.Metrics import Metrics
+from modules.MetricsSink import create_sink
+from modules.MonteCarloAI import MonteCarloAI
 from modules.MoveError import MoveError
+from modules.PatternEvaluator import load_evaluator
+from modules.ProtocolError import ProtocolError
 from modules.Server import Server
 
 
-MAX_DATA_LEN = 1024
+RECONNECT_ATTEMPTS = 30
+RECONNECT_DELAY = 1
+BOOKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'books')
 
 
 def main():
@@ -21,82 +37,237 @@ def main():
     set_parser(parser)
     args = parser.parse_args()
     game_type = get_game_type(args)
+    if args.view is not None:
+        FieldRenderer.viewport = parse_viewport(args.view)
+    metrics, sink = create_metrics(args)
+    try:
+        run_game(args, game_type, metrics)
+    finally:
+        if sink is not None:
+            sink.close()
+
 
+def run_game(args, game_type, metrics=None):
     if game_type == GameType.Offline:
         game_args = parse_args_for_game(args)
-        play_offline(GameModel(*game_args), parse_ai_chiptype(args))
+        play_offline(GameModel(*game_args, rocks_seed=args.rocks_seed),
+                     parse_ai_chiptype(args),
+                     create_ai(args, game_args), args.ansi, args.record)
     elif game_type == GameType.Online_server:
-        game_args = parse_args_for_game(args)
-        play_online(args.port, args.address, GameModel(*game_args))
+        play_online(args.port, args.address, parse_args_for_game(args),
+                    args.ansi, args.store, metrics, args.record)
+    elif game_type == GameType.Dedicated_server:
+        run_server(args.server_port, args.store, args.durability, metrics,
+                   args.record)
+    elif game_type == GameType.Online_watch:
+        watch_online(args.watch_address, args.ansi)
+    elif game_type == GameType.Online_resume:
+        resume_online(args.resume_address, args.ansi)
+    elif game_type == GameType.Engine:
+        Engine(args.engine, time_limit=args.time,
+               max_nodes=args.nodes).run(sys.stdin, sys.stdout)
     else:
-        play_online(args.port, args.address)
+        game_args = None
+        if args.size is not None or args.rocks:
+            game_args = parse_args_for_game(args)
+        play_online(args.port, args.address, game_args, args.ansi)
+
 
+def create_metrics(args):
+    if args.metrics is None:
+        return None, None
+    metrics = Metrics()
+    GameModel.metrics = metrics
+    return metrics, create_sink(metrics, args.metrics, args.metrics_interval)
 
-def play_online(port, address, game=None):
+
+def run_server(port, store_dir=None, durability=DEFAULT_WINDOW,
+               metrics=None, records_path=None):
+    server = Server(port, store_dir=store_dir, store_window=durability,
+                    metrics=metrics, records_path=records_path)
+    print('Сервер запущен на {}:{}'.format(server.host, server.port))
+    try:
+        server.start()
+    except KeyboardInterrupt:
+        pass
+
+
+def play_online(port, address, game_args=None, ansi=False, store_dir=None,
+                metrics=None, records_path=None):
     if port is not None:
-        server = Server(port, game)
-        server_thread = Thread(target=server.start)
+        server = Server(port, store_dir=store_dir, metrics=metrics,
+                        records_path=records_path)
+        server_thread = Thread(target=server.start, daemon=True)
         server_thread.start()
+        server.ready.wait()
         address = server.host
     else:
         address, port = parse_address(address)
-    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    client_socket.connect((address, port))
+    client_socket = socket.create_connection((address, port))
+    client_socket.sendall(Protocol.encode_join(game_args))
+    run_client(client_socket, ansi, (address, port))
+
 
+def watch_online(address, ansi=False):
+    address, str_port, *str_game_id = address.split(':')
+    game_id = int(str_game_id[0]) if str_game_id else None
+    client_socket = socket.create_connection((address, int(str_port)))
+    client_socket.sendall(Protocol.encode_watch(game_id))
+    run_client(client_socket, ansi)
+
+
+def resume_online(address, ansi=False):
+    address, str_port, str_game_id, str_token = address.split(':')
+    client_socket = socket.create_connection((address, int(str_port)))
+    client_socket.sendall(Protocol.encode_resume(int(str_game_id),
+                                                 int(str_token)))
+    run_client(client_socket, ansi, (address, int(str_port)))
+
+
+def run_client(client_socket, ansi=False, server_address=None):
+    game = renderer = start = resume = None
     while True:
-        data = client_socket.recv(MAX_DATA_LEN).decode()
-        if data == 'GET':
-            str_move = ""
-            while not str_move:
-                str_move = input('Ваш ход: ')
-            client_socket.send(str_move.encode())
-        elif data == 'END':
+        try:
+            message = Protocol.receive_message(client_socket)
+        except OSError:
+            message = None
+        except ProtocolError as e:
+            print(str(e))
+            break
+        if message is None:
+            client_socket.close()
+            client_socket = None
+            if resume is not None and server_address is not None:
+                print('Соединение с сервером разорвано. Переподключение...')
+                client_socket = reconnect(server_address, resume)
+                resume = None
+            if client_socket is None:
+                print('Соединение с сервером разорвано')
+                return
+            continue
+        if message.type in (Protocol.TEXT, Protocol.ERROR):
+            print(message.value)
+        elif message.type == Protocol.START:
+            start = message.value
+            game = GameModel.from_snapshot(start.snapshot)
+            renderer = FieldRenderer(game, ansi)
+            if start.chip_type is None:
+                print('Вы наблюдаете за игрой №{}.'.format(start.game_id))
+            else:
+                resume = (start.game_id, start.token)
+                print('Игра №{} началась. Вы будете играть за {}. Удачи!'
+                      .format(start.game_id, 'черных'
+                              if start.chip_type == ChipType.Black
+                              else 'белых'))
+                if server_address is not None:
+                    print('Вернуться в игру после сбоя: --resume '
+                          '{}:{}:{}:{}'.format(*server_address, *resume))
+            print(renderer.get_condition())
+        elif message.type == Protocol.MOVE_REQUEST:
+            try:
+                client_socket.sendall(Protocol.encode_move(read_move(game)))
+            except OSError:
+                pass
+        elif message.type == Protocol.STATE_DELTA:
+            try:
+                record = Protocol.apply_delta(game, message.value)
+            except ProtocolError as e:
+                print(str(e))
+                break
+            renderer.add_record(record)
+            print(renderer.get_condition())
+        elif message.type == Protocol.GAME_OVER:
+            if message.value.reason == Protocol.DISCONNECTED:
+                print('Игрок отключился. Игра прервана.'
+                      if start is None or start.chip_type is None else
+                      'Соперник отключился. Игра прервана.')
+            else:
+                print('Спасибо за игру!')
             break
-        else:
-            print(data)
 
     client_socket.close()
 
 
+def reconnect(server_address, resume):
+    for _ in range(RECONNECT_ATTEMPTS):
+        try:
+            client_socket = socket.create_connection(server_address)
+            client_socket.sendall(Protocol.encode_resume(*resume))
+            return client_socket
+        except OSError:
+            time.sleep(RECONNECT_DELAY)
+    return None
+
+
+def read_move(game):
+    while True:
+        try:
+            move = Server.parse_str_move(input('Ваш ход: '))
+            if game.move_is_correct_at(move):
+                return move
+            print('Неверная позиция для хода')
+        except MoveError as e:
+            print(str(e))
+
+
 def parse_address(address):
     res_address, str_port = address.split(':')
     port = int(str_port)
     return res_address, port
 
 
-def play_offline(game, ai_chiptype):
+def play_offline(game, ai_chiptype, ai=None, ansi=False, records_path=None):
+    renderer = FieldRenderer(game, ansi)
+    recorder = GameRecorder(game)
+    print_rocks_seed(game)
     while True:
         try:
-            print(consUI.get_cur_condition(game))
+            print(renderer.get_condition())
             if ai_chiptype == game.get_cur_chip_type:
-                make_move_by_ai(game)
+                record = make_move_by_ai(game, ai)
             else:
-                make_move_by_human(game)
+                record = make_move_by_human(game)
+            renderer.add_record(record)
+            recorder.add(record)
         except MoveError as e:
             print(str(e))
-        except EndGame:
-            print(consUI.get_cur_condition(game))
+        except EndGame as e:
+            renderer.add_record(e.record)
+            recorder.add(e.record)
+            print(renderer.get_condition())
+            if records_path is not None:
+                write_record(records_path, recorder.get_record(game))
             answer = input('Хотите сыграть еще раз с такими же '
                            'игровыми параметрами (y/N)? ')
             if answer.lower() == 'y':
                 game = GameModel(game.width, game.height, game.rocks_count)
+                renderer = FieldRenderer(game, ansi)
+                recorder = GameRecorder(game)
+                print_rocks_seed(game)
                 continue
             else:
                 break
 
 
+def print_rocks_seed(game):
+    if game.rocks_seed is not None:
+        print('Камни расставлены с зерном {} (--rocks-seed)'.format(
+            game.rocks_seed))
+
+
 def make_move_by_human(game):
     str_move = input('Ваш ход: ')
     move = Server.parse_str_move(str_move)
-    game.make_move_to(move)
+    return game.make_move_to(move)
 
 
-def make_move_by_ai(game):
-    for move in game.available_moves:
-        time.sleep(3)
-        print('Ход ИИ: ' + str(move)[1:-1])
-        game.make_move_to(move)
-        break
+def make_move_by_ai(game, ai):
+    move = ai.get_move(game)
+    print('Ход ИИ: ' + str(move)[1:-1])
+    if isinstance(ai, MonteCarloAI) and ai.playouts:
+        print('Симуляций: {} ({:.0f} в секунду)'.format(
+            ai.playouts, ai.playouts_per_second))
+    return game.make_move_to(move)
 
 
 def set_parser(parser):
@@ -109,12 +280,59 @@ def set_parser(parser):
     chiptype_group.add_argument('-w', '--white', action='store_true',
                                 help='enemy\'s side')
     gametype_group = parser.add_mutually_exclusive_group()
-    gametype_group.add_argument('-a', '--ai', action='store_true',
+    gametype_group.add_argument('-a', '--ai', nargs='?', const='alphabeta',
+                                choices=sorted(AI_ENGINES),
                                 help='game with artificial intelligence')
     gametype_group.add_argument('-n', '--newgame', dest='port', type=int,
                                 help='create new online-game')
     gametype_group.add_argument('-c', '--connect', dest='address', type=str,
                                 help='connect to existing online-game')
+    gametype_group.add_argument('--watch', dest='watch_address', type=str,
+                                help='watch an online-game as a spectator')
+    gametype_group.add_argument('--resume', dest='resume_address', type=str,
+                                help='return to an interrupted online-game')
+    gametype_group.add_argument('--server', dest='server_port', type=int,
+                                help='run a server hosting many online-games')
+    gametype_group.add_argument('--engine', nargs='?', const='alphabeta',
+                                help='read engine commands from stdin and '
+                                     'answer on stdout, e.g. --engine '
+                                     'mcts:playouts=500')
+    parser.add_argument('--store', type=str,
+                        help='directory where the server keeps its games '
+                             'to resume them after a restart')
+    parser.add_argument('--durability', type=float, default=DEFAULT_WINDOW,
+                        help='seconds of moves the server may lose on a '
+                             'crash')
+    parser.add_argument('--ansi', action='store_true',
+                        help='redraw only changed cells in place using ANSI '
+                             'escape sequences')
+    parser.add_argument('--rocks-seed', type=int,
+                        help='place the rocks of an offline game '
+                             'reproducibly from this seed')
+    parser.add_argument('--view', type=str,
+                        help='show only a window of this size (e.g. 60x30) '
+                             'around the played area of the field')
+    parser.add_argument('--metrics', type=str,
+                        help='collect metrics and publish them to text[:FILE] '
+                             'or http:[HOST:]PORT')
+    parser.add_argument('--metrics-interval', type=float,
+                        help='rewrite the text metrics every N seconds')
+    parser.add_argument('--record', type=str,
+                        help='append records of the finished games to a file')
+    parser.add_argument('-t', '--time', type=float, default=1.0,
+                        help='time budget of the AI per move in seconds')
+    parser.add_argument('--nodes', type=int,
+                        help='node budget of the AI per move')
+    parser.add_argument('--workers', type=int,
+                        help='worker processes of the parallel AI')
+    parser.add_argument('--book', type=str, default=BOOKS_DIR,
+                        help='directory with opening books')
+    parser.add_argument('--endgame', type=int, default=10,
+                        help='solve the game exactly when fewer empty cells '
+                             'are left (0 disables)')
+    parser.add_argument('--weights', type=str,
+                        help='evaluate positions of the alphabeta AI with '
+                             'pattern weights from a file')
 
 
 def parse_ai_chiptype(args):
@@ -129,6 +347,22 @@ def parse_ai_chiptype(args):
         return None
 
 
+def create_ai(args, game_args):
+    if not args.ai:
+        return None
+    ai_args = {'time_limit': args.time, 'max_nodes': args.nodes}
+    if args.ai in ('alphabeta', 'parallel'):
+        ai_args['book'] = open_book(args.book, game_args[0], game_args[1])
+    if args.ai == 'parallel':
+        ai_args['workers'] = args.workers
+    elif args.ai == 'alphabeta':
+        if args.endgame > 0:
+            ai_args['endgame'] = EndgameSolver(args.endgame)
+        if args.weights is not None:
+            ai_args['evaluator'] = load_evaluator(args.weights)
+    return AI_ENGINES[args.ai](**ai_args)
+
+
 def parse_args_for_game(args):
     width, height, rocks_count = 8, 8, 0
     if args.size is not None:
@@ -140,11 +374,24 @@ def parse_args_for_game(args):
     return width, height, rocks_count
 
 
+def parse_viewport(view):
+    width, height = view.split('x')
+    return int(width), int(height)
+
+
 def get_game_type(args):
     if args.port is not None:
         return GameType.Online_server
     elif args.address is not None:
         return GameType.Online_connect
+    elif args.server_port is not None:
+        return GameType.Dedicated_server
+    elif args.watch_address is not None:
+        return GameType.Online_watch
+    elif args.resume_address is not None:
+        return GameType.Online_resume
+    elif args.engine is not None:
+        return GameType.Engine
     else:
         return GameType.Offline
 
@@ -0,0 +1,78 @@
+import sys
+import time
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI, play_move
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+
+
+class CheckMoveChoice(unittest.TestCase):
+    def test_legal_move(self):
+        game = GameModel()
+        move = AlphaBetaAI(max_nodes=2000).get_move(game)
+        self.assertTrue(move in game.available_moves)
+
+    def test_state_is_kept(self):
+        game = GameModel(10, 10)
+        game.make_move_to((4, 3))
+        state = self._get_state(game)
+        AlphaBetaAI(max_nodes=3000).get_move(game)
+        self.assertEqual(self._get_state(game), state)
+
+    def test_takes_corner(self):
+        game = GameModel(4, 4)
+        for move in [(1, 0), (0, 0), (0, 1), (2, 0), (3, 0), (0, 2)]:
+            game.make_move_to(move)
+        ai = AlphaBetaAI(time_limit=None, max_depth=2)
+        self.assertTrue((0, 3) in game.available_moves)
+        self.assertEqual(ai.get_move(game), (0, 3))
+
+    def test_exact_small_board(self):
+        game = GameModel(3, 2)
+        ai = AlphaBetaAI(time_limit=None)
+        self.assertEqual(ai.get_move(game), (2, 1))
+
+    @staticmethod
+    def _get_state(game):
+        return (dict(game.score), game.cur_player_is_black,
+                set(game.available_moves),
+                {point: game.board.get(point) for point in game.map})
+
+
+class CheckBudget(unittest.TestCase):
+    def test_node_budget(self):
+        ai = AlphaBetaAI(time_limit=None, max_nodes=500)
+        ai.get_move(GameModel())
+        self.assertLessEqual(ai.nodes, 500)
+
+    def test_time_budget(self):
+        ai = AlphaBetaAI(time_limit=0.2)
+        start = time.perf_counter()
+        ai.get_move(GameModel(20, 20))
+        self.assertLess(time.perf_counter() - start, 1)
+
+
+class CheckWholeGames(unittest.TestCase):
+    def test_shapes(self):
+        for width, height in [(8, 8), (5, 3), (49, 2), (9, 11)]:
+            game = GameModel(width, height)
+            ai = AlphaBetaAI(time_limit=None, max_nodes=150)
+            while game.is_running:
+                play_move(game, ai.get_move(game))
+            self.assertFalse(game.available_moves)
+
+    def test_ai_against_itself_is_deterministic(self):
+        self.assertEqual(self._play_game(), self._play_game())
+
+    @staticmethod
+    def _play_game():
+        game = GameModel(6, 6)
+        ai = AlphaBetaAI(time_limit=None, max_nodes=400)
+        while game.is_running:
+            play_move(game, ai.get_move(game))
+        return game.score[ChipType.Black], game.score[ChipType.White]
+
+
+if __name__ == '__main__':
+    unittest.main()
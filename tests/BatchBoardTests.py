@@ -0,0 +1,86 @@
+import sys
+import random
+import unittest
+sys.path.append('..')
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+from modules.MoveError import MoveError
+from modules.AlphaBetaAI import play_move
+try:
+    import numpy as np
+    from modules.BatchBoard import BatchBoard
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class CheckBatchBoard(unittest.TestCase):
+    def test_beginning(self):
+        for width, height in [(8, 8), (3, 2), (10, 10), (100, 3)]:
+            batch = BatchBoard(3, width, height)
+            games = [GameModel(width, height)] * 3
+            self._check_same(batch, games)
+
+    def test_random_games(self):
+        for width, height in [(8, 8), (3, 2), (5, 4), (10, 10), (30, 3)]:
+            self._check_random_games(width, height, 0, 6)
+
+    def test_random_games_with_rocks(self):
+        for width, height in [(8, 8), (9, 7)]:
+            self._check_random_games(width, height, 5, 6)
+
+    def test_illegal_move(self):
+        batch = BatchBoard(2)
+        with self.assertRaises(MoveError):
+            batch.play([2 * 8 + 3, 0])
+        with self.assertRaises(MoveError):
+            batch.play([2 * 8 + 3, -1])
+
+    def _check_random_games(self, width, height, rocks_count, count):
+        rnd = random.Random(width * height)
+        rng = np.random.default_rng(width + height)
+        games = []
+        for _ in range(count):
+            game = GameModel(width, height)
+            free = [point for point in game.map
+                    if game.board.get(point) is None and
+                    point not in game.border_moves]
+            for point in rnd.sample(free, rocks_count):
+                game._put(point, ChipType.Rock)
+            games.append(game)
+        batch = BatchBoard.from_games(games)
+        while batch.is_running.any():
+            self._check_same(batch, games)
+            moves = batch.random_moves(rng)
+            turns = [game.cur_player_is_black for game in games]
+            passed, finished = batch.play(moves)
+            for i, game in enumerate(games):
+                move = int(moves[i])
+                if move >= 0:
+                    play_move(game, (move % width, move // width))
+                    self.assertEqual(passed[i], game.is_running and
+                                     game.cur_player_is_black == turns[i])
+                    self.assertEqual(finished[i], not game.is_running)
+        self._check_same(batch, games)
+
+    def _check_same(self, batch, games):
+        black_scores, white_scores = batch.scores
+        for i, game in enumerate(games):
+            self.assertEqual(batch.is_running[i], game.is_running)
+            self.assertEqual(batch.black_to_move[i], game.cur_player_is_black)
+            self.assertEqual(black_scores[i], game.score[ChipType.Black])
+            self.assertEqual(white_scores[i], game.score[ChipType.White])
+            legal = {(x, y) for y, x in zip(*np.nonzero(batch.legal[i]))}
+            self.assertEqual(legal, set(game.available_moves))
+            for x, y in game.map:
+                chip_type = game.board.get((x, y))
+                self.assertEqual(batch.black[i, y, x],
+                                 chip_type == ChipType.Black)
+                self.assertEqual(batch.white[i, y, x],
+                                 chip_type == ChipType.White)
+                self.assertEqual(batch.rocks[i, y, x],
+                                 chip_type == ChipType.Rock)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import unittest
+import random
+sys.path.append('..')
+from modules.GameModel import GameModel
+from modules.BitBoard import BitBoard
+from modules.Board import Board
+from modules.ChipType import ChipType
+
+
+class CheckBackendChoice(unittest.TestCase):
+    def test_standard_size(self):
+        self.assertIsInstance(GameModel().board, BitBoard)
+        self.assertIsInstance(GameModel(8, 8).board, BitBoard)
+
+    def test_other_sizes(self):
+        self.assertIsInstance(GameModel(8, 9).board, Board)
+        self.assertIsInstance(GameModel(6, 6).board, Board)
+
+
+class CheckSameRules(unittest.TestCase):
+    def test_random_games(self):
+        rnd = random.Random(17)
+        for _ in range(20):
+            self._check_random_game(rnd, 0)
+
+    def test_random_games_with_rocks(self):
+        rnd = random.Random(42)
+        for _ in range(20):
+            self._check_random_game(rnd, 6)
+
+    def _check_random_game(self, rnd, rocks_count):
+        bit_board = BitBoard()
+        board = Board(8, 8)
+        for point, chip_type in [((3, 3), ChipType.White),
+                                 ((4, 4), ChipType.White),
+                                 ((4, 3), ChipType.Black),
+                                 ((3, 4), ChipType.Black)]:
+            bit_board.put(point, chip_type)
+            board.put(point, chip_type)
+        free = sorted(set(board.map.keys()) - {(3, 3), (4, 4), (4, 3), (3, 4)})
+        for point in rnd.sample(free, rocks_count):
+            bit_board.put(point, ChipType.Rock)
+            board.put(point, ChipType.Rock)
+        cur_type, enemy_type = ChipType.Black, ChipType.White
+        passes = 0
+        while passes < 2:
+            self.assertEqual(board.frontier, bit_board.frontier)
+            moves = board.legal_moves(cur_type)
+            self.assertEqual(moves, bit_board.legal_moves(cur_type))
+            if moves:
+                passes = 0
+                move = rnd.choice(sorted(moves))
+                self.assertTrue(bit_board.is_legal(move, cur_type))
+                self.assertEqual(sorted(board.play(move, cur_type)[0]),
+                                 sorted(bit_board.play(move, cur_type)[0]))
+            else:
+                passes += 1
+            cur_type, enemy_type = enemy_type, cur_type
+        for point in board.map.keys():
+            self.assertEqual(board.get(point), bit_board.get(point))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import sys
+import unittest
+import random
+sys.path.append('..')
+from modules.AlphaBetaAI import play_move
+from modules.GameModel import GameModel
+from modules.Board import (Board, BLACK, WHITE, ROCK, EMPTY, DIRECTIONS,
+                          _ComputedLengths, get_rays)
+from modules.Chip import Chip
+from modules.ChipType import ChipType
+from modules.SparseBoard import SparseBoard
+
+
+class CheckStorage(unittest.TestCase):
+    def test_flat_layout(self):
+        board = Board(5, 3)
+        self.assertEqual(len(board.cells), 15)
+        board.put((4, 1), ChipType.Black)
+        board.put((0, 2), ChipType.White)
+        board.put((2, 0), ChipType.Rock)
+        self.assertEqual(board.cells[1 * 5 + 4], BLACK)
+        self.assertEqual(board.cells[2 * 5 + 0], WHITE)
+        self.assertEqual(board.cells[0 * 5 + 2], ROCK)
+        self.assertEqual(board.cells.count(EMPTY), 12)
+
+    def test_large_board_is_compact(self):
+        game = GameModel(100, 2341)
+        self.assertEqual(len(game.board.cells), 100 * 2341)
+        self.assertEqual(len(game.map), 100 * 2341)
+
+    def test_copy_is_independent(self):
+        game = GameModel(10, 10)
+        board = game.board.copy()
+        game.make_move_to((4, 3))
+        self.assertIsNone(board.get((4, 3)))
+        self.assertEqual(game.board.get((4, 3)), ChipType.Black)
+        self.assertNotEqual(board.cells, game.board.cells)
+        self.assertNotEqual(board.frontier, game.board.frontier)
+
+
+class CheckMapView(unittest.TestCase):
+    def test_chips(self):
+        game = GameModel(10, 10)
+        self.assertIsInstance(game.map[4, 4], Chip)
+        self.assertEqual(game.map[4, 4].type, ChipType.White)
+        self.assertIsNone(game.map[0, 0])
+
+    def test_bounds(self):
+        game = GameModel(10, 4)
+        self.assertTrue((9, 3) in game.map)
+        self.assertFalse((10, 3) in game.map)
+        self.assertFalse((-1, 0) in game.map)
+        with self.assertRaises(KeyError):
+            game.map[0, 4]
+
+    def test_keys_order(self):
+        game = GameModel(3, 2)
+        self.assertEqual(list(game.map.keys()),
+                         [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)])
+
+
+class CheckIncrementalLegalMoves(unittest.TestCase):
+    def test_random_games(self):
+        rnd = random.Random(5)
+        for width, height in [(8, 9), (5, 5), (3, 2), (30, 30), (100, 3)]:
+            self._check_random_game(rnd, width, height, 0)
+
+    def test_random_games_with_rocks(self):
+        rnd = random.Random(7)
+        for width, height in [(9, 9), (12, 5), (20, 20)]:
+            self._check_random_game(rnd, width, height, width)
+
+    def _check_random_game(self, rnd, width, height, rocks_count):
+        game = GameModel(width, height)
+        board = game.board
+        free = sorted(set(board.map.keys()) - board.frontier -
+                      {point for point in board.map.keys()
+                       if board.get(point) is not None})
+        for point in rnd.sample(free, rocks_count):
+            board.put(point, ChipType.Rock)
+        cur_type, enemy_type = ChipType.Black, ChipType.White
+        passes = 0
+        while passes < 2:
+            for chip_type in (ChipType.Black, ChipType.White):
+                self.assertEqual(
+                    board.legal_moves(chip_type),
+                    {move for move in board.frontier
+                     if board.is_legal(move, chip_type)})
+            moves = board.legal_moves(cur_type)
+            if moves:
+                passes = 0
+                board.play(rnd.choice(sorted(moves)), cur_type)
+            else:
+                passes += 1
+            cur_type, enemy_type = enemy_type, cur_type
+
+
+class CheckSparseBoard(unittest.TestCase):
+    def test_same_as_dense_board(self):
+        rnd = random.Random(11)
+        for width, height in [(8, 9), (30, 30), (100, 3)]:
+            dense = Board(width, height)
+            sparse = SparseBoard(width, height)
+            for board in (dense, sparse):
+                board.put((width // 2, height // 2), ChipType.Black)
+                board.put((width // 2 - 1, height // 2), ChipType.White)
+                board.put((1, 1), ChipType.Rock)
+            cur_type, enemy_type = ChipType.Black, ChipType.White
+            history = []
+            passes = 0
+            while passes < 2:
+                self.assertEqual(sparse.get_codes(), dense.get_codes())
+                self.assertEqual(sparse.frontier, dense.frontier)
+                for chip_type in (ChipType.Black, ChipType.White):
+                    self.assertEqual(sparse.legal_moves(chip_type),
+                                     dense.legal_moves(chip_type))
+                moves = dense.legal_moves(cur_type)
+                if moves:
+                    passes = 0
+                    move = rnd.choice(sorted(moves))
+                    result = sparse.play(move, cur_type)
+                    self.assertEqual(result, dense.play(move, cur_type))
+                    history.append((move, cur_type, result))
+                else:
+                    passes += 1
+                cur_type, enemy_type = enemy_type, cur_type
+            for move, chip_type, (flips, undo) in reversed(history):
+                sparse.undo(move, chip_type, flips, undo)
+            self.assertEqual(len(sparse.cells), 3)
+            self.assertEqual(sparse.copy().get_codes(), sparse.get_codes())
+
+    def test_huge_board_is_sparse(self):
+        game = GameModel(10000, 10000)
+        self.assertIsInstance(game.board, SparseBoard)
+        rnd = random.Random(3)
+        for _ in range(50):
+            play_move(game, rnd.choice(sorted(game.available_moves)))
+        self.assertEqual(len(game.board.cells), 54)
+        self.assertTrue(game.map_contains((9999, 9999)))
+        self.assertFalse(game.map_contains((10000, 0)))
+        self.assertIsNone(game.map[9999, 0])
+        self.assertEqual(game.empty_count, 10000 * 10000 - 54)
+
+
+class CheckRays(unittest.TestCase):
+    def test_ray_lengths(self):
+        for width, height in [(5, 3), (1, 4), (8, 8), (2, 7)]:
+            steps, lengths = get_rays(width, height)
+            for y in range(height):
+                for x in range(width):
+                    for direction, (dx, dy) in enumerate(DIRECTIONS):
+                        self.assertEqual(steps[direction], dy * width + dx)
+                        length = 0
+                        while (0 <= x + dx * (length + 1) < width and
+                               0 <= y + dy * (length + 1) < height):
+                            length += 1
+                        self.assertEqual(
+                            lengths[(y * width + x) * 8 + direction], length)
+
+    def test_computed_lengths(self):
+        _, lengths = get_rays(7, 5)
+        computed = _ComputedLengths(7, 5)
+        for index in range(7 * 5):
+            self.assertEqual(computed[index * 8:index * 8 + 8],
+                             tuple(lengths[index * 8:index * 8 + 8]))
+        self.assertIsInstance(get_rays(1000, 1000)[1], _ComputedLengths)
+
+    def test_rays_are_shared(self):
+        self.assertIs(Board(7, 5).lengths, Board(7, 5).lengths)
+        self.assertIsNot(Board(7, 5).lengths, Board(5, 7).lengths)
+        self.assertIs(Board(7, 5).copy().lengths, Board(7, 5).lengths)
+
+    def test_long_line_is_flipped(self):
+        length = 5 * sys.getrecursionlimit()
+        board = Board(length, 2)
+        board.put((0, 0), ChipType.Black)
+        for x in range(1, length - 1):
+            board.put((x, 0), ChipType.White)
+        self.assertTrue(board.is_legal((length - 1, 0), ChipType.Black))
+        flips, _ = board.play((length - 1, 0), ChipType.Black)
+        self.assertEqual(len(flips), length - 2)
+        self.assertEqual(board.cells[:length], bytearray([BLACK]) * length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import sys
+import re
+import random
+import math
+import unittest
+sys.path.append('..')
+from modules import ConsoleUI as consUI
+from modules.AlphaBetaAI import play_move
+from modules.Chip import Chip
+from modules.ChipType import ChipType
+from modules.FieldRenderer import FieldRenderer
+from modules.GameModel import GameModel
+
+
+ESCAPE = re.compile(r'\x1b\[(?:(\d+);(\d+)H|2J|H|K|J)')
+
+
+def get_reference_field(game):
+    res = []
+    chip_dict = {ChipType.White: '\u25cb',
+                 ChipType.Black: '\u25cf',
+                 ChipType.Rock: '#'}
+    tab_len = math.ceil(math.log10(game.height - 1)) + 1
+    nums_tip = ' ' * tab_len + ''.join([str(i)[-1] for i in range(game.width)])
+    res.append(nums_tip)
+    for y in range(game.height):
+        line = str(y) + ' ' * (tab_len - len(str(y)))
+        for x in range(game.width):
+            if isinstance(game.map[x, y], Chip):
+                cur_c = chip_dict[game.map[x, y].type]
+            elif (x, y) in game.available_moves:
+                cur_c = '.'
+            else:
+                cur_c = '-'
+            line += cur_c
+        res.append(line)
+    res.append(nums_tip)
+    res.append('')
+    return '\n'.join(res)
+
+
+class Screen:
+    def __init__(self):
+        self.lines = [[]]
+        self.line = 0
+        self.column = 0
+
+    def write(self, text):
+        pos = 0
+        for match in ESCAPE.finditer(text):
+            self._write_text(text[pos:match.start()])
+            self._apply(match)
+            pos = match.end()
+        self._write_text(text[pos:])
+
+    def _apply(self, match):
+        code = match.group(0)
+        if match.group(1):
+            self.line = int(match.group(1)) - 1
+            self.column = int(match.group(2)) - 1
+        elif code.endswith('2J'):
+            self.lines = [[]]
+        elif code.endswith('H'):
+            self.line = self.column = 0
+        elif code.endswith('K'):
+            del self._get_line()[self.column:]
+        elif code.endswith('J'):
+            del self._get_line()[self.column:]
+            del self.lines[self.line + 1:]
+
+    def _get_line(self):
+        while len(self.lines) <= self.line:
+            self.lines.append([])
+        return self.lines[self.line]
+
+    def _write_text(self, text):
+        for c in text:
+            if c == '\n':
+                self.line += 1
+                self.column = 0
+                continue
+            line = self._get_line()
+            while len(line) < self.column:
+                line.append(' ')
+            if self.column < len(line):
+                line[self.column] = c
+            else:
+                line.append(c)
+            self.column += 1
+
+    def get_text(self):
+        return '\n'.join(''.join(line) for line in self.lines)
+
+
+class CheckConsoleUI(unittest.TestCase):
+    def test_full_redraw_is_unchanged(self):
+        for width, height in [(8, 8), (3, 2), (10, 10), (13, 4), (4, 11)]:
+            game = GameModel(width, height)
+            for _ in self._play_random_game(game):
+                self.assertEqual(consUI._get_field(game),
+                                 get_reference_field(game))
+
+    def test_incremental_rendering(self):
+        for width, height in [(8, 8), (10, 10), (20, 3), (5, 12)]:
+            game = GameModel(width, height)
+            renderer = FieldRenderer(game)
+            for record in self._play_random_game(game):
+                if record is not None:
+                    renderer.add_record(record)
+                self.assertEqual(renderer.get_condition(),
+                                 consUI.get_cur_condition(game))
+
+    def test_ansi_rendering(self):
+        for width, height in [(8, 8), (10, 10), (12, 5)]:
+            game = GameModel(width, height)
+            renderer = FieldRenderer(game, ansi=True)
+            screen = Screen()
+            for record in self._play_random_game(game):
+                if record is not None:
+                    renderer.add_record(record)
+                screen.write(renderer.get_condition())
+                self.assertEqual(screen.get_text().rstrip('\n'),
+                                 consUI.get_cur_condition(game).rstrip('\n'))
+                screen.write('\nВаш ход: 1 2\n')
+
+    def test_ansi_update_is_small(self):
+        game = GameModel(100, 50)
+        renderer = FieldRenderer(game, ansi=True)
+        full = renderer.get_condition()
+        renderer.add_record(game.make_move_to(min(game.available_moves)))
+        self.assertLess(len(renderer.get_condition()), len(full) // 10)
+
+    def test_window_matches_full_field(self):
+        for width, height, viewport in [(20, 15, (6, 4)), (8, 8, (20, 20)),
+                                        (30, 5, (10, 10))]:
+            game = GameModel(width, height)
+            for _ in self._play_random_game(game):
+                window = consUI.get_window_field(game, viewport)
+                left, top, right, bottom = consUI.get_viewport(game,
+                                                               *viewport)
+                self.assertEqual((right - left, bottom - top),
+                                 (min(width, viewport[0]),
+                                  min(height, viewport[1])))
+                full = get_reference_field(game).split('\n')[1:-2]
+                lines = window.split('\n')[2:-2]
+                self.assertEqual(len(lines), bottom - top)
+                for y, line in zip(range(top, bottom), lines):
+                    self.assertEqual(
+                        line.split(' ')[-1],
+                        full[y][-width:][left:right])
+
+    def test_window_follows_play(self):
+        game = GameModel(2000, 1000)
+        self.assertEqual(consUI.get_viewport(game, 10, 6),
+                         (994, 496, 1004, 502))
+        renderer = FieldRenderer(game)
+        for _ in range(3):
+            renderer.add_record(game.make_move_to(min(game.available_moves)))
+        left, top, right, bottom = consUI.get_viewport(game, 60, 30)
+        field = renderer.get_field()
+        self.assertEqual(len(field.splitlines()), 30 + 3)
+        for x, y in game.border_moves:
+            self.assertTrue(left <= x < right and top <= y < bottom)
+
+    def _play_random_game(self, game):
+        rnd = random.Random(game.width * game.height)
+        free = [point for point in game.map
+                if game.board.get(point) is None and
+                point not in game.border_moves]
+        for point in rnd.sample(free, min(3, len(free))):
+            game._put(point, ChipType.Rock)
+        game._upd_available_moves()
+        yield None
+        while game.is_running:
+            yield play_move(game, rnd.choice(sorted(game.available_moves)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import time
+import unittest
+import random
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI, play_move
+from modules.EndgameSolver import EndgameSolver
+from modules.GameModel import GameModel
+
+
+class CheckSolver(unittest.TestCase):
+    def test_against_minimax(self):
+        rnd = random.Random(21)
+        for width, height in [(4, 4), (5, 4), (6, 3), (8, 8)]:
+            for _ in range(2):
+                game = self._get_position(rnd, width, height, 7)
+                if game is None:
+                    continue
+                move, score = EndgameSolver(threshold=10).solve(game)
+                self.assertTrue(move in game.available_moves)
+                self.assertEqual(score, self._minimax(game))
+                record = play_move(game, move)
+                is_black = record.chip_type == game.get_cur_chip_type
+                self.assertEqual(
+                    score, self._minimax(game) if is_black else
+                    -self._minimax(game))
+
+    def test_state_is_kept(self):
+        game = self._get_position(random.Random(2), 6, 6, 8)
+        state = (game.hash, dict(game.score), set(game.available_moves))
+        EndgameSolver().solve(game)
+        self.assertEqual(
+            (game.hash, dict(game.score), set(game.available_moves)), state)
+
+    def test_threshold(self):
+        game = self._get_position(random.Random(3), 6, 6, 10)
+        self.assertTrue(EndgameSolver(threshold=11).should_solve(game))
+        self.assertFalse(EndgameSolver(threshold=10).should_solve(game))
+
+    def test_statistics(self):
+        game = self._get_position(random.Random(4), 8, 8, 10)
+        solver = EndgameSolver()
+        solver.solve(game)
+        self.assertGreater(solver.nodes, 0)
+        self.assertGreater(solver.nodes_per_second, 0)
+
+    def test_budget(self):
+        game = self._get_position(random.Random(5), 8, 8, 14)
+        self.assertIsNone(EndgameSolver(max_nodes=10).solve(game))
+
+    def test_ai_uses_solver(self):
+        game = self._get_position(random.Random(6), 8, 8, 8)
+        ai = AlphaBetaAI(time_limit=None, max_depth=1,
+                         endgame=EndgameSolver(threshold=10))
+        move = ai.get_move(game)
+        self.assertEqual(ai.score, EndgameSolver().solve(game)[1])
+        self.assertTrue(move in game.available_moves)
+
+    def test_ai_shares_time_with_solver(self):
+        game = self._get_position(random.Random(7), 8, 8, 19)
+        ai = AlphaBetaAI(time_limit=0.3, endgame=EndgameSolver(threshold=25))
+        start = time.perf_counter()
+        move = ai.get_move(game)
+        self.assertLess(time.perf_counter() - start, 0.45)
+        self.assertTrue(move in game.available_moves)
+
+    def test_ai_shares_nodes_with_solver(self):
+        game = self._get_position(random.Random(7), 8, 8, 19)
+        solver = EndgameSolver(threshold=25)
+        ai = AlphaBetaAI(time_limit=None, max_nodes=3000, endgame=solver)
+        move = ai.get_move(game)
+        self.assertEqual(solver.nodes, 3000)
+        self.assertEqual(ai.depth, 0)
+        self.assertLessEqual(ai.nodes, 3001)
+        self.assertTrue(move in game.available_moves)
+
+    def _minimax(self, game):
+        if not game.is_running:
+            return (game.score[game.get_cur_chip_type] -
+                    game.score[game.get_enemy_chip_type])
+        best = None
+        for move in sorted(game.available_moves):
+            is_black = game.cur_player_is_black
+            record = play_move(game, move)
+            score = self._minimax(game)
+            if game.cur_player_is_black != is_black:
+                score = -score
+            game.unmake_move(record)
+            best = score if best is None else max(best, score)
+        return best
+
+    @staticmethod
+    def _get_position(rnd, width, height, empty_count):
+        game = GameModel(width, height)
+        while game.is_running and game.empty_count > empty_count:
+            play_move(game, rnd.choice(sorted(game.available_moves)))
+        return game if game.is_running else None
+
+
+if __name__ == '__main__':
+    unittest.main()
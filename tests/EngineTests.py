@@ -0,0 +1,104 @@
+import io
+import sys
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI
+from modules.ChipType import ChipType
+from modules.Engine import Engine
+from modules.GameModel import GameModel
+from modules.MonteCarloAI import MonteCarloAI
+
+
+class CheckEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = Engine(time_limit=None, max_nodes=200)
+
+    def test_play_and_moves(self):
+        self.assertEqual(self.engine.handle('moves'), '= 2,3 3,2 4,5 5,4')
+        self.assertEqual(self.engine.handle('play 2,3'), '=')
+        self.assertEqual(self.engine.handle('status'), '= w 4 1')
+        self.assertEqual(self.engine.handle('play 2,3'),
+                         '? Неверная позиция для хода')
+        self.assertEqual(self.engine.handle('play 100,100'),
+                         '? Неверная позиция для хода')
+        self.assertEqual(self.engine.handle('play a,b'),
+                         '? Неверная клетка: a,b')
+
+    def test_new_game(self):
+        self.assertEqual(self.engine.handle('new 10x6 0,0 9,5'), '=')
+        game = self.engine.game
+        self.assertEqual((game.width, game.height), (10, 6))
+        self.assertEqual(game.rocks, [(0, 0), (9, 5)])
+        self.assertEqual(self.engine.handle('new 12x12'), '=')
+        self.assertEqual(self.engine.game.rocks_count, 0)
+        self.assertEqual(self.engine.handle('new 10x10 5 3'), '=')
+        self.assertEqual(self.engine.game.rocks,
+                         GameModel(10, 10, 5, rocks_seed=3).rocks)
+        self.assertEqual(self.engine.handle('new 1x1'),
+                         '? Слишком маленькие размеры игрового поля')
+        self.assertEqual(self.engine.game.width, 10)
+
+    def test_position(self):
+        self.assertEqual(self.engine.handle('position 4x3 w #xo--xo-----'),
+                         '=')
+        game = self.engine.game
+        self.assertEqual(game.board.get((0, 0)), ChipType.Rock)
+        self.assertEqual(game.board.get((1, 0)), ChipType.Black)
+        self.assertEqual(game.board.get((2, 0)), ChipType.White)
+        self.assertFalse(game.cur_player_is_black)
+        self.assertEqual(self.engine.handle('moves'),
+                         '= ' + ' '.join('{},{}'.format(*move) for move in
+                                         sorted(game.available_moves)))
+        self.assertEqual(self.engine.handle('position 4x3 w ---'),
+                         '? Неверное описание клеток')
+        self.assertEqual(self.engine.handle('position 4x3 x ' + '-' * 12),
+                         '? Ожидается: position ШИРИНАxВЫСОТА b|w КЛЕТКИ')
+
+    def test_position_with_pass(self):
+        self.engine.handle('position 3x2 b -xo---')
+        self.assertEqual(self.engine.handle('status'), '= w 1 1')
+        self.assertEqual(self.engine.handle('moves'), '= 0,0')
+        self.engine.handle('position 3x2 b xx----')
+        self.assertEqual(self.engine.handle('status'), '= over 2 0')
+        self.assertEqual(self.engine.handle('go'), '? Игра закончена')
+
+    def test_position_matches_snapshot(self):
+        game = GameModel(7, 5)
+        game.make_move_to(sorted(game.available_moves)[0])
+        cells = ''.join('-xo#'[code] for code in game.board.get_codes())
+        self.engine.handle('position 7x5 w ' + cells)
+        self.assertEqual(self.engine.game.snapshot(), game.snapshot())
+        self.assertEqual(self.engine.game.hash, game.hash)
+
+    def test_go_with_budget(self):
+        response = self.engine.handle('go depth=2')
+        self.assertRegex(response, r'^= \d,\d$')
+        move = tuple(int(value) for value in response[2:].split(','))
+        self.assertIn(move, self.engine.game.available_moves)
+        self.assertEqual(self.engine.ai.depth, 2)
+        self.assertEqual(self.engine.ai.max_depth, 64)
+        self.assertEqual(self.engine.handle('status'), '= b 2 2')
+        self.assertEqual(self.engine.handle('go playouts=5'),
+                         '? Неизвестный параметр ИИ: playouts')
+
+    def test_switch_engine(self):
+        self.assertIsInstance(self.engine.ai, AlphaBetaAI)
+        self.assertEqual(self.engine.handle('engine mcts:seed=1'), '=')
+        self.assertIsInstance(self.engine.ai, MonteCarloAI)
+        self.assertRegex(self.engine.handle('go playouts=20'),
+                         r'^= \d,\d$')
+        self.assertEqual(self.engine.ai.playouts, 20)
+        self.assertEqual(self.engine.handle('engine chess'),
+                         '? Неизвестный ИИ: chess')
+
+    def test_run(self):
+        output = io.StringIO()
+        self.engine.run(io.StringIO('# comment\n\nbogus\nplay 2,3\n'
+                                    'quit\nmoves\n'), output)
+        self.assertEqual(output.getvalue(),
+                         '? Неизвестная команда: bogus\n=\n=\n')
+        self.assertFalse(self.engine.is_running)
+
+
+if __name__ == '__main__':
+    unittest.main()
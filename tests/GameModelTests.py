@@ -309,6 +309,52 @@ class CheckRocks(unittest.TestCase):
         self._check_rocks_count(4)
         self._check_rocks_count(16)
 
+    def test_rocks_layout(self):
+        game = GameModel(6, 5, rocks=[(0, 0), (5, 1)])
+        self.assertEqual(game.rocks_count, 2)
+        self.assertEqual(game.rocks, [(0, 0), (5, 1)])
+        self.assertTrue(game.map[5, 1].type == ChipType.Rock)
+        self.assertTrue(game.map[0, 0].type == ChipType.Rock)
+
+    def test_wrong_rocks_layout(self):
+        with self.assertRaises(RocksError):
+            GameModel(rocks=[(3, 3)])
+        with self.assertRaises(RocksError):
+            GameModel(rocks=[(8, 0)])
+
+    def test_rocks_seed(self):
+        game = GameModel(10, 10, 12, rocks_seed=5)
+        self.assertEqual(game.rocks_seed, 5)
+        self.assertEqual(len(game.rocks), 12)
+        same = GameModel(10, 10, 12, rocks_seed=5)
+        self.assertEqual(same.rocks, game.rocks)
+        self.assertEqual(same.hash, game.hash)
+        self.assertNotEqual(GameModel(10, 10, 12, rocks_seed=6).rocks,
+                            game.rocks)
+        random_game = GameModel(10, 10, 12)
+        self.assertIsNotNone(random_game.rocks_seed)
+        self.assertEqual(GameModel(10, 10, 12,
+                                   rocks_seed=random_game.rocks_seed).rocks,
+                         random_game.rocks)
+        self.assertIsNone(GameModel(10, 10).rocks_seed)
+        self.assertIsNone(GameModel(10, 10, rocks=[(0, 0)]).rocks_seed)
+
+    def test_dense_rocks(self):
+        for seed in range(5):
+            game = GameModel(4, 4, 8, rocks_seed=seed)
+            self.assertEqual(game.score, {ChipType.Black: 2,
+                                          ChipType.White: 2})
+            self.assertEqual(len(set(game.rocks)), 8)
+            self.assertEqual(len(game.available_moves), 4)
+            self.assertEqual(game.empty_count, 4)
+
+    def test_rocks_on_huge_board(self):
+        game = GameModel(10000, 10000, 1000, rocks_seed=1)
+        self.assertEqual(len(set(game.rocks)), 1000)
+        self.assertEqual(len(game.board.cells), 1004)
+        for rock in game.rocks:
+            self.assertEqual(game.board.get(rock), ChipType.Rock)
+
     def _check_rocks_count(self, exp_count):
         res_count = 0
         game = GameModel(rocks_count=exp_count)
@@ -0,0 +1,116 @@
+import os
+import sys
+import random
+import tempfile
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import play_move
+from modules.ChipType import ChipType
+from modules.GameAnalysis import (count_openings, get_opening_stats,
+                                  get_openings, iter_records)
+from modules.GameModel import GameModel
+from modules.GameRecord import (GameRecorder, GameRecordWriter, MAGIC,
+                                decode_record, encode_record, read_records,
+                                replay, write_record)
+from modules.RecordError import RecordError
+
+
+def play_random_game(width, height, rocks, rnd):
+    game = GameModel(width, height, rocks=rocks)
+    recorder = GameRecorder(game)
+    points = []
+    while game.is_running:
+        point = rnd.choice(sorted(game.available_moves))
+        points.append(point)
+        recorder.add(play_move(game, point))
+    return recorder.get_record(game), points, game
+
+
+class CheckGameRecord(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'games.bin')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_encode_decode(self):
+        rnd = random.Random(1)
+        for width, height, rocks in [(8, 8, []), (8, 8, [(0, 7), (6, 1)]),
+                                     (10, 6, [(9, 5)]), (130, 3, [])]:
+            record, _, _ = play_random_game(width, height, rocks, rnd)
+            data = encode_record(record)
+            body_start = 1 if data[0] < 0x80 else 2
+            self.assertEqual(data[0] & 0x7f | (data[1] << 7 if body_start > 1
+                                               else 0),
+                             len(data) - body_start)
+            self.assertEqual(decode_record(data[body_start:]), record)
+
+    def test_one_byte_per_move(self):
+        record, points, _ = play_random_game(8, 8, [], random.Random(2))
+        self.assertLessEqual(len(encode_record(record)), len(points) + 8)
+
+    def test_replay(self):
+        rnd = random.Random(3)
+        for width, height, rocks in [(8, 8, [(1, 1)]), (9, 7, [(0, 0)])]:
+            record, points, game = play_random_game(width, height, rocks,
+                                                    rnd)
+            replayed = []
+            position = None
+            for position, point in replay(record):
+                replayed.append(point)
+            self.assertEqual(replayed, points)
+            self.assertEqual(position.snapshot(), game.snapshot())
+            self.assertEqual(position.score[ChipType.Black],
+                             record.black_score)
+
+    def test_write_and_read(self):
+        rnd = random.Random(4)
+        records = [play_random_game(8, 8, [], rnd)[0] for _ in range(20)]
+        with GameRecordWriter(self.path) as writer:
+            for record in records[:10]:
+                writer.write(record)
+        for record in records[10:]:
+            write_record(self.path, record)
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(len(MAGIC)), MAGIC)
+        self.assertEqual(list(read_records(self.path)), records)
+
+    def test_broken_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'NOPE')
+        with self.assertRaises(RecordError):
+            list(read_records(self.path))
+        record = play_random_game(8, 8, [], random.Random(5))[0]
+        with open(self.path, 'wb') as file:
+            file.write(MAGIC + encode_record(record)[:-3])
+        with self.assertRaises(RecordError):
+            list(read_records(self.path))
+
+    def test_zero_width(self):
+        for body in (bytes([0, 8, 1, 3, 0, 0, 0]), bytes([8, 0, 0, 0, 0, 0])):
+            with self.assertRaises(RecordError):
+                decode_record(body)
+
+    def test_opening_stats(self):
+        rnd = random.Random(6)
+        records = [play_random_game(6, 6, [], rnd)[0] for _ in range(30)]
+        with GameRecordWriter(self.path) as writer:
+            for record in records:
+                writer.write(record)
+        stats = get_opening_stats([self.path, self.path], 2)
+        self.assertEqual(sum(item.games for item in stats.values()), 60)
+        for opening, item in stats.items():
+            self.assertEqual(len(opening), 2)
+            self.assertEqual(item.games, item.black_wins + item.draws +
+                             item.white_wins)
+        self.assertEqual(get_opening_stats([self.path], 2, (8, 8)), {})
+        self.assertEqual(
+            count_openings(get_openings(iter_records([self.path]), 0)),
+            {(): count_openings(
+                (((), record.black_score - record.white_score)
+                 for record in records))[()]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+sys.path.append('..')
+from modules import GameStore as gs
+from modules.AlphaBetaAI import play_move
+from modules.GameModel import GameModel
+
+
+class CheckGameStore(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            if store._file is not None:
+                store._file.close()
+        self.dir.cleanup()
+
+    def _open(self, snapshot_interval=gs.SNAPSHOT_INTERVAL):
+        store = gs.GameStore(self.dir.name,
+                             snapshot_interval=snapshot_interval)
+        self.stores.append(store)
+        return store, store.load()
+
+    def _play(self, store, game_id, game, moves_count):
+        for _ in range(moves_count):
+            record = play_move(game, min(game.available_moves))
+            store.add_move(game_id, game, record.point)
+
+    def test_empty_directory(self):
+        _, games = self._open()
+        self.assertEqual(games, {})
+        self.assertTrue(os.path.exists(os.path.join(self.dir.name,
+                                                    gs.LOG_NAME)))
+
+    def test_round_trip(self):
+        store, _ = self._open()
+        first = GameModel()
+        second = GameModel(10, 6)
+        store.add_game(1, first, (11, 12))
+        store.add_game(2, second, (21, 2**64 - 1))
+        self._play(store, 1, first, 5)
+        self._play(store, 2, second, 3)
+        asyncio.run(store.flush())
+        _, games = self._open()
+        self.assertEqual(sorted(games), [1, 2])
+        self.assertEqual(games[1].tokens, (11, 12))
+        self.assertEqual(games[2].tokens, (21, 2**64 - 1))
+        self.assertEqual(games[1].game.snapshot(), first.snapshot())
+        self.assertEqual(games[2].game.snapshot(), second.snapshot())
+
+    def test_unflushed_moves_are_lost(self):
+        store, _ = self._open()
+        game = GameModel()
+        store.add_game(1, game, (1, 2))
+        self._play(store, 1, game, 2)
+        asyncio.run(store.flush())
+        expected = game.snapshot()
+        self._play(store, 1, game, 2)
+        _, games = self._open()
+        self.assertEqual(games[1].game.snapshot(), expected)
+
+    def test_torn_tail(self):
+        store, _ = self._open()
+        game = GameModel()
+        store.add_game(1, game, (1, 2))
+        self._play(store, 1, game, 4)
+        asyncio.run(store.flush())
+        expected = game.snapshot()
+        with open(store.path, 'ab') as f:
+            f.write(gs.ENTRY.pack(gs.MOVE, 1, gs.CELL.size) + b'\x01')
+        _, games = self._open()
+        self.assertEqual(games[1].game.snapshot(), expected)
+
+    def test_ended_game_is_dropped(self):
+        store, _ = self._open()
+        game = GameModel(6, 6)
+        store.add_game(1, game, (1, 2))
+        store.add_game(2, GameModel(6, 6), (3, 4))
+        self._play(store, 1, game, 3)
+        store.end_game(1)
+        asyncio.run(store.flush())
+        _, games = self._open()
+        self.assertEqual(list(games), [2])
+
+    def test_finished_game_is_dropped(self):
+        store, _ = self._open()
+        game = GameModel(4, 4)
+        store.add_game(1, game, (1, 2))
+        while game.is_running:
+            record = play_move(game, min(game.available_moves))
+            store.add_move(1, game, record.point)
+        asyncio.run(store.flush())
+        _, games = self._open()
+        self.assertEqual(games, {})
+
+    def test_snapshots_and_compaction(self):
+        store, _ = self._open(snapshot_interval=4)
+        game = GameModel()
+        store.add_game(1, game, (1, 2))
+        self._play(store, 1, game, 10)
+        asyncio.run(store.flush())
+        size = os.path.getsize(store.path)
+        snapshot_entry = gs.ENTRY.size + len(game.snapshot())
+        self.assertEqual(size, gs.TOKENS.size + snapshot_entry * 3 +
+                         (gs.ENTRY.size + gs.CELL.size) * 10)
+        _, games = self._open()
+        self.assertEqual(games[1].game.snapshot(), game.snapshot())
+        self.assertEqual(os.path.getsize(store.path),
+                         gs.TOKENS.size + snapshot_entry)
+
+    def test_run_flushes_until_closed(self):
+        store, _ = self._open()
+        game = GameModel()
+
+        async def run():
+            task = asyncio.create_task(store.run())
+            store.add_game(1, game, (1, 2))
+            self._play(store, 1, game, 3)
+            store.close()
+            await task
+
+        asyncio.run(run())
+        self.assertTrue(store._file.closed)
+        _, games = self._open()
+        self.assertEqual(games[1].game.snapshot(), game.snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import unittest
+sys.path.append('..')
+from modules import Protocol
+from modules.AlphaBetaAI import play_move
+from modules.ChipType import ChipType
+from modules.GameModel import GameModel
+from modules.LiveGame import LiveGame, MAX_FAST_FORWARDS
+
+
+class FakeConnection:
+    def __init__(self, max_queue=None):
+        self.max_queue = max_queue
+        self.outbox = []
+        self.is_closed = False
+
+    def send(self, data):
+        if self.max_queue is not None and len(self.outbox) >= self.max_queue:
+            return False
+        self.outbox.append(data)
+        return True
+
+    def clear(self):
+        self.outbox.clear()
+
+    def close(self):
+        self.is_closed = True
+
+    def read_all(self):
+        res = [decode(data) for data in self.outbox]
+        self.outbox.clear()
+        return res
+
+
+def decode(data):
+    return Protocol.decode(data[Protocol.LENGTH.size:])
+
+
+class CheckLiveGame(unittest.TestCase):
+    def setUp(self):
+        self.game = GameModel()
+        self.players = {ChipType.Black: FakeConnection(),
+                        ChipType.White: FakeConnection()}
+        self.live = LiveGame(3, self.game, self.players,
+                             {ChipType.Black: 1, ChipType.White: 2})
+        self.live.start()
+
+    def _make_move(self):
+        record = play_move(self.game, min(self.game.available_moves))
+        data = Protocol.encode_delta(record, self.game)
+        self.live.broadcast(data)
+        return data
+
+    def test_encode_once(self):
+        spectators = [FakeConnection(8) for _ in range(100)]
+        for spectator in spectators:
+            self.live.add_spectator(spectator)
+        data = self._make_move()
+        for conn in spectators + list(self.players.values()):
+            self.assertIs(conn.outbox[-1], data)
+
+    def test_slow_spectator_fast_forwards(self):
+        slow = FakeConnection(2)
+        fast = FakeConnection()
+        self.live.add_spectator(slow)
+        self.live.add_spectator(fast)
+        for _ in range(3):
+            self._make_move()
+        self.assertEqual(len(fast.outbox), 4)
+        messages = slow.read_all()
+        self.assertEqual([message.type for message in messages],
+                         [Protocol.START, Protocol.STATE_DELTA])
+        game = GameModel.from_snapshot(messages[0].value.snapshot)
+        Protocol.apply_delta(game, messages[1].value)
+        self.assertEqual(game.snapshot(), self.game.snapshot())
+        self.assertEqual(self.live.spectators[slow], 1)
+
+    def test_game_over_follows_snapshot(self):
+        slow = FakeConnection(2)
+        self.live.add_spectator(slow)
+        self._make_move()
+        self.live.broadcast(Protocol.encode_game_over(self.game), False)
+        self.assertEqual([message.type for message in slow.read_all()],
+                         [Protocol.START, Protocol.GAME_OVER])
+
+    def test_hopeless_spectator_is_dropped(self):
+        slow = FakeConnection(1)
+        self.live.add_spectator(slow)
+        for _ in range(MAX_FAST_FORWARDS + 1):
+            self._make_move()
+        self.assertTrue(slow.is_closed)
+        self.assertNotIn(slow, self.live.spectators)
+        self._make_move()
+        self.assertEqual(len(self.players[ChipType.Black].outbox),
+                         MAX_FAST_FORWARDS + 3)
+
+    def test_closed_spectator_is_removed(self):
+        spectator = FakeConnection()
+        self.live.add_spectator(spectator)
+        spectator.is_closed = True
+        self._make_move()
+        self.assertEqual(self.live.spectators, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+sys.path.append('..')
+from modules.AlphaBetaAI import play_move
+from modules.GameModel import GameModel
+from modules.Metrics import Metrics
+from modules.MetricsSink import TextSink, HttpSink, create_sink
+
+
+class CheckMetrics(unittest.TestCase):
+    def test_counters_and_stats(self):
+        metrics = Metrics()
+        metrics.inc('moves_total')
+        metrics.inc('moves_total', 4)
+        metrics.inc('bytes_total', 10, (('client', 'a'),))
+        for value in (3, 1, 2):
+            metrics.observe('wait_seconds', value, (('client', 'a'),))
+        self.assertEqual(metrics.get_counter('moves_total'), 5)
+        self.assertEqual(metrics.get_counter('bytes_total',
+                                             (('client', 'a'),)), 10)
+        stat = metrics.get_stat('wait_seconds', (('client', 'a'),))
+        self.assertEqual((stat.count, stat.total, stat.max, stat.mean),
+                         (3, 6, 3, 2))
+        self.assertIsNone(metrics.get_stat('wait_seconds'))
+
+    def test_slowest(self):
+        metrics = Metrics()
+        for i in range(5):
+            metrics.observe('turn_seconds', i, (('game', i),))
+        self.assertEqual([labels for labels, _ in
+                          metrics.get_slowest('turn_seconds', 2)],
+                         [(('game', 4),), (('game', 3),)])
+
+    def test_series_limit(self):
+        metrics = Metrics(max_series=3)
+        metrics.observe('total_seconds', 1)
+        for i in range(5):
+            metrics.observe('turn_seconds', i, (('game', i),))
+        self.assertEqual(len(metrics.stats), 3)
+        self.assertIsNotNone(metrics.get_stat('total_seconds'))
+        self.assertIsNone(metrics.get_stat('turn_seconds', (('game', 2),)))
+        self.assertIsNotNone(metrics.get_stat('turn_seconds',
+                                              (('game', 4),)))
+
+    def test_prometheus(self):
+        metrics = Metrics()
+        metrics.inc('bytes_total', 7, (('client', '1.2.3.4:5'),))
+        metrics.observe('wait_seconds', 0.5, (('client', 'a"b'),))
+        lines = metrics.render_prometheus().splitlines()
+        self.assertEqual(lines, [
+            '# TYPE reversi_bytes_total counter',
+            'reversi_bytes_total{client="1.2.3.4:5"} 7',
+            '# TYPE reversi_wait_seconds summary',
+            'reversi_wait_seconds_count{client="a\\"b"} 1',
+            'reversi_wait_seconds_sum{client="a\\"b"} 0.5',
+            'reversi_wait_seconds_max{client="a\\"b"} 0.5'])
+
+    def test_text(self):
+        metrics = Metrics()
+        metrics.observe('turn_seconds', 1, (('game', 1),))
+        metrics.observe('turn_seconds', 5, (('game', 2),))
+        lines = metrics.render_text().splitlines()
+        self.assertTrue(lines[1].startswith('turn_seconds{game="2"} count=1'))
+        self.assertTrue(lines[2].startswith('turn_seconds{game="1"} count=1'))
+
+
+class CheckGameModelMetrics(unittest.TestCase):
+    def tearDown(self):
+        GameModel.metrics = None
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(GameModel().metrics)
+
+    def test_game_metrics(self):
+        for width, height in [(8, 8), (10, 6)]:
+            metrics = GameModel.metrics = Metrics()
+            game = GameModel(width, height)
+            generated = len(game.available_moves)
+            flipped = 0
+            while game.is_running:
+                record = play_move(game, min(game.available_moves))
+                flipped += len(record.flips)
+                if game.is_running:
+                    generated += len(game.available_moves)
+            self.assertEqual(metrics.get_counter(
+                'game_cells_flipped_total'), flipped)
+            self.assertGreaterEqual(metrics.get_counter(
+                'game_moves_generated_total'), generated)
+            frontier = metrics.get_stat('game_frontier_size')
+            timer = metrics.get_stat('game_upd_available_moves_seconds')
+            self.assertEqual(frontier.count, timer.count)
+            self.assertGreater(frontier.max, 0)
+            self.assertGreater(timer.total, 0)
+
+
+class CheckSinks(unittest.TestCase):
+    def test_text_sink(self):
+        metrics = Metrics()
+        metrics.inc('moves_total', 3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics.txt')
+            sink = create_sink(metrics, 'text:' + path)
+            self.assertIsInstance(sink, TextSink)
+            sink.close()
+            with open(path, encoding='utf-8') as f:
+                self.assertIn('moves_total 3', f.read())
+
+    def test_http_sink(self):
+        metrics = Metrics()
+        metrics.inc('moves_total', 3)
+        sink = create_sink(metrics, 'http:127.0.0.1:0')
+        self.assertIsInstance(sink, HttpSink)
+        try:
+            url = 'http://127.0.0.1:{}/metrics'.format(sink.port)
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertIn(b'reversi_moves_total 3', response.read())
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(url[:-len('metrics')], timeout=5)
+        finally:
+            sink.close()
+
+    def test_unknown_sink(self):
+        self.assertRaises(ValueError, create_sink, Metrics(), 'udp:1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import sys
+import random
+import time
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import play_move
+from modules.Board import BLACK, WHITE
+from modules.ChipType import ChipType
+from modules.GameModel import GameModel
+from modules.MonteCarloAI import MonteCarloAI, _State
+from modules.Players import create_player
+from modules.RandomAI import RandomAI
+
+
+ROCKS = [(0, 0), (3, 1), (20, 0), (48, 2), (30, 3)]
+
+
+class CheckState(unittest.TestCase):
+    def test_mirrors_game(self):
+        for width, height, rocks in [(8, 8, None), (10, 6, None),
+                                     (49, 4, ROCKS)]:
+            rnd = random.Random(width)
+            game = GameModel(width, height, rocks=rocks)
+            state = _State(game)
+            while game.is_running:
+                self.assertEqual(
+                    {state.get_point(index) for index in state.get_moves()},
+                    game.available_moves)
+                move = rnd.choice(sorted(game.available_moves))
+                is_black = game.cur_player_is_black
+                play_move(game, move)
+                state.play(state.get_index(move), is_black)
+                state.pass_if_needed(not is_black)
+                if game.is_running:
+                    self.assertEqual(state.is_black,
+                                     game.cur_player_is_black)
+                self.assertEqual((state.black_count, state.white_count),
+                                 (game.score[ChipType.Black],
+                                  game.score[ChipType.White]))
+
+    def test_playout_reaches_end(self):
+        rnd = random.Random(0)
+        for width, height in [(8, 8), (5, 7), (49, 2)]:
+            for _ in range(20):
+                state = _State(GameModel(width, height))
+                result = state.playout(rnd, width * height)
+                black = state.cells.count(BLACK)
+                white = state.cells.count(WHITE)
+                self.assertEqual(result, 1.0 if black > white else
+                                 0.0 if black < white else 0.5)
+                self.assertEqual(state.get_moves(True), [])
+                self.assertEqual(state.get_moves(False), [])
+
+
+class CheckMonteCarloAI(unittest.TestCase):
+    def test_legal_moves(self):
+        for width, height, rocks in [(8, 8, None), (49, 4, ROCKS),
+                                     (6, 3, None)]:
+            game = GameModel(width, height, rocks=rocks)
+            ai = MonteCarloAI(time_limit=None, max_playouts=30, seed=1)
+            while game.is_running:
+                move = ai.get_move(game)
+                self.assertIn(move, game.available_moves)
+                play_move(game, move)
+
+    def test_state_is_kept(self):
+        game = GameModel(10, 10)
+        snapshot = game.snapshot()
+        MonteCarloAI(time_limit=None, max_playouts=50).get_move(game)
+        self.assertEqual(game.snapshot(), snapshot)
+
+    def test_playout_budget(self):
+        ai = MonteCarloAI(time_limit=None, max_playouts=123)
+        ai.get_move(GameModel())
+        self.assertEqual(ai.playouts, 123)
+        self.assertGreater(ai.playouts_per_second, 0)
+
+    def test_time_budget(self):
+        ai = MonteCarloAI(time_limit=0.2)
+        start = time.perf_counter()
+        ai.get_move(GameModel())
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertGreater(ai.playouts, 0)
+
+    def test_single_move(self):
+        game = GameModel(3, 2)
+        ai = MonteCarloAI(time_limit=None, max_playouts=100)
+        self.assertEqual(ai.get_move(game), (2, 1))
+        self.assertEqual(ai.playouts, 0)
+
+    def test_tree_reuse(self):
+        game = GameModel()
+        ai = MonteCarloAI(time_limit=None, max_playouts=400, seed=3)
+        play_move(game, ai.get_move(game))
+        self.assertEqual(ai.reused, 0)
+        play_move(game, sorted(game.available_moves)[0])
+        play_move(game, ai.get_move(game))
+        self.assertGreater(ai.reused, 0)
+        ai.get_move(GameModel())
+        self.assertEqual(ai.reused, 0)
+
+    def test_other_move_played(self):
+        game = GameModel()
+        ai = MonteCarloAI(time_limit=None, max_playouts=200, seed=3)
+        move = ai.get_move(game)
+        other = min(game.available_moves - {move})
+        play_move(game, other)
+        reply = ai.get_move(game)
+        self.assertEqual(ai.reused, 0)
+        self.assertIn(reply, game.available_moves)
+        play_move(game, reply)
+        play_move(game, min(game.available_moves - {ai.get_move(game)}))
+        self.assertIn(ai.get_move(game), game.available_moves)
+        self.assertEqual(ai.reused, 0)
+
+    def test_beats_random(self):
+        wins = 0
+        for i in range(4):
+            game = GameModel(6, 6)
+            ai = MonteCarloAI(time_limit=None, max_playouts=200, seed=i)
+            ai_type = ChipType.Black if i % 2 == 0 else ChipType.White
+            enemy = RandomAI(seed=i)
+            while game.is_running:
+                player = ai if game.get_cur_chip_type == ai_type else enemy
+                play_move(game, player.get_move(game))
+            wins += (game.score[ai_type] > game.score[
+                ChipType.White if ai_type == ChipType.Black
+                else ChipType.Black])
+        self.assertGreaterEqual(wins, 3)
+
+    def test_player_spec(self):
+        ai = create_player('mcts:playouts=10,seed=2', time_limit=None)
+        self.assertIsInstance(ai, MonteCarloAI)
+        self.assertEqual(ai.max_playouts, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
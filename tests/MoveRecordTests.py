@@ -0,0 +1,80 @@
+import sys
+import unittest
+import random
+sys.path.append('..')
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+from modules.EndGame import EndGame
+
+
+class CheckMakeMove(unittest.TestCase):
+    def test_record(self):
+        game = GameModel()
+        record = game.make_move_to((3, 2))
+        self.assertEqual(record.point, (3, 2))
+        self.assertEqual(record.chip_type, ChipType.Black)
+        self.assertEqual(record.flips, [(3, 3)])
+        self.assertEqual(record.score_delta, (2, -1))
+
+    def test_record_keeps_previous_moves(self):
+        for width, height in [(8, 8), (10, 10), (7, 5)]:
+            game = GameModel(width, height)
+            rnd = random.Random(width)
+            for _ in range(6):
+                moves = set(game.available_moves)
+                record = game.make_move_to(rnd.choice(sorted(moves)))
+                self.assertIsInstance(record.available_moves, frozenset)
+                self.assertEqual(record.available_moves, moves)
+
+    def test_end_game_record(self):
+        game = GameModel(3, 2)
+        game.make_move_to((2, 1))
+        with self.assertRaises(EndGame) as context:
+            game.make_move_to((2, 0))
+        self.assertFalse(game.is_running)
+        self.assertEqual(context.exception.record.point, (2, 0))
+        game.unmake_move(context.exception.record)
+        self.assertTrue(game.is_running)
+        self.assertEqual(game.available_moves, {(2, 0)})
+
+
+class CheckUnmakeMove(unittest.TestCase):
+    def test_standard_size(self):
+        rnd = random.Random(3)
+        for _ in range(10):
+            self._check_random_game(rnd, 8, 8)
+
+    def test_other_sizes(self):
+        rnd = random.Random(4)
+        for width, height in [(3, 2), (6, 6), (10, 10), (30, 4)]:
+            self._check_random_game(rnd, width, height)
+
+    def _check_random_game(self, rnd, width, height):
+        game = GameModel(width, height)
+        states = []
+        records = []
+        while game.is_running:
+            states.append(self._get_state(game))
+            try:
+                records.append(game.make_move_to(
+                    rnd.choice(sorted(game.available_moves))))
+            except EndGame as e:
+                records.append(e.record)
+        while records:
+            game.unmake_move(records.pop())
+            self.assertEqual(self._get_state(game), states.pop())
+
+    @staticmethod
+    def _get_state(game):
+        return (dict(game.score),
+                game.cur_player_is_black,
+                game.is_running,
+                set(game.available_moves),
+                set(game.border_moves),
+                set(game.board.legal_moves(ChipType.Black)),
+                set(game.board.legal_moves(ChipType.White)),
+                {point: game.board.get(point) for point in game.map})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import random
+import tempfile
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI
+from modules.BookError import BookError
+from modules.GameModel import GameModel
+from modules.OpeningBook import (OpeningBook, get_book_path, grow_book,
+                                 open_book, read_entries, write_book,
+                                 HEADER, RECORD)
+
+
+class CheckBookFile(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'book.bin')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_lookup(self):
+        entries = {key * 7919: (key % 64, key - 500) for key in range(1, 1000)}
+        write_book(self.path, 8, 8, entries)
+        self.assertEqual(os.path.getsize(self.path),
+                         HEADER.size + len(entries) * RECORD.size)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), len(entries))
+            for key, value in entries.items():
+                self.assertEqual(book.lookup(key), value)
+            self.assertIsNone(book.lookup(0))
+            self.assertIsNone(book.lookup(5))
+            self.assertIsNone(book.lookup(10 ** 10))
+
+    def test_score_is_clipped(self):
+        write_book(self.path, 8, 8, {1: (2, 10 ** 6), 2: (3, -10 ** 6)})
+        self.assertEqual(read_entries(self.path),
+                         {1: (2, 2 ** 15 - 1), 2: (3, -2 ** 15 + 1)})
+
+    def test_broken_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a book at all')
+        with self.assertRaises(BookError):
+            OpeningBook(self.path)
+
+    def test_book_per_size(self):
+        self.assertIsNone(open_book(self.dir.name, 8, 8))
+        write_book(get_book_path(self.dir.name, 6, 6), 6, 6, {})
+        book = open_book(self.dir.name, 6, 6)
+        self.assertEqual((book.width, book.height), (6, 6))
+        self.assertIsNone(book.get_move(GameModel(8, 8)))
+        book.close()
+
+
+class CheckBuilder(unittest.TestCase):
+    def test_grow_and_use(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = get_book_path(directory, 6, 6)
+            ai = AlphaBetaAI(time_limit=None, max_nodes=200)
+            first = grow_book(path, 6, 6, ai, 2, 3, random.Random(1))
+            second = grow_book(path, 6, 6, ai, 4, 4, random.Random(2))
+            self.assertGreater(first, 0)
+            self.assertGreaterEqual(second, first)
+            game = GameModel(6, 6)
+            with OpeningBook(path) as book:
+                move = book.get_move(game)
+                self.assertTrue(move in game.available_moves)
+                self.assertEqual(AlphaBetaAI(max_nodes=1, book=book)
+                                 .get_move(game), move)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+import unittest
+import random
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI, play_move
+from modules.ParallelAlphaBetaAI import ParallelAlphaBetaAI
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+from modules.EndGame import EndGame
+
+
+class CheckSnapshot(unittest.TestCase):
+    def test_round_trip(self):
+        rnd = random.Random(8)
+        for width, height in [(8, 8), (3, 2), (7, 5), (20, 20)]:
+            game = GameModel(width, height)
+            for _ in range(10):
+                self._check_same(game,
+                                 GameModel.from_snapshot(game.snapshot()))
+                try:
+                    game.make_move_to(rnd.choice(sorted(game.available_moves)))
+                except EndGame:
+                    break
+            self._check_same(game, GameModel.from_snapshot(game.snapshot()))
+
+    def test_size(self):
+        self.assertLessEqual(len(GameModel().snapshot()), 32)
+        self.assertLessEqual(len(GameModel(100, 100).snapshot()), 2600)
+
+    def test_rocks(self):
+        game = GameModel(6, 6)
+        game._put((0, 0), ChipType.Rock)
+        copy = GameModel.from_snapshot(game.snapshot())
+        self.assertEqual(copy.board.get((0, 0)), ChipType.Rock)
+        self.assertEqual(copy.score, game.score)
+
+    def _check_same(self, first, second):
+        self.assertEqual(first.hash, second.hash)
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.is_running, second.is_running)
+        self.assertEqual(first.cur_player_is_black, second.cur_player_is_black)
+        self.assertEqual(set(first.available_moves),
+                         set(second.available_moves))
+        self.assertEqual(set(first.border_moves), set(second.border_moves))
+
+
+class CheckParallelSearch(unittest.TestCase):
+    def test_same_score_as_serial(self):
+        game = GameModel(6, 6)
+        game.make_move_to((2, 1))
+        serial = AlphaBetaAI(time_limit=None, max_depth=3)
+        serial.get_move(game)
+        with ParallelAlphaBetaAI(time_limit=None, max_depth=3,
+                                 workers=2) as ai:
+            move = ai.get_move(game)
+            self.assertTrue(move in game.available_moves)
+            self.assertEqual(ai.depth, 3)
+            self.assertEqual(ai.score, serial.score)
+
+    def test_deterministic(self):
+        game = GameModel()
+        with ParallelAlphaBetaAI(time_limit=None, max_nodes=4000,
+                                 workers=3) as ai:
+            first = ai.get_move(game), ai.depth, ai.score
+            second = ai.get_move(game), ai.depth, ai.score
+        with ParallelAlphaBetaAI(time_limit=None, max_nodes=4000,
+                                 workers=2) as ai:
+            third = ai.get_move(game), ai.depth, ai.score
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+
+    def test_deterministic_mid_game(self):
+        game = GameModel(10, 10)
+        rnd = random.Random(4)
+        for _ in range(14):
+            play_move(game, rnd.choice(sorted(game.available_moves)))
+        results = set()
+        for workers in (1, 2, 2, 3, 4):
+            with ParallelAlphaBetaAI(time_limit=None, max_nodes=5000,
+                                     workers=workers) as ai:
+                results.add((ai.get_move(game), ai.depth, ai.score))
+        self.assertEqual(len(results), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
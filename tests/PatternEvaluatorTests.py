@@ -0,0 +1,159 @@
+import os
+import sys
+import random
+import tempfile
+import unittest
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI, play_move
+from modules.GameModel import GameModel
+from modules.GameRecord import GameRecorder
+from modules.PatternError import PatternError
+from modules.PatternEvaluator import (KINDS, PatternEvaluator, PatternIndex,
+                                      get_patterns, get_samples,
+                                      load_evaluator, train)
+from modules.Players import create_player
+
+
+ROCKS = [(0, 0), (3, 1), (9, 0), (5, 4)]
+
+
+def play_random_game(width, height, rnd, rocks=None):
+    game = GameModel(width, height, rocks=rocks)
+    recorder = GameRecorder(game)
+    while game.is_running:
+        recorder.add(play_move(game, rnd.choice(sorted(
+            game.available_moves))))
+    return recorder.get_record(game)
+
+
+class CheckPatterns(unittest.TestCase):
+    def test_cells_are_on_board(self):
+        for width, height in [(8, 8), (10, 6), (3, 2), (100, 9)]:
+            patterns = get_patterns(width, height)
+            self.assertEqual(len(patterns), 4 * len(KINDS))
+            for kind, cells in patterns:
+                self.assertEqual(len(cells),
+                                 len(patterns[kind][1]))
+                self.assertEqual(len(set(cells)), len(cells))
+                for x, y in cells:
+                    self.assertTrue(0 <= x < width and 0 <= y < height)
+
+    def test_incremental_indices(self):
+        for width, height, rocks in [(8, 8, None), (10, 6, ROCKS),
+                                     (5, 3, None)]:
+            rnd = random.Random(width)
+            patterns = get_patterns(width, height)
+            game = GameModel(width, height, rocks=rocks)
+            game.patterns = PatternIndex(game, patterns)
+            records = []
+            while game.is_running:
+                records.append(play_move(game, rnd.choice(sorted(
+                    game.available_moves))))
+                self.assertEqual(game.patterns.indices,
+                                 PatternIndex(game, patterns).indices)
+            for record in reversed(records):
+                game.unmake_move(record)
+                self.assertEqual(game.patterns.indices,
+                                 PatternIndex(game, patterns).indices)
+            self.assertEqual(game.patterns.indices,
+                             PatternIndex(GameModel(width, height,
+                                                    rocks=rocks),
+                                          patterns).indices)
+
+
+class CheckPatternEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'patterns.bin')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_symmetric_start(self):
+        evaluator = PatternEvaluator(8, 8)
+        rnd = random.Random(0)
+        for table in evaluator.tables:
+            for i in range(len(table)):
+                table[i] = rnd.randint(-1000, 1000)
+        game = GameModel()
+        evaluator.attach(game)
+        score = evaluator.evaluate(game)
+        game.cur_player_is_black = False
+        self.assertEqual(evaluator.evaluate(game), -score)
+
+    def test_save_and_load(self):
+        evaluator = PatternEvaluator(10, 6)
+        evaluator.tables[0][5] = 123
+        evaluator.tables[3][-1] = -7
+        evaluator.save(self.path)
+        loaded = load_evaluator(self.path)
+        self.assertEqual((loaded.width, loaded.height), (10, 6))
+        self.assertEqual(loaded.tables, evaluator.tables)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_corrupted_file(self):
+        PatternEvaluator(8, 8).save(self.path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        for corrupted in (b'', data[:10], data[:-1], data + b'\0',
+                          b'XXXX' + data[4:]):
+            with open(self.path, 'wb') as f:
+                f.write(corrupted)
+            with self.assertRaises(PatternError):
+                load_evaluator(self.path)
+
+    def test_training_reduces_error(self):
+        rnd = random.Random(1)
+        records = [play_random_game(6, 6, rnd) for _ in range(30)]
+        evaluator = PatternEvaluator(6, 6)
+        samples = list(get_samples(records, evaluator, skip=4))
+        self.assertEqual(len(samples), sum(max(0, len(record.moves) - 4)
+                                           for record in records))
+        first = train(evaluator, samples, epochs=1)
+        last = train(evaluator, samples, epochs=5)
+        self.assertLess(last, first)
+        self.assertTrue(any(any(table) for table in evaluator.tables))
+
+    def test_samples_of_other_size_are_skipped(self):
+        records = [play_random_game(6, 4, random.Random(2))]
+        self.assertEqual(list(get_samples(records, PatternEvaluator(6, 6))),
+                         [])
+
+
+class CheckAlphaBetaWithPatterns(unittest.TestCase):
+    def setUp(self):
+        self.evaluator = PatternEvaluator(8, 8)
+        rnd = random.Random(3)
+        for table in self.evaluator.tables:
+            for i in range(len(table)):
+                table[i] = rnd.randint(-500, 500)
+
+    def test_legal_moves_and_state_kept(self):
+        game = GameModel()
+        ai = AlphaBetaAI(time_limit=None, max_nodes=300,
+                         evaluator=self.evaluator)
+        while game.is_running:
+            snapshot = game.snapshot()
+            move = ai.get_move(game)
+            self.assertEqual(game.snapshot(), snapshot)
+            self.assertIsNone(game.patterns)
+            self.assertIn(move, game.available_moves)
+            play_move(game, move)
+
+    def test_other_size_uses_default_evaluation(self):
+        game = GameModel(6, 6)
+        move = AlphaBetaAI(time_limit=None, max_depth=3,
+                           evaluator=self.evaluator).get_move(game)
+        self.assertEqual(move, AlphaBetaAI(time_limit=None,
+                                           max_depth=3).get_move(game))
+
+    def test_player_spec(self):
+        with tempfile.TemporaryDirectory() as dir_name:
+            path = os.path.join(dir_name, 'patterns.bin')
+            self.evaluator.save(path)
+            ai = create_player('alphabeta:weights=' + path, time_limit=None)
+        self.assertEqual(ai.evaluator.tables, self.evaluator.tables)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import unittest
+sys.path.append('..')
+from modules import Protocol
+from modules.AlphaBetaAI import play_move
+from modules.ChipType import ChipType
+from modules.GameModel import GameModel
+from modules.ProtocolError import ProtocolError
+
+
+def decode_frame(data):
+    length, = Protocol.LENGTH.unpack_from(data)
+    payload = data[Protocol.LENGTH.size:]
+    assert len(payload) == length
+    return Protocol.decode(payload)
+
+
+class CheckProtocol(unittest.TestCase):
+    def test_join(self):
+        self.assertEqual(decode_frame(Protocol.encode_join()),
+                         (Protocol.JOIN, None))
+        self.assertEqual(decode_frame(Protocol.encode_join((10, 8, 3))),
+                         (Protocol.JOIN, (10, 8, 3)))
+
+    def test_text_and_error(self):
+        self.assertEqual(decode_frame(Protocol.encode_text('Привет')),
+                         (Protocol.TEXT, 'Привет'))
+        self.assertEqual(decode_frame(Protocol.encode_error('Ошибка')),
+                         (Protocol.ERROR, 'Ошибка'))
+
+    def test_watch(self):
+        self.assertEqual(decode_frame(Protocol.encode_watch()),
+                         (Protocol.WATCH, None))
+        self.assertEqual(decode_frame(Protocol.encode_watch(12)),
+                         (Protocol.WATCH, 12))
+
+    def test_resume(self):
+        self.assertEqual(decode_frame(Protocol.encode_resume(5, 2**63 + 1)),
+                         (Protocol.RESUME, (5, 2**63 + 1)))
+
+    def test_move(self):
+        self.assertEqual(decode_frame(Protocol.encode_move((70000, 3))),
+                         (Protocol.MOVE, (70000, 3)))
+        self.assertEqual(decode_frame(Protocol.encode_move_request()),
+                         (Protocol.MOVE_REQUEST, None))
+
+    def test_start(self):
+        game = GameModel(10, 6)
+        message = decode_frame(Protocol.encode_start(ChipType.White, 7, game,
+                                                     2**64 - 1))
+        chip_type, game_id, token, snapshot = message.value
+        self.assertEqual((chip_type, game_id, token),
+                         (ChipType.White, 7, 2**64 - 1))
+        message = decode_frame(Protocol.encode_start(None, 8, game))
+        self.assertEqual(message.value[:3], (None, 8, 0))
+        self.assertEqual(GameModel.from_snapshot(snapshot).snapshot(),
+                         game.snapshot())
+
+    def test_delta(self):
+        server_game = GameModel(12, 12)
+        client_game = GameModel(12, 12)
+        while server_game.is_running:
+            record = play_move(server_game, min(server_game.available_moves))
+            data = Protocol.encode_delta(record, server_game)
+            self.assertEqual(len(data), Protocol.LENGTH.size +
+                             Protocol.TYPE.size + Protocol.DELTA_HEADER.size +
+                             Protocol.POINT.size * len(record.flips))
+            Protocol.apply_delta(client_game, decode_frame(data).value)
+            self.assertEqual(client_game.snapshot(), server_game.snapshot())
+
+    def test_delta_desync(self):
+        server_game = GameModel()
+        record = server_game.make_move_to((2, 3))
+        delta = decode_frame(Protocol.encode_delta(record, server_game)).value
+        client_game = GameModel()
+        client_game.make_move_to((3, 2))
+        with self.assertRaises(ProtocolError):
+            Protocol.apply_delta(client_game, delta)
+
+    def test_game_over(self):
+        game = GameModel()
+        message = decode_frame(Protocol.encode_game_over(
+            game, Protocol.DISCONNECTED))
+        self.assertEqual(message.value, (2, 2, Protocol.DISCONNECTED))
+
+    def test_broken(self):
+        with self.assertRaises(ProtocolError):
+            Protocol.decode(b'\x63')
+        with self.assertRaises(ProtocolError):
+            Protocol.decode(bytes([Protocol.MOVE, 1, 2]))
+        with self.assertRaises(ProtocolError):
+            Protocol.decode(bytes([Protocol.STATE_DELTA]) + bytes(25))
+
+
+if __name__ == '__main__':
+    unittest.main()
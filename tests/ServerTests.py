@@ -0,0 +1,301 @@
+import os
+import sys
+import socket
+import tempfile
+import unittest
+from threading import Thread
+sys.path.append('..')
+from modules.Server import Server
+from modules import Protocol
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+from modules.Lobby import Lobby
+from modules.LobbyError import LobbyError
+from modules.Metrics import Metrics
+from modules.GameRecord import read_records, replay
+
+
+class Client:
+    def __init__(self, server, params=None, request=None):
+        self.socket = socket.create_connection((server.host, server.port), 5)
+        self.socket.sendall(request or Protocol.encode_join(params))
+        self.game = None
+
+    def receive(self):
+        message = Protocol.receive_message(self.socket)
+        if message is None:
+            raise ConnectionError()
+        if message.type == Protocol.START:
+            self.game = GameModel.from_snapshot(message.value.snapshot)
+        elif message.type == Protocol.STATE_DELTA:
+            Protocol.apply_delta(self.game, message.value)
+        return message
+
+    def receive_until(self, message_type):
+        messages = [self.receive()]
+        while messages[-1].type != message_type:
+            messages.append(self.receive())
+        return messages
+
+    def close(self):
+        self.socket.close()
+
+
+class FakeConnection:
+    def __init__(self):
+        self.is_closed = False
+
+
+class CheckLobby(unittest.TestCase):
+    def test_limits(self):
+        lobby = Lobby(max_side=100, max_area=1000)
+        for params in [(101, 4, 0), (40, 40, 0), (10, 10, 51)]:
+            with self.assertRaises(LobbyError):
+                lobby.join(FakeConnection(), params)
+        self.assertIsNone(lobby.join(FakeConnection(), (100, 10, 50)))
+        self.assertEqual(list(lobby.waiting), [(100, 10, 50)])
+
+    def test_empty_and_stale_queues_removed(self):
+        lobby = Lobby()
+        first = FakeConnection()
+        lobby.join(first, (6, 6, 0))
+        self.assertIsNotNone(lobby.join(FakeConnection(), (6, 6, 0)))
+        self.assertEqual(lobby.waiting, {})
+        stale = [FakeConnection() for _ in range(3)]
+        for i, conn in enumerate(stale):
+            lobby.join(conn, (4, 4 + i, 0))
+            conn.is_closed = True
+        lobby.join(FakeConnection(), (10, 10, 0))
+        self.assertEqual(list(lobby.waiting), [(10, 10, 0)])
+
+
+class CheckServer(unittest.TestCase):
+    def setUp(self):
+        self.server = Server(0, '127.0.0.1')
+        self.thread = Thread(target=self.server.start)
+        self.thread.start()
+        self.server.ready.wait()
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.server.stop()
+        self.thread.join()
+
+    def _connect(self, params=None):
+        client = Client(self.server, params)
+        self.clients.append(client)
+        return client
+
+    def test_pairing_by_params(self):
+        first = self._connect((6, 6, 0))
+        other = self._connect((8, 8, 0))
+        second = self._connect((6, 6, 0))
+        self.assertIn('дождитесь', first.receive().value)
+        self.assertIn('дождитесь', other.receive().value)
+        self.assertIn('уже подключился', second.receive().value)
+        self.assertEqual(first.receive().value[0], ChipType.Black)
+        self.assertEqual(second.receive().value[0], ChipType.White)
+        self.assertEqual((first.game.width, first.game.height), (6, 6))
+        self.assertEqual(first.receive().type, Protocol.MOVE_REQUEST)
+
+    def test_any_joins_waiting_game(self):
+        first = self._connect((4, 5, 0))
+        second = self._connect()
+        first.receive_until(Protocol.MOVE_REQUEST)
+        messages = second.receive_until(Protocol.START)
+        self.assertEqual(len(messages), 2)
+        self.assertEqual((second.game.width, second.game.height), (4, 5))
+
+    def test_wrong_join(self):
+        client = self._connect()
+        client.socket.sendall(Protocol.encode_move((0, 0)))
+        self.assertIn('дождитесь', client.receive().value)
+        wrong = socket.create_connection((self.server.host,
+                                          self.server.port), 5)
+        wrong.sendall(Protocol.encode_move((0, 0)))
+        self.assertEqual(Protocol.receive_message(wrong),
+                         (Protocol.ERROR,
+                          'Неверный запрос на подключение к игре'))
+        self.assertIsNone(Protocol.receive_message(wrong))
+        wrong.close()
+
+    def test_too_large_join(self):
+        for params in [(100000, 100000, 0), (2000, 4, 0), (10, 10, 60)]:
+            client = self._connect(params)
+            message = client.receive()
+            self.assertEqual(message.type, Protocol.ERROR)
+            self.assertIsNone(Protocol.receive_message(client.socket))
+        first = self._connect((6, 6, 0))
+        self.assertIn('дождитесь', first.receive().value)
+
+    def test_wrong_move(self):
+        black = self._connect((8, 8, 0))
+        self._connect((8, 8, 0))
+        black.receive_until(Protocol.MOVE_REQUEST)
+        black.socket.sendall(Protocol.encode_move((0, 0)))
+        self.assertEqual(black.receive(), (Protocol.ERROR,
+                                           'Неверная позиция для хода'))
+        self.assertEqual(black.receive().type, Protocol.MOVE_REQUEST)
+        black.socket.sendall(Protocol.encode_move((100, 0)))
+        self.assertEqual(black.receive().type, Protocol.ERROR)
+
+    def test_disconnect(self):
+        black = self._connect()
+        white = self._connect()
+        black.receive_until(Protocol.MOVE_REQUEST)
+        white.close()
+        message = black.receive_until(Protocol.GAME_OVER)[-1]
+        self.assertEqual(message.value.reason, Protocol.DISCONNECTED)
+
+    def test_concurrent_games(self):
+        games = [(self._connect((4, 4, 0)), self._connect((4, 4, 0)))
+                 for _ in range(5)]
+        for black, white in games[1:]:
+            self._play(black, white)
+        stalled_black, _ = games[0]
+        self.assertEqual(
+            stalled_black.receive_until(Protocol.MOVE_REQUEST)[-1].type,
+            Protocol.MOVE_REQUEST)
+
+    def test_spectators(self):
+        black = self._connect((6, 6, 0))
+        white = self._connect((6, 6, 0))
+        game_id = black.receive_until(Protocol.START)[-1].value[1]
+        spectators = [Client(self.server, request=Protocol.encode_watch(
+            game_id if i % 2 else None)) for i in range(10)]
+        self.clients.extend(spectators)
+        for spectator in spectators:
+            message = spectator.receive()
+            self.assertEqual(message.type, Protocol.START)
+            self.assertEqual(message.value[:2], (None, game_id))
+        self._play(black, white)
+        for spectator in spectators:
+            messages = spectator.receive_until(Protocol.GAME_OVER)
+            self.assertEqual(messages[-1].value.reason, Protocol.FINISHED)
+            self.assertEqual(spectator.game.snapshot(), black.game.snapshot())
+
+    def test_watch_unknown_game(self):
+        spectator = Client(self.server, request=Protocol.encode_watch(42))
+        self.clients.append(spectator)
+        self.assertEqual(spectator.receive(),
+                         (Protocol.ERROR, 'Игра не найдена'))
+        self.assertRaises(ConnectionError, spectator.receive)
+
+    def test_resume_after_restart(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            self._restart(store_dir)
+            black = self._connect((6, 6, 0))
+            white = self._connect((6, 6, 0))
+            starts = [client.receive_until(Protocol.START)[-1].value
+                      for client in (black, white)]
+            for _ in range(4):
+                self._make_move(black, white)
+            expected = black.game.snapshot()
+            self._restart(store_dir)
+            self.assertRaises(ConnectionError, black.receive_until,
+                              Protocol.GAME_OVER)
+            resumed = [Client(self.server, request=Protocol.encode_resume(
+                start.game_id, start.token)) for start in starts]
+            self.clients.extend(resumed)
+            for client, start in zip(resumed, starts):
+                message = client.receive_until(Protocol.START)[-1]
+                self.assertEqual(message.value[:3], start[:3])
+                self.assertEqual(client.game.snapshot(), expected)
+            self._play(*resumed)
+
+    def test_resume_with_wrong_token(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            self._restart(store_dir)
+            black = self._connect()
+            self._connect()
+            start = black.receive_until(Protocol.START)[-1].value
+            self._restart(store_dir)
+            client = Client(self.server, request=Protocol.encode_resume(
+                start.game_id, start.token + 1))
+            self.clients.append(client)
+            self.assertEqual(client.receive(),
+                             (Protocol.ERROR, 'Игра не найдена'))
+            self.assertRaises(ConnectionError, client.receive)
+
+    def test_metrics(self):
+        self.server.stop()
+        self.thread.join()
+        metrics = Metrics()
+        self.server = Server(0, '127.0.0.1', metrics=metrics)
+        self.thread = Thread(target=self.server.start)
+        self.thread.start()
+        self.server.ready.wait()
+        black = self._connect((4, 4, 0))
+        white = self._connect((4, 4, 0))
+        self._play(black, white)
+        moves_count = sum(stat.count for _, stat in
+                          metrics.get_slowest('server_turn_seconds'))
+        self.assertGreater(moves_count, 0)
+        game_id = metrics.get_slowest('server_turn_seconds')[0][0]
+        self.assertEqual(game_id, (('game', 1),))
+        waits = metrics.get_slowest('server_client_wait_seconds')
+        self.assertEqual(len(waits), 2)
+        self.assertEqual(sum(stat.count for _, stat in waits), moves_count)
+        self.assertEqual(metrics.get_counter('server_games_total'), 1)
+        self.assertGreater(metrics.get_counter('server_bytes_sent_total'), 0)
+
+    def test_records(self):
+        self.server.stop()
+        self.thread.join()
+        with tempfile.TemporaryDirectory() as dir_name:
+            path = os.path.join(dir_name, 'games.bin')
+            self.server = Server(0, '127.0.0.1', records_path=path)
+            self.thread = Thread(target=self.server.start)
+            self.thread.start()
+            self.server.ready.wait()
+            black = self._connect((4, 4, 0))
+            white = self._connect((4, 4, 0))
+            self._play(black, white)
+            records = list(read_records(path))
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual((record.width, record.height), (4, 4))
+        self.assertEqual((record.black_score, record.white_score),
+                         (black.game.score[ChipType.Black],
+                          black.game.score[ChipType.White]))
+        self.assertEqual(len(list(replay(record))), len(record.moves))
+
+    def _restart(self, store_dir):
+        self.server.stop()
+        self.thread.join()
+        self.server = Server(0, '127.0.0.1', store_dir, store_window=0.01)
+        self.thread = Thread(target=self.server.start)
+        self.thread.start()
+        self.server.ready.wait()
+
+    def _make_move(self, black, white):
+        clients = {ChipType.Black: black, ChipType.White: white}
+        cur = clients[black.game.get_cur_chip_type]
+        cur.receive_until(Protocol.MOVE_REQUEST)
+        cur.socket.sendall(Protocol.encode_move(min(cur.game.available_moves)))
+        for client in clients.values():
+            client.receive_until(Protocol.STATE_DELTA)
+
+    def _play(self, black, white):
+        clients = {ChipType.Black: black, ChipType.White: white}
+        for client in clients.values():
+            if client.game is None:
+                client.receive_until(Protocol.START)
+        game = black.game
+        while game.is_running:
+            cur = clients[game.get_cur_chip_type]
+            cur.receive_until(Protocol.MOVE_REQUEST)
+            cur.socket.sendall(Protocol.encode_move(min(game.available_moves)))
+            cur.receive_until(Protocol.STATE_DELTA)
+            game = cur.game
+        for client in clients.values():
+            result = client.receive_until(Protocol.GAME_OVER)[-1].value
+            self.assertEqual(result.reason, Protocol.FINISHED)
+            self.assertEqual(result.black_score, game.score[ChipType.Black])
+            self.assertEqual(client.game.snapshot(), game.snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import unittest
+sys.path.append('..')
+from modules.Players import create_player, parse_player
+from modules.AlphaBetaAI import AlphaBetaAI
+from modules.Tournament import (create_tasks, play_game, run_tournament,
+                                GameResult, TournamentSummary)
+
+
+class CheckPlayers(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_player('random'), ('random', {}))
+        self.assertEqual(parse_player('alphabeta:nodes=100,time=0.5'),
+                         ('alphabeta', {'max_nodes': 100, 'time_limit': 0.5}))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            parse_player('unknown')
+        with self.assertRaises(ValueError):
+            parse_player('random:speed=1')
+
+    def test_create(self):
+        player = create_player('alphabeta:depth=3', time_limit=None)
+        self.assertIsInstance(player, AlphaBetaAI)
+        self.assertEqual(player.max_depth, 3)
+        self.assertIsNone(player.time_limit)
+
+
+class CheckTournament(unittest.TestCase):
+    def test_tasks(self):
+        tasks = create_tasks(['random', 'alphabeta', 'random:seed=1'],
+                             [(8, 8), (6, 4)], [0], 4)
+        self.assertEqual(len(tasks), 3 * 2 * 4)
+        self.assertEqual(sum(task.black == 'random' for task in tasks[:4]), 2)
+        self.assertEqual([task.index for task in tasks], list(range(24)))
+
+    def test_reproducible_game(self):
+        task = create_tasks(['random'], [(6, 6)], [0], 1, seed=3)[0]
+        first = play_game(task)
+        second = play_game(task)
+        self.assertEqual(first[1:4], second[1:4])
+
+    def test_run(self):
+        tasks = create_tasks(['random', 'alphabeta:nodes=50'],
+                             [(4, 4), (6, 3)], [0], 2)
+        results = []
+        summary = run_tournament(
+            tasks, 2, lambda result, _: results.append(result))
+        self.assertEqual(len(results), len(tasks))
+        self.assertEqual(summary.games_count, len(tasks))
+        self.assertEqual(
+            sorted(result.task.index for result in results),
+            list(range(len(tasks))))
+        stats = summary.to_dict()
+        self.assertEqual(stats['players']['random']['games'], len(tasks))
+        self.assertGreater(stats['games_per_second'], 0)
+
+    def test_summary(self):
+        tasks = create_tasks(['a', 'b'], [(8, 8)], [0], 2)
+        summary = TournamentSummary()
+        summary.add(self._get_result(tasks[0], 40, 24, 60))
+        summary.add(self._get_result(tasks[1], 32, 32, 58))
+        self.assertEqual(summary.average_length, 59)
+        self.assertEqual(summary.players['a']['wins'], 1)
+        self.assertEqual(summary.players['b']['draws'], 1)
+        self.assertEqual(summary.get_win_rate('a'), 0.75)
+
+    @staticmethod
+    def _get_result(task, black_score, white_score, moves_count):
+        return GameResult(task, black_score, white_score, moves_count, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import sys
+import unittest
+import random
+sys.path.append('..')
+from modules.AlphaBetaAI import AlphaBetaAI
+from modules.GameModel import GameModel
+from modules.ChipType import ChipType
+from modules.EndGame import EndGame
+from modules.TranspositionTable import TranspositionTable, EXACT, LOWER
+from modules import Zobrist
+
+
+class CheckHash(unittest.TestCase):
+    def test_incremental_hash(self):
+        rnd = random.Random(11)
+        for width, height in [(8, 8), (6, 6), (10, 4), (30, 30)]:
+            game = GameModel(width, height)
+            records = []
+            hashes = []
+            while game.is_running:
+                self.assertEqual(game.hash, Zobrist.compute_hash(game))
+                hashes.append(game.hash)
+                move = rnd.choice(sorted(game.available_moves))
+                try:
+                    records.append(game.make_move_to(move))
+                except EndGame as e:
+                    records.append(e.record)
+            self.assertEqual(game.hash, Zobrist.compute_hash(game))
+            while records:
+                game.unmake_move(records.pop())
+                self.assertEqual(game.hash, hashes.pop())
+
+    def test_transposition(self):
+        first = GameModel()
+        second = GameModel()
+        for move in [(3, 2), (2, 2), (2, 3), (4, 2)]:
+            first.make_move_to(move)
+        for move in [(2, 3), (2, 2), (3, 2), (4, 2)]:
+            second.make_move_to(move)
+        self.assertEqual(
+            {point: first.board.get(point) for point in first.map},
+            {point: second.board.get(point) for point in second.map})
+        self.assertEqual(first.hash, second.hash)
+
+    def test_side_to_move(self):
+        game = GameModel()
+        hash_before = game.hash
+        game.cur_player_is_black = False
+        self.assertNotEqual(game.hash, hash_before)
+
+    def test_geometry(self):
+        self.assertNotEqual(GameModel(6, 8).hash, GameModel(8, 6).hash)
+
+    def test_rocks(self):
+        game = GameModel(6, 6)
+        hash_before = game.hash
+        game._put((0, 0), ChipType.Rock)
+        self.assertNotEqual(game.hash, hash_before)
+        self.assertEqual(game.hash, Zobrist.compute_hash(game))
+
+
+class CheckTranspositionTable(unittest.TestCase):
+    def test_memory_cap(self):
+        table = TranspositionTable(max_bytes=48000)
+        self.assertLessEqual(table.memory, 48000)
+        for key in range(1, 10000):
+            table.store(key, 1, EXACT, key)
+        self.assertLessEqual(table.memory, 48000)
+        self.assertEqual(len(table.keys), table.size)
+
+    def test_store_and_probe(self):
+        table = TranspositionTable(max_bytes=4800)
+        table.store(12345, 3, LOWER, -70, 17)
+        self.assertEqual(table.probe(12345), (3, LOWER, -70, 17))
+        self.assertIsNone(table.probe(54321))
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 1)
+        self.assertEqual(table.hit_rate, 0.5)
+
+    def test_zero_key(self):
+        table = TranspositionTable(max_bytes=4800)
+        self.assertIsNone(table.probe(0))
+        table.store(0, 4, EXACT, 9, 2)
+        self.assertEqual(table.probe(0), (4, EXACT, 9, 2))
+        self.assertEqual(table.replacements, 0)
+
+    def test_deep_entry(self):
+        table = TranspositionTable(max_bytes=4800)
+        table.store(7, 300, LOWER, -5, 3)
+        self.assertEqual(table.probe(7), (255, LOWER, -5, 3))
+
+    def test_depth_preferred_replacement(self):
+        table = TranspositionTable(max_bytes=48)
+        table.store(1, 10, EXACT, 1)
+        table.store(2, 2, EXACT, 2)
+        table.store(3, 1, EXACT, 3)
+        self.assertEqual(table.probe(1)[0], 10)
+        self.assertIsNone(table.probe(2))
+        self.assertEqual(table.probe(3)[2], 3)
+        table.new_search()
+        table.store(4, 1, EXACT, 4)
+        self.assertIsNone(table.probe(1))
+        self.assertEqual(table.replacements, 2)
+
+    def test_search_uses_table(self):
+        table = TranspositionTable()
+        game = GameModel()
+        AlphaBetaAI(time_limit=None, max_depth=4, table=table).get_move(game)
+        self.assertGreater(table.hits, 0)
+        self.assertGreater(table.stores, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
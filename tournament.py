@@ -0,0 +1,74 @@
+import argparse
+import json
+
+from modules.GameRecord import GameRecordWriter
+from modules.Players import parse_player
+from modules.Tournament import create_tasks, run_tournament
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    set_parser(parser)
+    args = parser.parse_args()
+    for player in args.players:
+        parse_player(player)
+    tasks = create_tasks(args.players, [parse_size(size)
+                                        for size in args.sizes],
+                         args.rocks, args.games, args.seed)
+    writer = GameRecordWriter(args.records) if args.records else None
+    try:
+        summary = run_tournament(tasks, args.workers, lambda result, summary:
+                                 on_result(result, summary, args, writer))
+    finally:
+        if writer is not None:
+            writer.close()
+    if args.json:
+        print(json.dumps(summary.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(summary.report())
+
+
+def on_result(result, summary, args, writer):
+    if writer is not None:
+        writer.write(result.record)
+    if args.verbose:
+        print_result(result, summary)
+
+
+def print_result(result, summary):
+    task = result.task
+    print('#{} {}x{} r{} {} - {}: {}:{} ({} ходов, {:.2f} с)'.format(
+        task.index, task.width, task.height, task.rocks_count, task.black,
+        task.white, result.black_score, result.white_score,
+        result.moves_count, result.duration), flush=True)
+
+
+def set_parser(parser):
+    parser.add_argument('players', nargs='+',
+                        help='players, e.g. random or alphabeta:nodes=2000')
+    parser.add_argument('-g', '--games', type=int, default=10,
+                        help='games for each pair of players, size '
+                             'and rocks count')
+    parser.add_argument('-s', '--sizes', nargs='+', default=['8x8'],
+                        help='sizes of the games')
+    parser.add_argument('-r', '--rocks', type=int, nargs='+', default=[0],
+                        help='rocks counts of the games')
+    parser.add_argument('-j', '--workers', type=int,
+                        help='worker processes')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the tournament')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='print every finished game')
+    parser.add_argument('--json', action='store_true',
+                        help='print the summary as JSON')
+    parser.add_argument('--records', type=str,
+                        help='append records of the played games to a file')
+
+
+def parse_size(size):
+    width, height = size.split('x')
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    main()
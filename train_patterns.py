@@ -0,0 +1,54 @@
+import argparse
+
+from modules.GameAnalysis import iter_records
+from modules.PatternEvaluator import (PatternEvaluator, get_samples,
+                                      load_evaluator, train)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    set_parser(parser)
+    args = parser.parse_args()
+    width, height = parse_size(args.size)
+    if args.resume:
+        evaluator = load_evaluator(args.output)
+        if (evaluator.width, evaluator.height) != (width, height):
+            raise ValueError('Размер доски в файле весов не совпадает')
+    else:
+        evaluator = PatternEvaluator(width, height)
+    samples = list(get_samples(iter_records(args.records), evaluator,
+                               args.skip))
+    if not samples:
+        print('Нет партий размера {}x{}'.format(width, height))
+        return
+    error = train(evaluator, samples, args.epochs, args.rate)
+    evaluator.save(args.output)
+    print('{}: {} позиций, среднеквадратичная ошибка {:.2f}'.format(
+        args.output, len(samples), error))
+
+
+def set_parser(parser):
+    parser.add_argument('records', nargs='+',
+                        help='files with records of games')
+    parser.add_argument('-s', '--size', type=str, default='8x8',
+                        help='train on the games of this size')
+    parser.add_argument('-o', '--output', type=str, default='patterns.bin',
+                        help='file to save the weights to')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue training the weights from the output '
+                             'file')
+    parser.add_argument('-e', '--epochs', type=int, default=10,
+                        help='passes over the positions')
+    parser.add_argument('--rate', type=float, default=0.01,
+                        help='learning rate')
+    parser.add_argument('--skip', type=int, default=0,
+                        help='skip this many opening moves of every game')
+
+
+def parse_size(size):
+    width, height = size.split('x')
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    main()